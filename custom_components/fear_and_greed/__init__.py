@@ -2,81 +2,259 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+import time
 from datetime import timedelta
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.util import dt as dt_util
 
-from .api import FearAndGreedApiClient, FearAndGreedApiClientError
 from .const import (
-    API_ENDPOINT,
+    ATTR_END,
+    ATTR_FIRE_EVENTS,
+    ATTR_FORCE,
+    ATTR_HYSTERESIS,
+    ATTR_RESOLUTION,
+    ATTR_START,
+    ATTR_THRESHOLDS,
+    CONF_HORIZONS,
+    CONF_HYSTERESIS,
+    CONF_MAX_STALE_AGE,
+    CONF_PROVIDERS,
+    CONF_REPLAY_FILE,
+    CONF_REPLAY_SPEED,
+    CONF_SPARKLINE_POINTS,
+    CONF_THRESHOLDS,
     CONF_UPDATE_INTERVAL,
-    COORDINATOR_NAME,
+    DATA_IMPORT_TIME,
+    DATA_RESPONSE_CACHE,
+    DEFAULT_HORIZONS,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_REPLAY_SPEED,
+    DEFAULT_SPARKLINE_POINTS,
+    DEFAULT_THRESHOLDS,
     DOMAIN,
+    MAX_STALE_AGE,
     PLATFORMS,
+    PROVIDER_ALTERNATIVE_ME,
+    PROVIDER_REPLAY,
+    RESOLUTION_DAILY,
+    RESOLUTIONS,
+    SERVICE_GET_HISTORY,
     SERVICE_REFRESH,
+    SERVICE_REPLAY_EVENTS,
     UPDATE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA: ConfigType = {}
+# Loaded on the first setup instead of with the integration: together they pull
+# in the API clients, the coordinator and everything a refresh needs.
+RUNTIME_MODULES = ("engine", "metrics", "response_cache", "thresholds", "websocket_api")
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+REFRESH_SCHEMA = vol.Schema({vol.Optional(ATTR_FORCE, default=False): cv.boolean})
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_RESOLUTION, default=RESOLUTION_DAILY): vol.In(RESOLUTIONS),
+    }
+)
+
+THRESHOLDS_SCHEMA = vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=0, max=100))])
+
+REPLAY_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_THRESHOLDS): THRESHOLDS_SCHEMA,
+        vol.Optional(ATTR_HYSTERESIS): vol.All(vol.Coerce(int), vol.Range(min=0, max=50)),
+        vol.Optional(ATTR_FIRE_EVENTS, default=False): cv.boolean,
+    }
+)
+
+
+def _import_runtime_modules() -> float:
+    """Import the modules setup needs and return how long that took in milliseconds."""
+    started = time.perf_counter()
+    for name in RUNTIME_MODULES:
+        importlib.import_module(f"{__name__}.{name}")
+    return (time.perf_counter() - started) * 1000
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Fear and Greed from a config entry."""
+    """Set up Fear and Greed from a config entry.
+
+    Setup only wires up the engine, entities and services. Saved values are
+    loaded and the APIs are asked in a task that runs afterwards, so setup
+    never waits for saved data or the network.
+    """
+    started = time.perf_counter()
     hass.data.setdefault(DOMAIN, {})
+    if DATA_IMPORT_TIME not in hass.data:
+        # Imports read files, so they run in the executor, once.
+        hass.data[DATA_IMPORT_TIME] = await hass.async_add_executor_job(_import_runtime_modules)
+
+    from .engine import FearAndGreedEngine
+    from .metrics import create_trace_config
+    from .providers import PROVIDERS
+    from .response_cache import ResponseCache
+    from .thresholds import replay
+    from .websocket_api import async_register_websocket_commands
 
     if not entry.options:
         hass.config_entries.async_update_entry(entry, options={CONF_UPDATE_INTERVAL: UPDATE_INTERVAL})
 
     update_interval = timedelta(seconds=entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL))
 
-    client = FearAndGreedApiClient(API_ENDPOINT)
+    # Responses saved on disk are shared by all entries and survive restarts and reloads.
+    if (response_cache := hass.data.get(DATA_RESPONSE_CACHE)) is None:
+        response_cache = hass.data[DATA_RESPONSE_CACHE] = ResponseCache(hass)
 
-    coordinator = DataUpdateCoordinator(
+    # A session of our own on Home Assistant's shared connector: connections are
+    # still pooled with other integrations, and requests can be traced.
+    session = async_create_clientsession(hass, trace_configs=[create_trace_config()])
+    providers = [PROVIDER_ALTERNATIVE_ME, *entry.options.get(CONF_PROVIDERS, [])]
+    endpoints = {}
+    if replay_file := entry.options.get(CONF_REPLAY_FILE):
+        providers.append(PROVIDER_REPLAY)
+        endpoints[PROVIDER_REPLAY] = hass.config.path(replay_file)
+    engine = FearAndGreedEngine.create(
         hass,
-        _LOGGER,
-        name=COORDINATOR_NAME,
-        update_method=client.async_get_index,
-        update_interval=update_interval,
+        session,
+        providers,
+        update_interval,
+        timedelta(hours=entry.options.get(CONF_MAX_STALE_AGE, MAX_STALE_AGE)),
+        endpoints=endpoints,
+        thresholds=entry.options.get(CONF_THRESHOLDS, DEFAULT_THRESHOLDS),
+        hysteresis=entry.options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+        sparkline_points=entry.options.get(CONF_SPARKLINE_POINTS, DEFAULT_SPARKLINE_POINTS),
+        horizons=entry.options.get(CONF_HORIZONS, DEFAULT_HORIZONS),
+        response_cache=response_cache,
+        replay_speed=entry.options.get(CONF_REPLAY_SPEED, DEFAULT_REPLAY_SPEED),
     )
-
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except FearAndGreedApiClientError as err:
-        raise ConfigEntryNotReady(f"Error while setting up Fear and Greed integration: {err}") from err
+    coordinator = engine.primary
+    _async_remove_unused_devices(hass, entry, {PROVIDERS[key].device_identifier for key in providers})
+    timings = {"import_ms": hass.data[DATA_IMPORT_TIME], "setup_ms": None, "first_refresh_ms": None}
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
-        "client": client,
+        "client": coordinator.client,
+        "engine": engine,
+        "timings": timings,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async def async_start() -> None:
+        """Load the saved responses and values, then refresh every provider."""
+        await response_cache.async_load()
+        await engine.async_setup(entry)
+        timings["first_refresh_ms"] = (time.perf_counter() - started) * 1000
+
     async def async_handle_refresh(call: ServiceCall) -> None:
         """Handle manual refresh service call."""
-        await coordinator.async_request_refresh()
+        await engine.async_request_refresh(force=call.data[ATTR_FORCE])
+
+    async def async_handle_get_history(call: ServiceCall) -> ServiceResponse:
+        """Return stored history for a time range without calling the API."""
+        history = await coordinator.history_store.async_load()
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        points = history.query(
+            int(dt_util.as_timestamp(start)) if start else 0,
+            int(dt_util.as_timestamp(end)) if end else int(dt_util.utcnow().timestamp()),
+            call.data[ATTR_RESOLUTION],
+        )
+        return {"resolution": call.data[ATTR_RESOLUTION], "points": points}
+
+    async def async_handle_replay_events(call: ServiceCall) -> ServiceResponse:
+        """Replay threshold and classification events over the stored history."""
+        history = await coordinator.history_store.async_load()
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        events = replay(
+            history,
+            call.data.get(ATTR_THRESHOLDS, coordinator.thresholds.thresholds),
+            call.data.get(ATTR_HYSTERESIS, coordinator.thresholds.hysteresis),
+            int(dt_util.as_timestamp(start)) if start else 0,
+            int(dt_util.as_timestamp(end)) if end else int(dt_util.utcnow().timestamp()),
+        )
+        replayed = [
+            (event_type, {"provider": PROVIDER_ALTERNATIVE_ME, "replayed": True, **data})
+            for event_type, data in events
+        ]
+        if call.data[ATTR_FIRE_EVENTS]:
+            for event_type, data in replayed:
+                hass.bus.async_fire(event_type, data)
+        if not call.return_response:
+            return None
+        return {"events": [{"event_type": event_type, **data} for event_type, data in replayed]}
 
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH):
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH, async_handle_refresh)
+        hass.services.async_register(DOMAIN, SERVICE_REFRESH, async_handle_refresh, schema=REFRESH_SCHEMA)
+
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_HISTORY):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_HISTORY,
+            async_handle_get_history,
+            schema=GET_HISTORY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
 
+    async_register_websocket_commands(hass)
+
+    if not hass.services.has_service(DOMAIN, SERVICE_REPLAY_EVENTS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_REPLAY_EVENTS,
+            async_handle_replay_events,
+            schema=REPLAY_EVENTS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    # Options are only read here, so a change reloads the entry.
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_create_task(hass, async_start(), f"{DOMAIN} start")
+    timings["setup_ms"] = (time.perf_counter() - started) * 1000
     return True
 
 
+@callback
+def _async_remove_unused_devices(hass: HomeAssistant, entry: ConfigEntry, used: set[tuple[str, str]]) -> None:
+    """Remove the devices, and with them the entities, of providers that are no longer enabled."""
+    registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(registry, entry.entry_id):
+        if not device.identifiers & used:
+            registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id)
-        await data["client"].async_close()
+        await data["engine"].async_shutdown()
         if not hass.data[DOMAIN]:
             hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+            hass.services.async_remove(DOMAIN, SERVICE_GET_HISTORY)
+            hass.services.async_remove(DOMAIN, SERVICE_REPLAY_EVENTS)
 
     return unload_ok
 
@@ -0,0 +1,203 @@
+"""Rolling analytics over the Fear and Greed Index history."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
+
+from .const import (
+    ANALYTICS_EMA_SPAN,
+    ANALYTICS_EXTREME_WINDOW,
+    ANALYTICS_MOVING_AVERAGES,
+    ANALYTICS_YEAR_WINDOW,
+)
+from .history import FearAndGreedHistory
+
+# Index values are integers from 0 to 100, so a year of values fits a fixed histogram.
+_VALUE_RANGE = 101
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyticsSnapshot:
+    """Rolling metrics for the most recent index value."""
+
+    moving_averages: dict[int, float]
+    ema: float
+    rolling_min: int
+    rolling_max: int
+    percentile_rank: float
+    z_score: float | None
+
+
+class _MovingAverage:
+    """Mean over a fixed number of the latest values."""
+
+    __slots__ = ("window", "values", "total")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values: deque[int] = deque()
+        self.total = 0
+
+    def push(self, value: int) -> None:
+        self.values.append(value)
+        self.total += value
+        if len(self.values) > self.window:
+            self.total -= self.values.popleft()
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self.values)
+
+
+class _MonotonicExtreme:
+    """Minimum or maximum over a sliding window using a monotonic deque."""
+
+    __slots__ = ("window", "maximum", "candidates", "position")
+
+    def __init__(self, window: int, maximum: bool) -> None:
+        self.window = window
+        self.maximum = maximum
+        self.candidates: deque[tuple[int, int]] = deque()
+        self.position = 0
+
+    def push(self, value: int) -> None:
+        candidates = self.candidates
+        if self.maximum:
+            while candidates and candidates[-1][1] <= value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= value:
+                candidates.pop()
+        candidates.append((self.position, value))
+        if candidates[0][0] <= self.position - self.window:
+            candidates.popleft()
+        self.position += 1
+
+    @property
+    def value(self) -> int:
+        return self.candidates[0][1]
+
+
+class RollingAnalytics:
+    """Rolling statistics that update in constant time for every new daily value.
+
+    Moving averages keep running sums, the rolling minimum and maximum use
+    monotonic deques, and the percentile rank and z-score over one year come from
+    a fixed 101 bucket histogram and running sums of values and squares.
+    """
+
+    def __init__(self) -> None:
+        self._averages = {window: _MovingAverage(window) for window in ANALYTICS_MOVING_AVERAGES}
+        self._alpha = 2 / (ANALYTICS_EMA_SPAN + 1)
+        self._ema: float | None = None
+        self._min = _MonotonicExtreme(ANALYTICS_EXTREME_WINDOW, maximum=False)
+        self._max = _MonotonicExtreme(ANALYTICS_EXTREME_WINDOW, maximum=True)
+        self._year: deque[int] = deque()
+        self._counts = [0] * _VALUE_RANGE
+        self._sum = 0
+        self._sum_squares = 0
+        self.count = 0
+        self.last_timestamp: int | None = None
+        self._snapshot: AnalyticsSnapshot | None = None
+
+    def push(self, timestamp: int, value: int) -> bool:
+        """Add the value of a new day; returns ``False`` for points that are not newer."""
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False
+
+        for average in self._averages.values():
+            average.push(value)
+        self._ema = value if self._ema is None else self._ema + self._alpha * (value - self._ema)
+        self._min.push(value)
+        self._max.push(value)
+
+        self._year.append(value)
+        self._counts[value] += 1
+        self._sum += value
+        self._sum_squares += value * value
+        if len(self._year) > ANALYTICS_YEAR_WINDOW:
+            dropped = self._year.popleft()
+            self._counts[dropped] -= 1
+            self._sum -= dropped
+            self._sum_squares -= dropped * dropped
+
+        self.count += 1
+        self.last_timestamp = timestamp
+        self._snapshot = None
+        return True
+
+    def extend_from(self, history: FearAndGreedHistory) -> bool:
+        """Push the points appended to ``history`` since the last update.
+
+        Returns ``False`` when the history changed in another way, for example by
+        a backfill inserting older points, and the engine has to be rebuilt.
+        """
+        if self.count > len(history):
+            return False
+        if self.count and history.timestamps[self.count - 1] != self.last_timestamp:
+            return False
+        for position in range(self.count, len(history)):
+            self.push(history.timestamps[position], history.values[position])
+        return True
+
+    @classmethod
+    def from_history(cls, history: FearAndGreedHistory) -> RollingAnalytics:
+        """Build the engine for a complete history in one pass.
+
+        Only the EMA depends on values older than a year. With NumPy it is
+        computed for the older part in a single vectorised step, and the last year
+        is pushed through the incremental path to seed the windows.
+        """
+        engine = cls()
+        start = 0
+        head = len(history) - ANALYTICS_YEAR_WINDOW
+        if head > 0 and (np := _numpy()) is not None:
+            engine._ema = _bulk_ema(np, history, head, engine._alpha)
+            start = head
+        for position in range(start, len(history)):
+            engine.push(history.timestamps[position], history.values[position])
+        engine.count = len(history)
+        return engine
+
+    @property
+    def snapshot(self) -> AnalyticsSnapshot | None:
+        """Return the metrics for the newest value, computed once per update."""
+        if self._snapshot is None and self.count:
+            year = len(self._year)
+            latest = self._year[-1]
+            mean = self._sum / year
+            deviation = math.sqrt(max(self._sum_squares / year - mean * mean, 0.0))
+            self._snapshot = AnalyticsSnapshot(
+                moving_averages={
+                    window: round(average.mean, 2) for window, average in self._averages.items()
+                },
+                ema=round(self._ema, 2),
+                rolling_min=self._min.value,
+                rolling_max=self._max.value,
+                percentile_rank=round(sum(self._counts[: latest + 1]) / year * 100, 2),
+                z_score=round((latest - mean) / deviation, 2) if deviation else None,
+            )
+        return self._snapshot
+
+
+@lru_cache(maxsize=1)
+def _numpy() -> ModuleType | None:
+    """Import NumPy when a long history first needs it; it takes longer to load than the integration."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - depends on the installed packages
+        return None
+    return numpy
+
+
+def _bulk_ema(np: ModuleType, history: FearAndGreedHistory, count: int, alpha: float) -> float:
+    """Return the EMA of the first ``count`` values, seeded with the first value."""
+    values = np.frombuffer(history.values, dtype=np.uint8, count=count).astype(np.float64)
+    decay = 1 - alpha
+    weights = alpha * decay ** np.arange(count - 1, -1, -1, dtype=np.float64)
+    weights[0] = decay ** (count - 1)
+    return float(np.dot(weights, values))
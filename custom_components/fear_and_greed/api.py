@@ -1,31 +1,92 @@
-"""Client for retrieving data from the Alternative.me Fear and Greed API."""
+"""Clients for retrieving Fear and Greed indices from their providers."""
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, TypeVar
 
 import aiohttp
+from aiohttp.compression_utils import HAS_BROTLI
 
 from .const import (
     ATTR_CHANGE,
     ATTR_CHANGE_PERCENT,
+    ATTR_CLASSIFICATION,
+    ATTR_FETCHED_AT,
     ATTR_PREVIOUS_VALUE,
+    ATTR_RESTORED,
+    ATTR_STALE,
+    CNN_JSON_INDEX,
+    CNN_JSON_PREVIOUS_CLOSE,
+    CNN_JSON_RATING,
+    CNN_JSON_SCORE,
+    CNN_JSON_TIMESTAMP,
+    CNN_USER_AGENT,
+    CONNECT_TIMEOUT,
+    HISTORY_FORMAT_CSV,
+    HISTORY_FORMAT_JSON,
+    INDEX_CACHE_TTL,
+    JSON_METADATA,
+    JSON_TIME_UNTIL_UPDATE,
     JSON_TIMESTAMP,
     JSON_VALUE,
     JSON_VALUE_CLASSIFICATION,
+    REQUEST_TIMEOUT,
+    RESPONSE_CACHE_TTL,
+    STREAM_CHUNK_SIZE,
 )
+from .classification import Sentiment
+from .history import FearAndGreedHistory
+from .metrics import ClientMetrics, create_trace_config
+from .parser import FearAndGreedCsvParser, FearAndGreedStreamParser, ParseStats, json_loads
+from .resilience import STATE_HALF_OPEN, CircuitBreaker, RetryPolicy, parse_retry_after
+from .response_cache import CachedResponse, ResponseCache
+
+_T = TypeVar("_T")
+
+# Brotli is only advertised when aiohttp is able to decode it.
+REQUEST_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate",
+    "Connection": "keep-alive",
+}
 
 
 class FearAndGreedApiClientError(Exception):
     """Raised when the API client encounters an error."""
 
 
-@dataclass
+class FearAndGreedApiTransientError(FearAndGreedApiClientError):
+    """Raised for errors that may go away when the request is retried."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FearAndGreedApiCircuitOpenError(FearAndGreedApiClientError):
+    """Raised while calls are suspended after repeated failures."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
 class FearAndGreedIndex:
-    """Represents the index returned by the API."""
+    """Represents the index returned by the API.
+
+    Instances are immutable and compare equal when they describe the same
+    reading: the fetch time and the countdown to the next publication change
+    with every poll and are left out of the comparison. The sensor attributes
+    and the sentiment class are resolved once per instance.
+    """
 
     value: int
     classification: str
@@ -33,43 +94,337 @@ class FearAndGreedIndex:
     value_change: int | None
     value_change_percent: float | None
     last_updated: datetime
+    time_until_update: int | None = field(default=None, compare=False)
+    fetched_at: datetime | None = field(default=None, compare=False)
+    restored: bool = False
+    stale: bool = False
+    as_sensor_attributes: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    sentiment: Sentiment = field(init=False, repr=False, compare=False)
 
-    @property
-    def as_sensor_attributes(self) -> Dict[str, Any]:
-        """Return attributes for Home Assistant sensors."""
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sentiment", Sentiment.resolve(self.classification, self.value))
         attributes: Dict[str, Any] = {
             ATTR_PREVIOUS_VALUE: self.previous_value,
             ATTR_CHANGE: self.value_change,
             ATTR_CHANGE_PERCENT: self.value_change_percent,
+            ATTR_FETCHED_AT: self.fetched_at.isoformat() if self.fetched_at else None,
+            ATTR_RESTORED: True if self.restored else None,
+            ATTR_STALE: True if self.stale else None,
+            ATTR_CLASSIFICATION: self.classification,
+        }
+        object.__setattr__(
+            self,
+            "as_sensor_attributes",
+            {key: value for key, value in attributes.items() if value is not None},
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serialisable representation for storage."""
+        return {
+            "value": self.value,
+            "classification": self.classification,
+            "previous_value": self.previous_value,
+            "value_change": self.value_change,
+            "value_change_percent": self.value_change_percent,
+            "last_updated": self.last_updated.isoformat(),
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
         }
-        return {key: value for key, value in attributes.items() if value is not None}
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FearAndGreedIndex":
+        """Create an index from a representation returned by :meth:`as_dict`."""
+        fetched_at = data.get("fetched_at")
+        return cls(
+            value=int(data["value"]),
+            classification=data["classification"],
+            previous_value=data.get("previous_value"),
+            value_change=data.get("value_change"),
+            value_change_percent=data.get("value_change_percent"),
+            last_updated=datetime.fromisoformat(data["last_updated"]),
+            fetched_at=datetime.fromisoformat(fetched_at) if fetched_at else None,
+        )
+
+
+class BaseFearAndGreedApiClient(ABC):
+    """Shared transport for the index providers' API clients.
+
+    The client uses the session it is given, normally Home Assistant's shared
+    session, so connections are pooled and kept alive between polls. Without a
+    session it creates a private one, which is closed by :meth:`async_close`.
+
+    Transient failures (network errors, 5xx and 429 responses) are retried with
+    exponential backoff and full jitter, honouring ``Retry-After``. A circuit
+    breaker suspends calls for a while after repeated failures.
 
-class FearAndGreedApiClient:
-    """Fear and Greed API client."""
+    Every provider has its own client, and so its own breaker and counters.
 
-    def __init__(self, endpoint: str) -> None:
+    Concurrent :meth:`async_get_index` calls share one in-flight request, and
+    its result answers further calls for ``cache_ttl`` seconds. With a
+    ``response_cache`` the index response is also kept on disk: a fresh copy
+    answers without a request, and an expired one is revalidated.
+    """
+
+    request_headers: Dict[str, str] = REQUEST_HEADERS
+    index_params: Dict[str, Any] | None = None
+
+    def __init__(
+        self,
+        endpoint: str,
+        session: aiohttp.ClientSession | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        retry_policy: RetryPolicy | None = None,
+        cache_ttl: float = INDEX_CACHE_TTL,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         self._endpoint = endpoint
-        self._session: aiohttp.ClientSession | None = None
+        self._session = session
+        self._owns_session = session is None
+        self._timeout = aiohttp.ClientTimeout(total=timeout, connect=CONNECT_TIMEOUT)
+        self.last_parse_stats: ParseStats | None = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.retries = 0
+        self.rate_limited = 0
+        self.metrics = ClientMetrics()
+        self.cache_ttl = cache_ttl
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.coalesced = 0
+        self._cached_index: FearAndGreedIndex | None = None
+        self._cached_at = 0.0
+        self._index_request: asyncio.Task[FearAndGreedIndex] | None = None
+        self._index_request_forced = False
+        self.response_cache = response_cache
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = aiohttp.ClientSession(trace_configs=[create_trace_config()])
         return self._session
 
-    async def async_get_index(self) -> FearAndGreedIndex:
-        """Retrieve the latest index data from the API."""
+    @asynccontextmanager
+    async def _async_request(
+        self, params: Dict[str, Any] | None = None, validators: Dict[str, str] | None = None
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Request the endpoint with ``params`` and yield the response.
+
+        With ``validators`` the request is conditional and a 304 response is
+        yielded as well.
+        """
         session = await self._ensure_session()
         try:
-            async with session.get(self._endpoint, params={"limit": 2}) as response:
-                if response.status != 200:
+            async with session.get(
+                self._endpoint,
+                params=params,
+                headers={**self.request_headers, **validators} if validators else self.request_headers,
+                timeout=self._timeout,
+                trace_request_ctx=self.metrics,
+            ) as response:
+                if response.status == 429:
+                    self.rate_limited += 1
+                    raise FearAndGreedApiTransientError(
+                        "Rate limited by Fear and Greed API",
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                if response.status >= 500:
+                    raise FearAndGreedApiTransientError(
+                        f"Unexpected status {response.status} from Fear and Greed API"
+                    )
+                if response.status != 200 and not (validators and response.status == 304):
                     raise FearAndGreedApiClientError(
                         f"Unexpected status {response.status} from Fear and Greed API"
                     )
-                payload = await response.json()
+                yield response
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            raise FearAndGreedApiClientError("Error communicating with Fear and Greed API") from err
+            raise FearAndGreedApiTransientError("Error communicating with Fear and Greed API") from err
+
+    async def _async_call(self, operation: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``operation`` with retries, guarded by the circuit breaker."""
+        trial = self.breaker.state == STATE_HALF_OPEN
+        if not self.breaker.allow():
+            retry_in = self.breaker.retry_in()
+            raise FearAndGreedApiCircuitOpenError(
+                f"Fear and Greed API calls suspended for {retry_in:.0f} seconds after repeated failures",
+                retry_in,
+            )
+
+        policy = self.retry_policy
+        retry = 0
+        try:
+            while True:
+                try:
+                    result = await operation()
+                except FearAndGreedApiTransientError as err:
+                    # A long Retry-After is left to the caller's schedule instead of blocking here.
+                    if retry + 1 >= policy.attempts or (err.retry_after or 0) > policy.max_delay:
+                        self.breaker.record_failure()
+                        self.metrics.failures += 1
+                        raise
+                    await asyncio.sleep(policy.delay(retry, err.retry_after))
+                    retry += 1
+                    self.retries += 1
+                except FearAndGreedApiClientError:
+                    self.breaker.record_failure()
+                    self.metrics.failures += 1
+                    raise
+                else:
+                    self.breaker.record_success()
+                    self.metrics.successes += 1
+                    return result
+        finally:
+            if trial:
+                # A cancelled or unexpected failure must not leave the trial pending forever.
+                self.breaker.end_trial()
+
+    async def _async_read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Read and decode a JSON body, timing the download and the parse separately."""
+        return self._decode_json(await self._async_read_body(response))
+
+    async def _async_read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        started = time.perf_counter()
+        body = await response.read()
+        self.metrics.body.observe(time.perf_counter() - started)
+        self.metrics.bytes_received += len(body)
+        return body
+
+    def _decode_json(self, body: bytes | str) -> Any:
+        started = time.perf_counter()
+        try:
+            payload = json_loads(body)
+        except ValueError as err:
+            raise FearAndGreedApiClientError(f"Invalid Fear and Greed API payload: {err}") from err
+        self.metrics.parse.observe(time.perf_counter() - started)
+        return payload
+
+    async def _async_get_json(self, params: Dict[str, Any] | None) -> tuple[Any, datetime]:
+        """Request and decode a JSON payload, returning it with its fetch time.
+
+        With a response cache the request carries the validators of the saved
+        response. A 304 answer reuses the saved body; a new body replaces it.
+        """
+        cache = self.response_cache
+        if cache is None:
+            async with self._async_request(params) as response:
+                return await self._async_read_json(response), datetime.now(timezone.utc)
+
+        key = cache.key(self._endpoint, params)
+        saved = cache.get(key)
+        async with self._async_request(params, saved.validators() if saved else None) as response:
+            if response.status == 304:
+                payload = self._decode_json(saved.body)
+                now = time.time()
+                cache.revalidate(key, now + self._response_ttl(payload, now - saved.fetched_at))
+                return payload, datetime.fromtimestamp(saved.fetched_at, timezone.utc)
+            body = await self._async_read_body(response)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        payload = self._decode_json(body)
+        fetched_at = time.time()
+        cache.set(
+            key,
+            CachedResponse(
+                body=body.decode(),
+                fetched_at=fetched_at,
+                expires_at=fetched_at + self._response_ttl(payload, 0.0),
+                etag=etag,
+                last_modified=last_modified,
+            ),
+        )
+        return payload, datetime.fromtimestamp(fetched_at, timezone.utc)
+
+    def _response_ttl(self, payload: Any, age: float) -> float:
+        """Return how long a response fetched ``age`` seconds ago may be reused from disk."""
+        return RESPONSE_CACHE_TTL
+
+    async def async_get_index(self, force: bool = False) -> FearAndGreedIndex:
+        """Retrieve the latest index data, from the cache unless ``force`` is set."""
+        if (
+            not force
+            and self._cached_index is not None
+            and time.monotonic() - self._cached_at < self.cache_ttl
+        ):
+            self.cache_hits += 1
+            return self._cached_index
+
+        # A forced call must not be answered by a request that may come from the cache.
+        if self._index_request is not None and (self._index_request_forced or not force):
+            self.coalesced += 1
+        else:
+            self.cache_misses += 1
+            self._index_request = asyncio.ensure_future(self._async_load_index(force))
+            self._index_request_forced = force
+            self._index_request.add_done_callback(self._index_request_done)
+        # Shielded so a cancelled caller does not cancel the request for the others.
+        return await asyncio.shield(self._index_request)
+
+    def _index_request_done(self, task: asyncio.Task[FearAndGreedIndex]) -> None:
+        if task is not self._index_request:
+            # Replaced by a forced request, whose result is the newer one.
+            return
+        self._index_request = None
+        if not task.cancelled() and task.exception() is None:
+            self._cached_index = task.result()
+            self._cached_at = time.monotonic()
+
+    async def _async_load_index(self, force: bool) -> FearAndGreedIndex:
+        """Answer from a fresh response on disk, or request the index."""
+        cache = self.response_cache
+        if not force and cache is not None:
+            saved = cache.get_fresh(cache.key(self._endpoint, self.index_params))
+            if saved is not None:
+                try:
+                    return self._parse_index(
+                        self._decode_json(saved.body), datetime.fromtimestamp(saved.fetched_at, timezone.utc)
+                    )
+                except (FearAndGreedApiClientError, KeyError, TypeError, ValueError):
+                    pass
+        return await self._async_call(self._async_fetch_index)
+
+    async def _async_fetch_index(self) -> FearAndGreedIndex:
+        """Request and parse the provider's latest index."""
+        return self._parse_index(*await self._async_get_json(self.index_params))
+
+    @abstractmethod
+    def _parse_index(self, payload: Any, fetched_at: datetime) -> FearAndGreedIndex:
+        """Build the index from a decoded payload fetched at ``fetched_at``."""
 
+    async def async_close(self) -> None:
+        """Close the underlying session if it is owned by the client."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "BaseFearAndGreedApiClient":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.async_close()
+
+
+class FearAndGreedApiClient(BaseFearAndGreedApiClient):
+    """Client for the Alternative.me crypto Fear and Greed Index.
+
+    The two point index request uses JSON. History requests use the more
+    compact CSV form unless ``history_format`` is set to JSON.
+    """
+
+    index_params = {"limit": 2}
+    history_format = HISTORY_FORMAT_CSV
+
+    def _response_ttl(self, payload: Any, age: float) -> float:
+        # A response stays valid until the announced publication of the next value.
+        time_until_update = self._time_until_update(payload)
+        return max(time_until_update - age, 0.0) if time_until_update is not None else INDEX_CACHE_TTL
+
+    @staticmethod
+    def _time_until_update(payload: Any) -> int | None:
+        data = payload.get("data") or [{}]
+        time_until_update = data[0].get(JSON_TIME_UNTIL_UPDATE)
+        if time_until_update is None:
+            time_until_update = (payload.get(JSON_METADATA) or {}).get(JSON_TIME_UNTIL_UPDATE)
+        return int(time_until_update) if time_until_update is not None else None
+
+    def _parse_index(self, payload: Any, fetched_at: datetime) -> FearAndGreedIndex:
         data = payload.get("data")
         if not data:
             raise FearAndGreedApiClientError("Fear and Greed API returned no data")
@@ -84,6 +439,12 @@ class FearAndGreedApiClient:
             (value_change / previous_value) * 100 if previous_value and value_change is not None else None
         )
 
+        time_until_update = self._time_until_update(payload)
+        if time_until_update is not None:
+            # The countdown was announced when the response was fetched.
+            age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+            time_until_update = max(time_until_update - int(age), 0)
+
         return FearAndGreedIndex(
             value=value,
             classification=latest.get(JSON_VALUE_CLASSIFICATION, "unknown"),
@@ -91,16 +452,72 @@ class FearAndGreedApiClient:
             value_change=value_change,
             value_change_percent=round(value_change_percent, 2) if value_change_percent is not None else None,
             last_updated=datetime.fromtimestamp(int(latest[JSON_TIMESTAMP])),
+            time_until_update=time_until_update,
+            fetched_at=fetched_at,
         )
 
-    async def async_close(self) -> None:
-        """Close the underlying session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+    async def async_get_history(self, limit: int = 0) -> FearAndGreedHistory:
+        """Retrieve the last ``limit`` daily points, or the full history for ``0``.
 
-    async def __aenter__(self) -> "FearAndGreedApiClient":
-        await self._ensure_session()
-        return self
+        The body is streamed into typed arrays instead of being decoded as a whole.
+        """
+        return await self._async_call(lambda: self._async_fetch_history(limit))
 
-    async def __aexit__(self, *exc_info: Any) -> None:
-        await self.async_close()
+    async def _async_fetch_history(self, limit: int) -> FearAndGreedHistory:
+        params: Dict[str, Any] = {"limit": limit}
+        if self.history_format == HISTORY_FORMAT_JSON:
+            parser: FearAndGreedStreamParser | FearAndGreedCsvParser = FearAndGreedStreamParser()
+        else:
+            parser = FearAndGreedCsvParser()
+            params["format"] = HISTORY_FORMAT_CSV
+        try:
+            async with self._async_request(params) as response:
+                started = time.perf_counter()
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                streamed = time.perf_counter() - started
+            history = parser.close()
+        except ValueError as err:
+            raise FearAndGreedApiClientError(f"Invalid Fear and Greed history payload: {err}") from err
+        finally:
+            self.last_parse_stats = stats = parser.stats
+
+        # Parsing happens while the body streams in; the rest of the time is download.
+        self.metrics.parse.observe(stats.parse_seconds)
+        self.metrics.body.observe(max(streamed - stats.parse_seconds, 0.0))
+        self.metrics.bytes_received += stats.bytes
+
+        if not history:
+            raise FearAndGreedApiClientError("Fear and Greed API returned no data")
+        return history
+
+
+class CnnFearAndGreedApiClient(BaseFearAndGreedApiClient):
+    """Client for CNN's Fear & Greed Index of the US stock market."""
+
+    request_headers = {**REQUEST_HEADERS, "User-Agent": CNN_USER_AGENT}
+
+    def _parse_index(self, payload: Any, fetched_at: datetime) -> FearAndGreedIndex:
+        latest = payload.get(CNN_JSON_INDEX)
+        if not latest or latest.get(CNN_JSON_SCORE) is None:
+            raise FearAndGreedApiClientError("CNN Fear and Greed API returned no data")
+
+        value = round(float(latest[CNN_JSON_SCORE]))
+        previous_close = latest.get(CNN_JSON_PREVIOUS_CLOSE)
+        previous_value = round(float(previous_close)) if previous_close is not None else None
+        value_change = value - previous_value if previous_value is not None else None
+        value_change_percent = (
+            (value_change / previous_value) * 100 if previous_value and value_change is not None else None
+        )
+        # Timestamps are ISO 8601 in UTC; they are stored as local time like Alternative.me's.
+        updated = datetime.fromisoformat(latest[CNN_JSON_TIMESTAMP])
+
+        return FearAndGreedIndex(
+            value=value,
+            classification=str(latest.get(CNN_JSON_RATING, "unknown")).title(),
+            previous_value=previous_value,
+            value_change=value_change,
+            value_change_percent=round(value_change_percent, 2) if value_change_percent is not None else None,
+            last_updated=datetime.fromtimestamp(updated.timestamp()),
+            fetched_at=fetched_at,
+        )
@@ -0,0 +1,47 @@
+"""Sentiment classes of the index with their value bands and icons."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class Sentiment(Enum):
+    """A sentiment class of the index.
+
+    Members carry everything the sensors need, so an index resolves its
+    sentiment once when it is created and later lookups only read attributes.
+    ``level`` ranks the classes from 0 for extreme fear to 4 for extreme greed
+    and ``lower`` is the lowest index value of the class's band.
+    """
+
+    EXTREME_FEAR = ("Extreme Fear", 0, 0, "mdi:emoticon-dead-outline")
+    FEAR = ("Fear", 1, 25, "mdi:emoticon-sad-outline")
+    NEUTRAL = ("Neutral", 2, 47, "mdi:emoticon-neutral-outline")
+    GREED = ("Greed", 3, 55, "mdi:emoticon-excited-outline")
+    EXTREME_GREED = ("Extreme Greed", 4, 76, "mdi:emoticon-devil-outline")
+
+    def __init__(self, label: str, level: int, lower: int, icon: str) -> None:
+        self.label = label
+        self.level = level
+        self.lower = lower
+        self.icon = icon
+
+    @classmethod
+    def from_value(cls, value: int) -> Sentiment:
+        """Return the class whose band contains ``value``; values outside 0-100 are clamped."""
+        return _BY_VALUE[min(max(value, 0), 100)]
+
+    @classmethod
+    def resolve(cls, classification: str, value: int) -> Sentiment:
+        """Return the class named by the provider, or the value's band for unknown names."""
+        return _BY_NAME.get(classification) or _BY_NAME.get(classification.lower()) or cls.from_value(value)
+
+
+_BY_VALUE: tuple[Sentiment, ...] = tuple(
+    next(sentiment for sentiment in reversed(Sentiment) if value >= sentiment.lower) for value in range(101)
+)
+# Alternative.me names the classes like the labels and CNN in lower case.
+_BY_NAME: dict[str, Sentiment] = {
+    **{sentiment.label: sentiment for sentiment in Sentiment},
+    **{sentiment.label.lower(): sentiment for sentiment in Sentiment},
+}
@@ -2,14 +2,58 @@
 
 from __future__ import annotations
 
+import os
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
-
-from .const import CONF_UPDATE_INTERVAL, DOMAIN, UPDATE_INTERVAL
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    CONF_HORIZONS,
+    CONF_HYSTERESIS,
+    CONF_MAX_STALE_AGE,
+    CONF_PROVIDERS,
+    CONF_REPLAY_FILE,
+    CONF_REPLAY_SPEED,
+    CONF_SPARKLINE_POINTS,
+    CONF_THRESHOLDS,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_HORIZONS,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_REPLAY_SPEED,
+    DEFAULT_SPARKLINE_POINTS,
+    DEFAULT_THRESHOLDS,
+    DOMAIN,
+    MAX_HORIZON,
+    MAX_STALE_AGE,
+    UPDATE_INTERVAL,
+)
+from .providers import OPTIONAL_PROVIDERS, PROVIDERS
+
+
+def _parse_thresholds(value: Any) -> list[int]:
+    """Parse a comma separated list of index levels between 0 and 100."""
+    try:
+        thresholds = sorted({int(part) for part in str(value).split(",") if part.strip()})
+    except ValueError as err:
+        raise vol.Invalid("Thresholds must be whole numbers separated by commas") from err
+    if any(not 0 <= threshold <= 100 for threshold in thresholds):
+        raise vol.Invalid("Thresholds must be between 0 and 100")
+    return thresholds
+
+
+def _parse_horizons(value: Any) -> list[int]:
+    """Parse a comma separated list of horizons in days."""
+    try:
+        horizons = sorted({int(part) for part in str(value).split(",") if part.strip()})
+    except ValueError as err:
+        raise vol.Invalid("Horizons must be whole numbers of days separated by commas") from err
+    if any(not 1 <= horizon <= MAX_HORIZON for horizon in horizons):
+        raise vol.Invalid(f"Horizons must be between 1 and {MAX_HORIZON} days")
+    return horizons
 
 
 class FearAndGreedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -43,8 +87,15 @@ class FearAndGreedOptionsFlowHandler(config_entries.OptionsFlow):
         return await self.async_step_update()
 
     async def async_step_update(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="Fear & Greed Options", data=user_input)
+            replay_file = user_input.get(CONF_REPLAY_FILE)
+            if replay_file and not await self.hass.async_add_executor_job(
+                os.path.isfile, self.hass.config.path(replay_file)
+            ):
+                errors[CONF_REPLAY_FILE] = "replay_file_not_found"
+            else:
+                return self.async_create_entry(title="Fear & Greed Options", data=user_input)
 
         return self.async_show_form(
             step_id="update",
@@ -54,6 +105,45 @@ class FearAndGreedOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_UPDATE_INTERVAL,
                         default=self.config_entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL),
                     ): vol.All(vol.Coerce(int), vol.Clamp(min=900, max=21600)),
+                    vol.Optional(
+                        CONF_MAX_STALE_AGE,
+                        default=self.config_entry.options.get(CONF_MAX_STALE_AGE, MAX_STALE_AGE),
+                    ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=168)),
+                    vol.Optional(
+                        CONF_PROVIDERS,
+                        default=self.config_entry.options.get(CONF_PROVIDERS, []),
+                    ): cv.multi_select({key: PROVIDERS[key].name for key in OPTIONAL_PROVIDERS}),
+                    vol.Optional(
+                        CONF_THRESHOLDS,
+                        default=", ".join(
+                            str(threshold)
+                            for threshold in self.config_entry.options.get(CONF_THRESHOLDS, DEFAULT_THRESHOLDS)
+                        ),
+                    ): vol.All(cv.string, _parse_thresholds),
+                    vol.Optional(
+                        CONF_HYSTERESIS,
+                        default=self.config_entry.options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+                    ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=50)),
+                    vol.Optional(
+                        CONF_SPARKLINE_POINTS,
+                        default=self.config_entry.options.get(CONF_SPARKLINE_POINTS, DEFAULT_SPARKLINE_POINTS),
+                    ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=365)),
+                    vol.Optional(
+                        CONF_HORIZONS,
+                        default=", ".join(
+                            str(horizon)
+                            for horizon in self.config_entry.options.get(CONF_HORIZONS, DEFAULT_HORIZONS)
+                        ),
+                    ): vol.All(cv.string, _parse_horizons),
+                    vol.Optional(
+                        CONF_REPLAY_FILE,
+                        default=self.config_entry.options.get(CONF_REPLAY_FILE, ""),
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_REPLAY_SPEED,
+                        default=self.config_entry.options.get(CONF_REPLAY_SPEED, DEFAULT_REPLAY_SPEED),
+                    ): vol.All(vol.Coerce(float), vol.Clamp(min=0.1, max=86400)),
                 }
             ),
+            errors=errors,
         )
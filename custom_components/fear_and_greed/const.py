@@ -7,15 +7,134 @@ COORDINATOR_NAME = "Fear and Greed Index"
 DEFAULT_NAME = "Fear & Greed Index"
 PLATFORMS = ["sensor"]
 UPDATE_INTERVAL = 3600  # seconds
+# Delay after the announced publication time before polling for the new value.
+PUBLICATION_OFFSET = 120  # seconds
+# First retry delay while a new value is overdue; doubled on every late poll.
+LATE_RETRY_DELAY = 60  # seconds
 API_ENDPOINT = "https://api.alternative.me/fng/"
+CNN_API_ENDPOINT = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+# CNN rejects requests that do not look like they come from a browser.
+CNN_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+REQUEST_TIMEOUT = 30  # seconds, for the whole request including the body
+CONNECT_TIMEOUT = 10  # seconds
+STREAM_CHUNK_SIZE = 16384  # bytes read at a time from history responses
+# Transfer formats of Alternative.me history requests. CSV is about half the size of JSON.
+HISTORY_FORMAT_JSON = "json"
+HISTORY_FORMAT_CSV = "csv"
+# How long a fetched index answers further requests without calling the API.
+# Kept below LATE_RETRY_DELAY so scheduled retries always reach the network.
+INDEX_CACHE_TTL = 30  # seconds
+# How long a response saved on disk is reused when the API does not announce its
+# next update. Kept below the shortest polling interval of 900 seconds.
+RESPONSE_CACHE_TTL = 300  # seconds
+# Responses kept on disk; the least recently used one is dropped first.
+RESPONSE_CACHE_MAX_ENTRIES = 16
+RESPONSE_CACHE_SAVE_DELAY = 10  # seconds
+
+# Retries of transient API errors within one refresh.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1  # seconds
+RETRY_MAX_DELAY = 30  # seconds
+# Consecutive failed refreshes before API calls are suspended, and for how long.
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 600  # seconds
+# How long the last good value is served as stale while the API is unreachable.
+MAX_STALE_AGE = 48  # hours
+
+# Index providers. Alternative.me is always enabled and backs the history features.
+PROVIDER_ALTERNATIVE_ME = "alternative_me"
+PROVIDER_CNN = "cnn"
+# Replays a recorded history file instead of calling an API; enabled by CONF_REPLAY_FILE.
+PROVIDER_REPLAY = "replay"
+# Real seconds per simulated day of a replay.
+DEFAULT_REPLAY_SPEED = 1.0
+
+# Sent by a provider's coordinator after every refresh, formatted with the provider key.
+SIGNAL_METRICS_UPDATED = f"{DOMAIN}_metrics_updated_{{}}"
+
 SERVICE_REFRESH = "refresh"
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_REPLAY_EVENTS = "replay_events"
+
+WS_TYPE_HISTORY = f"{DOMAIN}/history"
+WS_TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
+ATTR_POINTS = "points"
+
+EVENT_THRESHOLD_CROSSED = f"{DOMAIN}_threshold_crossed"
+EVENT_CLASSIFICATION_CHANGED = f"{DOMAIN}_classification_changed"
+DIRECTION_UP = "up"
+DIRECTION_DOWN = "down"
+# Index levels watched for crossings, and how far past a level the value must move.
+DEFAULT_THRESHOLDS = [25, 75]
+DEFAULT_HYSTERESIS = 2
+
+ATTR_FORCE = "force"
+ATTR_FIRE_EVENTS = "fire_events"
+ATTR_THRESHOLDS = "thresholds"
+ATTR_HYSTERESIS = "hysteresis"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_RESOLUTION = "resolution"
+
+RESOLUTION_DAILY = "daily"
+RESOLUTION_WEEKLY = "weekly"
+RESOLUTION_MONTHLY = "monthly"
+RESOLUTIONS = [RESOLUTION_DAILY, RESOLUTION_WEEKLY, RESOLUTION_MONTHLY]
 
 ATTR_CLASSIFICATION = "classification"
 ATTR_PREVIOUS_VALUE = "previous_value"
 ATTR_CHANGE = "value_change"
 ATTR_CHANGE_PERCENT = "value_change_percent"
+ATTR_FETCHED_AT = "fetched_at"
+ATTR_RESTORED = "restored"
+ATTR_STALE = "stale"
+ATTR_SPARKLINE = "sparkline"
+ATTR_REFERENCE_VALUE = "reference_value"
+ATTR_AVERAGE = "average"
 
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_MAX_STALE_AGE = "max_stale_age"
+CONF_PROVIDERS = "providers"
+CONF_THRESHOLDS = "thresholds"
+CONF_HYSTERESIS = "hysteresis"
+CONF_SPARKLINE_POINTS = "sparkline_points"
+CONF_HORIZONS = "horizons"
+CONF_REPLAY_FILE = "replay_file"
+CONF_REPLAY_SPEED = "replay_speed"
+
+# Days of history shown in the sparkline attribute, and its default size.
+SPARKLINE_DAYS = 365
+DEFAULT_SPARKLINE_POINTS = 60
+
+# Gaps in the local history up to this many days are filled with a request for
+# just the missing days; longer ones fall back to a full backfill.
+HISTORY_SYNC_MAX_GAP_DAYS = 90
+
+# Horizons of the change sensors, in days: week, month and year over year.
+DEFAULT_HORIZONS = [7, 30, 365]
+MAX_HORIZON = 3650
+
+# Rolling analytics windows, in days.
+ANALYTICS_MOVING_AVERAGES = (7, 30, 90)
+ANALYTICS_EMA_SPAN = 21
+ANALYTICS_EXTREME_WINDOW = 30
+ANALYTICS_YEAR_WINDOW = 365
+
+HISTORY_STORAGE_KEY = f"{DOMAIN}.history"
+HISTORY_STORAGE_VERSION = 1
+STATE_STORAGE_KEY = f"{DOMAIN}.state"
+STATE_STORAGE_VERSION = 1
+STATISTICS_STORAGE_KEY = f"{DOMAIN}.statistics"
+STATISTICS_STORAGE_VERSION = 1
+RESPONSE_CACHE_STORAGE_KEY = f"{DOMAIN}.responses"
+RESPONSE_CACHE_STORAGE_VERSION = 1
+# hass.data key of the response cache shared by all config entries.
+DATA_RESPONSE_CACHE = f"{DOMAIN}_response_cache"
+DATA_IMPORT_TIME = f"{DOMAIN}_import_time"
+
+# External statistic holding the imported index history.
+STATISTIC_ID = f"{DOMAIN}:index"
+STATISTICS_IMPORT_BATCH_SIZE = 500
 
 ISSUE_URL = "https://github.com/ha_fead_and_greed_index/issues"
 
@@ -23,6 +142,15 @@ ISSUE_URL = "https://github.com/ha_fead_and_greed_index/issues"
 JSON_VALUE = "value"
 JSON_VALUE_CLASSIFICATION = "value_classification"
 JSON_TIMESTAMP = "timestamp"
+JSON_TIME_UNTIL_UPDATE = "time_until_update"
+JSON_METADATA = "metadata"
+
+# Keys of the CNN Fear & Greed graph data payload.
+CNN_JSON_INDEX = "fear_and_greed"
+CNN_JSON_SCORE = "score"
+CNN_JSON_RATING = "rating"
+CNN_JSON_TIMESTAMP = "timestamp"
+CNN_JSON_PREVIOUS_CLOSE = "previous_close"
 
 # HACS metadata
 INTEGRATION_TITLE = "Fear and Greed Index"
@@ -0,0 +1,286 @@
+"""Data update coordinator for the Fear and Greed integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import replace
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .analytics import RollingAnalytics
+from .api import BaseFearAndGreedApiClient, FearAndGreedApiClientError, FearAndGreedIndex
+from .const import (
+    COORDINATOR_NAME,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_HORIZONS,
+    DEFAULT_SPARKLINE_POINTS,
+    DEFAULT_THRESHOLDS,
+    LATE_RETRY_DELAY,
+    MAX_STALE_AGE,
+    PROVIDER_ALTERNATIVE_ME,
+    PUBLICATION_OFFSET,
+    SIGNAL_METRICS_UPDATED,
+    SPARKLINE_DAYS,
+    STATE_STORAGE_KEY,
+    STATE_STORAGE_VERSION,
+)
+from .history import FearAndGreedHistory, FearAndGreedHistoryStore
+from .horizons import HorizonChanges
+from .sparkline import sparkline
+from .statistics import FearAndGreedStatisticsImporter
+from .sync import SyncPlan, find_gaps, plan_sync
+from .thresholds import ThresholdTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+# Caps the exponent of the late retry backoff so the delay never overflows.
+_MAX_LATE_RETRY_EXPONENT = 10
+
+
+class FearAndGreedDataUpdateCoordinator(DataUpdateCoordinator[FearAndGreedIndex]):
+    """Coordinator that polls shortly after each daily publication of the index.
+
+    The API announces the seconds until its next update with every response. The
+    next refresh is scheduled for that moment plus a small offset. While a new
+    value is overdue the coordinator retries with an exponentially growing delay,
+    capped at the configured update interval, which is also used whenever the API
+    does not announce a publication time.
+
+    Every fetched value is also added to the persistent history, for providers
+    that have one. The first
+    refresh backfills the full history once, or only the days missing since the
+    newest stored point when a history already exists on disk.
+
+    New history points are copied into the recorder's long-term statistics in
+    the background. The last successful index is saved as well, so it can be
+    restored at startup and served while the first network refresh runs in the
+    background.
+
+    Each new value is checked against the configured thresholds and
+    classification, and real transitions are fired as bus events.
+
+    When a refresh fails the last good index keeps being served, flagged as
+    stale, until it is older than ``max_stale_age``. Failed refreshes are
+    retried with a growing delay that respects the API's ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: BaseFearAndGreedApiClient,
+        update_interval: timedelta,
+        history_store: FearAndGreedHistoryStore | None,
+        max_stale_age: timedelta = timedelta(hours=MAX_STALE_AGE),
+        provider: str = PROVIDER_ALTERNATIVE_ME,
+        thresholds: Sequence[int] = DEFAULT_THRESHOLDS,
+        hysteresis: int = DEFAULT_HYSTERESIS,
+        sparkline_points: int = DEFAULT_SPARKLINE_POINTS,
+        horizons: Sequence[int] = DEFAULT_HORIZONS,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=COORDINATOR_NAME if provider == PROVIDER_ALTERNATIVE_ME else f"{COORDINATOR_NAME} ({provider})",
+            update_interval=update_interval,
+            # Listeners are only notified when the reading differs from the last one.
+            always_update=False,
+        )
+        self.client = client
+        self.provider = provider
+        self.history_store = history_store
+        self.analytics: RollingAnalytics | None = None
+        self.statistics = FearAndGreedStatisticsImporter(hass, provider)
+        self.thresholds = ThresholdTracker(thresholds, hysteresis)
+        self.sparkline_points = sparkline_points
+        self.sparkline: tuple[tuple[int, int], ...] | None = None
+        self.horizons = HorizonChanges(horizons)
+        self.fallback_interval = update_interval
+        self.max_stale_age = max_stale_age
+        self.late_retries = 0
+        self.failures = 0
+        self.next_poll: datetime | None = None
+        self._publication_due: datetime | None = None
+        self._force_refresh = False
+        self._state_store: Store[dict[str, object]] = Store(
+            hass,
+            STATE_STORAGE_VERSION,
+            STATE_STORAGE_KEY if provider == PROVIDER_ALTERNATIVE_ME else f"{STATE_STORAGE_KEY}.{provider}",
+        )
+
+    async def async_restore(self) -> bool:
+        """Load the last saved index and the stored history without touching the network."""
+        await self.async_load_history()
+        data = await self._state_store.async_load()
+        if not data:
+            return False
+        try:
+            index = FearAndGreedIndex.from_dict(data)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid stored Fear and Greed state: %s", err)
+            return False
+
+        self.data = replace(index, restored=True)
+        self.last_update_success = True
+        self.thresholds.seed(index.value, index.classification)
+        return True
+
+    async def async_reset_storage(self) -> None:
+        """Delete the saved index, history and import progress of this provider."""
+        await self._state_store.async_remove()
+        if self.history_store is not None:
+            await self.history_store.async_remove()
+        await self.statistics.async_reset()
+
+    async def async_force_refresh(self) -> None:
+        """Refresh now, bypassing the client's response cache."""
+        self._force_refresh = True
+        await self.async_refresh()
+
+    async def _async_update_data(self) -> FearAndGreedIndex:
+        """Fetch the latest index and tell the metrics sensors about the request."""
+        try:
+            return await self._async_fetch_index()
+        finally:
+            async_dispatcher_send(self.hass, SIGNAL_METRICS_UPDATED.format(self.provider))
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities and time how long their state updates take."""
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.client.metrics.entity_update.observe(time.perf_counter() - started)
+
+    async def _async_fetch_index(self) -> FearAndGreedIndex:
+        """Fetch the latest index and schedule the next poll."""
+        force, self._force_refresh = self._force_refresh, False
+        try:
+            index = await self.client.async_get_index(force=force)
+        except FearAndGreedApiClientError as err:
+            self.update_interval = self._failure_interval(err)
+            self.next_poll = dt_util.utcnow() + self.update_interval
+            stale = self._stale_data()
+            if stale is None:
+                raise UpdateFailed(str(err)) from err
+            _LOGGER.warning("Serving last known Fear and Greed value: %s", err)
+            return stale
+
+        self.failures = 0
+        if self.history_store is not None:
+            await self._async_sync_history(index)
+        self._async_fire_transition_events(index)
+        await self._state_store.async_save(index.as_dict())
+
+        self.update_interval = self._next_interval(index)
+        self.next_poll = dt_util.utcnow() + self.update_interval
+        return index
+
+    @callback
+    def _async_fire_transition_events(self, index: FearAndGreedIndex) -> None:
+        """Fire bus events for thresholds crossed and classification changes."""
+        updated = datetime.fromtimestamp(index.last_updated.timestamp(), tz=timezone.utc)
+        for event_type, data in self.thresholds.update(index.value, index.classification, updated):
+            self.hass.bus.async_fire(event_type, {"provider": self.provider, **data})
+
+    def _stale_data(self) -> FearAndGreedIndex | None:
+        """Return the last good index marked as stale, if it is recent enough."""
+        previous = self.data
+        if previous is None or previous.fetched_at is None:
+            return None
+        if dt_util.utcnow() - previous.fetched_at > self.max_stale_age:
+            return None
+        return previous if previous.stale else replace(previous, stale=True)
+
+    def _failure_interval(self, err: FearAndGreedApiClientError) -> timedelta:
+        """Return the delay before retrying after a failed refresh."""
+        delay = LATE_RETRY_DELAY * 2 ** min(self.failures, _MAX_LATE_RETRY_EXPONENT)
+        self.failures += 1
+        retry_after = getattr(err, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(timedelta(seconds=delay), self.fallback_interval)
+
+    @property
+    def history(self) -> FearAndGreedHistory:
+        """Return the locally stored index history."""
+        if self.history_store is None:
+            return FearAndGreedHistory()
+        return self.history_store.history
+
+    async def async_load_history(self) -> FearAndGreedHistory:
+        """Return the stored history, loading it from disk on first use."""
+        if self.history_store is None:
+            return FearAndGreedHistory()
+        return await self.history_store.async_load()
+
+    async def _async_sync_history(self, index: FearAndGreedIndex) -> None:
+        """Add the fetched index to the history, first fetching any days it is missing."""
+        history = await self.history_store.async_load()
+        latest = int(index.last_updated.timestamp())
+        added = 0
+        synced = True
+
+        plan = plan_sync(history, latest)
+        if plan is not None:
+            try:
+                added += await self._async_fill_gap(history, plan)
+            except FearAndGreedApiClientError as err:
+                _LOGGER.warning("Unable to synchronise Fear and Greed history: %s", err)
+                # Leaving out the new value keeps the gap visible to the next refresh.
+                synced = False
+
+        if synced:
+            added += history.merge([(latest, index.value, index.classification)])
+        if added:
+            await self.history_store.async_save()
+        if added or self.sparkline is None:
+            # Only changes with the daily value, so it is computed here and not per state write.
+            self.sparkline = sparkline(history, SPARKLINE_DAYS, self.sparkline_points)
+
+        if self.analytics is None or not self.analytics.extend_from(history):
+            self.analytics = RollingAnalytics.from_history(history)
+        self.horizons.update(history)
+
+        self.statistics.async_schedule(history)
+
+    async def _async_fill_gap(self, history: FearAndGreedHistory, plan: SyncPlan) -> int:
+        """Fetch the days in ``plan`` and fall back to a full backfill if some are still missing."""
+        fetched = await self.client.async_get_history(plan.limit)
+        added = history.merge(fetched.points())
+        if plan.full or not find_gaps(history, plan.since):
+            return added
+
+        _LOGGER.debug("Fear and Greed history still has gaps after fetching %s days, fetching all", plan.limit)
+        fetched = await self.client.async_get_history(0)
+        return added + history.merge(fetched.points())
+
+    def _next_interval(self, index: FearAndGreedIndex) -> timedelta:
+        """Return the delay until the next poll based on the fetched index."""
+        now = dt_util.utcnow()
+        previous = self.data
+        new_reading = previous is None or index.last_updated > previous.last_updated
+        # A reading is only late once the announced publication time has passed without a new value;
+        # refreshes before that, manual or after a failure, keep following the announcement.
+        late = not new_reading and self._publication_due is not None and now >= self._publication_due
+
+        if not late and index.time_until_update is not None and index.time_until_update > 0:
+            self.late_retries = 0
+            self._publication_due = now + timedelta(seconds=index.time_until_update)
+            return timedelta(seconds=index.time_until_update + PUBLICATION_OFFSET)
+
+        if late or index.time_until_update is not None:
+            # The publication time has passed without a new value; retry soon.
+            delay = LATE_RETRY_DELAY * 2 ** min(self.late_retries, _MAX_LATE_RETRY_EXPONENT)
+            self.late_retries += 1
+            _LOGGER.debug("Fear and Greed value is late, retrying in %s seconds", delay)
+            return min(timedelta(seconds=delay), self.fallback_interval)
+
+        self.late_retries = 0
+        self._publication_due = None
+        return self.fallback_interval
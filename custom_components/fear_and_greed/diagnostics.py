@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
@@ -13,11 +15,65 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
     index = coordinator.data
+    parse_stats = data["client"].last_parse_stats
+
+    scheduler = {
+        "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+        "next_poll": coordinator.next_poll.isoformat() if coordinator.next_poll else None,
+        "late_retries": coordinator.late_retries,
+        "consecutive_failures": coordinator.failures,
+    }
+    client = data["client"]
+    resilience = {
+        "circuit_breaker": client.breaker.as_dict(),
+        "retries": client.retries,
+        "rate_limited": client.rate_limited,
+    }
+    index_cache = {
+        "hits": client.cache_hits,
+        "misses": client.cache_misses,
+        "coalesced": client.coalesced,
+    }
+    response_cache = client.response_cache.as_dict() if client.response_cache else None
+
+    history_parse = asdict(parse_stats) if parse_stats else None
+    # Import time of the runtime modules, wall time of the setup and time until every provider was refreshed.
+    startup = {name: round(value, 3) if value is not None else None for name, value in data["timings"].items()}
+
+    providers = {
+        key: {
+            "last_update_success": provider.last_update_success,
+            "value": provider.data.value if provider.data else None,
+            "classification": provider.data.classification if provider.data else None,
+            "fetched_at": provider.data.fetched_at.isoformat() if provider.data and provider.data.fetched_at else None,
+            "stale": provider.data.stale if provider.data else None,
+            "update_interval": provider.update_interval.total_seconds() if provider.update_interval else None,
+            "circuit_breaker": provider.client.breaker.as_dict(),
+            "metrics": provider.client.metrics.as_dict(),
+        }
+        for key, provider in data["engine"].coordinators.items()
+    }
 
     if not index:
-        return {"index": None}
+        return {
+            "index": None,
+            "scheduler": scheduler,
+            "resilience": resilience,
+            "index_cache": index_cache,
+            "response_cache": response_cache,
+            "history_parse": history_parse,
+            "startup": startup,
+            "providers": providers,
+        }
 
     return {
+        "providers": providers,
+        "scheduler": scheduler,
+        "resilience": resilience,
+        "index_cache": index_cache,
+        "response_cache": response_cache,
+        "history_parse": history_parse,
+        "startup": startup,
         "index": {
             "value": index.value,
             "classification": index.classification,
@@ -25,5 +81,9 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
             "value_change": index.value_change,
             "value_change_percent": index.value_change_percent,
             "last_updated": index.last_updated.isoformat(),
-        }
+            "time_until_update": index.time_until_update,
+            "fetched_at": index.fetched_at.isoformat() if index.fetched_at else None,
+            "restored": index.restored,
+            "stale": index.stale,
+        },
     }
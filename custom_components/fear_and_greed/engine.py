@@ -0,0 +1,130 @@
+"""Run the coordinators of several index providers side by side."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import timedelta
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_HORIZONS,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_REPLAY_SPEED,
+    DEFAULT_SPARKLINE_POINTS,
+    DEFAULT_THRESHOLDS,
+    HISTORY_STORAGE_KEY,
+    PROVIDER_ALTERNATIVE_ME,
+    PROVIDER_REPLAY,
+)
+from .coordinator import FearAndGreedDataUpdateCoordinator
+from .history import FearAndGreedHistoryStore
+from .providers import PROVIDERS
+from .replay import ReplayFearAndGreedApiClient
+from .response_cache import ResponseCache
+
+
+class FearAndGreedEngine:
+    """Refresh every enabled provider concurrently.
+
+    Each provider keeps its own client, circuit breaker and polling schedule.
+    Work that touches all providers, like the first refresh or the refresh
+    service, is started together with ``asyncio.gather``, so it takes as long
+    as the slowest provider rather than the sum of all of them.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinators: dict[str, FearAndGreedDataUpdateCoordinator]) -> None:
+        self.hass = hass
+        self.coordinators = coordinators
+
+    @classmethod
+    def create(
+        cls,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        providers: Iterable[str],
+        update_interval: timedelta,
+        max_stale_age: timedelta,
+        endpoints: Mapping[str, str] | None = None,
+        thresholds: Sequence[int] = DEFAULT_THRESHOLDS,
+        hysteresis: int = DEFAULT_HYSTERESIS,
+        sparkline_points: int = DEFAULT_SPARKLINE_POINTS,
+        horizons: Sequence[int] = DEFAULT_HORIZONS,
+        response_cache: ResponseCache | None = None,
+        replay_speed: float = DEFAULT_REPLAY_SPEED,
+    ) -> FearAndGreedEngine:
+        """Build a coordinator for each provider; ``endpoints`` overrides their URLs.
+
+        A replay polls once per simulated day, every ``replay_speed`` seconds.
+        """
+        coordinators: dict[str, FearAndGreedDataUpdateCoordinator] = {}
+        for key in providers:
+            provider = PROVIDERS[key]
+            endpoint = (endpoints or {}).get(key, provider.endpoint)
+            if key == PROVIDER_REPLAY:
+                client = ReplayFearAndGreedApiClient(endpoint, seconds_per_day=replay_speed)
+                interval = timedelta(seconds=replay_speed)
+            else:
+                client = provider.client_class(endpoint, session, response_cache=response_cache)
+                interval = update_interval
+            history_key = HISTORY_STORAGE_KEY if key == PROVIDER_ALTERNATIVE_ME else f"{HISTORY_STORAGE_KEY}.{key}"
+            coordinators[key] = FearAndGreedDataUpdateCoordinator(
+                hass,
+                client,
+                interval,
+                FearAndGreedHistoryStore(hass, history_key) if provider.has_history else None,
+                max_stale_age=max_stale_age,
+                provider=key,
+                thresholds=thresholds,
+                hysteresis=hysteresis,
+                sparkline_points=sparkline_points,
+                horizons=horizons,
+            )
+        return cls(hass, coordinators)
+
+    @property
+    def primary(self) -> FearAndGreedDataUpdateCoordinator:
+        """Return the Alternative.me coordinator, which backs the history features."""
+        return self.coordinators[PROVIDER_ALTERNATIVE_ME]
+
+    async def async_setup(self, entry: ConfigEntry) -> None:
+        """Restore the saved value of every provider, then refresh them all.
+
+        This runs in the background once the entry is set up. Restored values
+        are pushed to the entities before the network is asked. A failed first
+        refresh leaves the provider's entities unavailable, and its coordinator
+        retries on its own schedule.
+        """
+        if (replay := self.coordinators.get(PROVIDER_REPLAY)) is not None:
+            # A replay always starts again from the first recorded day.
+            await replay.async_reset_storage()
+
+        coordinators = list(self.coordinators.values())
+        restored = await asyncio.gather(*(coordinator.async_restore() for coordinator in coordinators))
+        for coordinator, was_restored in zip(coordinators, restored):
+            if was_restored:
+                coordinator.async_update_listeners()
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    async def async_request_refresh(self, force: bool = False) -> None:
+        """Refresh all providers at once.
+
+        Without ``force`` the refresh is debounced by the coordinators and served
+        from the clients' response cache when it is still fresh.
+        """
+        await asyncio.gather(
+            *(
+                coordinator.async_force_refresh() if force else coordinator.async_request_refresh()
+                for coordinator in self.coordinators.values()
+            )
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop background work and close the clients of all providers."""
+        for coordinator in self.coordinators.values():
+            await coordinator.statistics.async_stop()
+            await coordinator.client.async_close()
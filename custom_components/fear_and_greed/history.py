@@ -0,0 +1,292 @@
+"""Persistent local history of the Fear and Greed Index."""
+
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from itertools import pairwise
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    RESOLUTION_DAILY,
+    RESOLUTION_MONTHLY,
+    RESOLUTION_WEEKLY,
+)
+
+# Stored arrays are always little endian so the file is portable between hosts.
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+def _encode_array(values: array) -> str:
+    if _SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode_array(typecode: str, encoded: str) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(encoded))
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values
+
+
+def _week_start(timestamp: int) -> int:
+    """Return the start of the ISO week (Monday 00:00 UTC) containing ``timestamp``."""
+    day = timestamp // 86400
+    # The epoch was a Thursday, three days after the start of its week.
+    return (day - (day + 3) % 7) * 86400
+
+
+def _month_start(timestamp: int) -> int:
+    """Return the start of the UTC month containing ``timestamp``."""
+    moment = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return int(datetime(moment.year, moment.month, 1, tzinfo=timezone.utc).timestamp())
+
+
+_BUCKET_STARTS: dict[str, Callable[[int], int]] = {
+    RESOLUTION_WEEKLY: _week_start,
+    RESOLUTION_MONTHLY: _month_start,
+}
+
+
+def _isoformat(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class _Buckets:
+    """Count, sum, minimum and maximum of the values in consecutive time buckets."""
+
+    __slots__ = ("bucket_start", "starts", "counts", "sums", "minimums", "maximums")
+
+    def __init__(self, bucket_start: Callable[[int], int]) -> None:
+        self.bucket_start = bucket_start
+        self.starts = array("q")
+        self.counts = array("H")
+        self.sums = array("L")
+        self.minimums = array("B")
+        self.maximums = array("B")
+
+    def add(self, timestamp: int, value: int) -> None:
+        """Add a point newer than every point added before."""
+        start = self.bucket_start(timestamp)
+        if self.starts and self.starts[-1] == start:
+            self.counts[-1] += 1
+            self.sums[-1] += value
+            self.minimums[-1] = min(self.minimums[-1], value)
+            self.maximums[-1] = max(self.maximums[-1], value)
+            return
+        self.starts.append(start)
+        self.counts.append(1)
+        self.sums.append(value)
+        self.minimums.append(value)
+        self.maximums.append(value)
+
+    def query(self, start: int, end: int) -> list[dict[str, object]]:
+        first = bisect_left(self.starts, self.bucket_start(start))
+        last = bisect_right(self.starts, end)
+        return [
+            {
+                "start": _isoformat(self.starts[position]),
+                "mean": round(self.sums[position] / self.counts[position], 2),
+                "min": self.minimums[position],
+                "max": self.maximums[position],
+                "count": self.counts[position],
+            }
+            for position in range(first, last)
+        ]
+
+
+class FearAndGreedHistory:
+    """Daily index values kept sorted by timestamp in compact parallel arrays.
+
+    Classifications are stored as one byte codes into a table of interned names,
+    so a multi-year history costs a few bytes per day instead of a dict per point.
+
+    Range queries use binary search over the sorted timestamps. Weekly and
+    monthly aggregates are built on first use and then kept up to date as new
+    points are appended.
+    """
+
+    __slots__ = ("timestamps", "values", "classification_codes", "classifications", "_codes", "_buckets")
+
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.values = array("B")
+        self.classification_codes = array("B")
+        self.classifications: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._buckets: dict[str, _Buckets] = {}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def newest_timestamp(self) -> int | None:
+        """Return the timestamp of the most recent point."""
+        return self.timestamps[-1] if self.timestamps else None
+
+    def classification(self, position: int) -> str:
+        """Return the classification of the point at the given position."""
+        return self.classifications[self.classification_codes[position]]
+
+    def points(self) -> Iterator[tuple[int, int, str]]:
+        """Iterate over all points as ``(timestamp, value, classification)``."""
+        names = self.classifications
+        for timestamp, value, code in zip(self.timestamps, self.values, self.classification_codes):
+            yield timestamp, value, names[code]
+
+    def _code(self, classification: str) -> int:
+        code = self._codes.get(classification)
+        if code is None:
+            code = len(self.classifications)
+            self.classifications.append(sys.intern(classification))
+            self._codes[self.classifications[code]] = code
+        return code
+
+    def merge(self, points: Iterable[tuple[int, int, str]]) -> int:
+        """Merge points into the history and return how many were added.
+
+        Points may arrive in any order; timestamps that are already known are
+        ignored. Points newer than the stored history are appended in place.
+        """
+        incoming = sorted(points)
+        if not incoming:
+            return 0
+
+        newest = self.newest_timestamp
+        if newest is not None and incoming[0][0] <= newest:
+            timestamps = self.timestamps
+            known = set(timestamps[bisect_left(timestamps, incoming[0][0]) :])
+            incoming = [point for point in incoming if point[0] not in known]
+            if not incoming:
+                return 0
+            if incoming[0][0] < newest:
+                merged = sorted([*self.points(), *incoming])
+                self._clear()
+                self._extend(merged)
+                return len(incoming)
+
+        self._extend(incoming)
+        return len(incoming)
+
+    def append(self, timestamp: int, value: int, classification: str) -> None:
+        """Append a point without ordering checks; call :meth:`normalize` afterwards."""
+        self._buckets.clear()
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self.classification_codes.append(self._code(classification))
+
+    def normalize(self) -> None:
+        """Sort appended points by timestamp and drop duplicates.
+
+        API responses are ordered newest first, which only needs an in-place
+        reversal of the arrays.
+        """
+        timestamps = self.timestamps
+        if all(earlier < later for earlier, later in pairwise(timestamps)):
+            return
+        if all(earlier > later for earlier, later in pairwise(timestamps)):
+            timestamps.reverse()
+            self.values.reverse()
+            self.classification_codes.reverse()
+            return
+        points = sorted(self.points())
+        self._clear()
+        self._extend(points)
+
+    def _clear(self) -> None:
+        self._buckets.clear()
+        del self.timestamps[:]
+        del self.values[:]
+        del self.classification_codes[:]
+
+    def _extend(self, points: Iterable[tuple[int, int, str]]) -> None:
+        previous = self.newest_timestamp
+        for timestamp, value, classification in points:
+            if timestamp == previous:
+                continue
+            self.timestamps.append(timestamp)
+            self.values.append(value)
+            self.classification_codes.append(self._code(classification))
+            for buckets in self._buckets.values():
+                buckets.add(timestamp, value)
+            previous = timestamp
+
+    def query(self, start: int, end: int, resolution: str = RESOLUTION_DAILY) -> list[dict[str, object]]:
+        """Return the points or bucket aggregates between ``start`` and ``end`` inclusive."""
+        if resolution == RESOLUTION_DAILY:
+            first = bisect_left(self.timestamps, start)
+            last = bisect_right(self.timestamps, end)
+            return [
+                {
+                    "timestamp": _isoformat(self.timestamps[position]),
+                    "value": self.values[position],
+                    "classification": self.classification(position),
+                }
+                for position in range(first, last)
+            ]
+
+        buckets = self._buckets.get(resolution)
+        if buckets is None:
+            buckets = self._buckets[resolution] = _Buckets(_BUCKET_STARTS[resolution])
+            for timestamp, value in zip(self.timestamps, self.values):
+                buckets.add(timestamp, value)
+        return buckets.query(start, end)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a compact, JSON serialisable representation."""
+        return {
+            "timestamps": _encode_array(self.timestamps),
+            "values": _encode_array(self.values),
+            "classification_codes": _encode_array(self.classification_codes),
+            "classifications": list(self.classifications),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> FearAndGreedHistory:
+        """Restore a history created by :meth:`as_dict`."""
+        history = cls()
+        history.timestamps = _decode_array("q", data["timestamps"])
+        history.values = _decode_array("B", data["values"])
+        history.classification_codes = _decode_array("B", data["classification_codes"])
+        for classification in data["classifications"]:
+            history._code(classification)
+        return history
+
+
+class FearAndGreedHistoryStore:
+    """Keep the index history on disk using Home Assistant's storage helper."""
+
+    def __init__(self, hass: HomeAssistant, key: str = HISTORY_STORAGE_KEY) -> None:
+        self._store: Store[dict[str, object]] = Store(hass, HISTORY_STORAGE_VERSION, key)
+        self.history = FearAndGreedHistory()
+        self.loaded = False
+
+    async def async_load(self) -> FearAndGreedHistory:
+        """Load the stored history from disk."""
+        if not self.loaded:
+            data = await self._store.async_load()
+            if data:
+                self.history = FearAndGreedHistory.from_dict(data)
+            self.loaded = True
+        return self.history
+
+    async def async_save(self) -> None:
+        """Persist the current history to disk."""
+        await self._store.async_save(self.history.as_dict())
+
+    async def async_remove(self) -> None:
+        """Forget the history and delete it from disk."""
+        self.history = FearAndGreedHistory()
+        self.loaded = True
+        await self._store.async_remove()
@@ -0,0 +1,78 @@
+"""Change and average of the index over configurable horizons."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import accumulate
+
+from .history import FearAndGreedHistory
+
+DAY = 86400
+
+
+@dataclass(frozen=True, slots=True)
+class HorizonSnapshot:
+    """How the newest value compares with the value ``days`` ago."""
+
+    days: int
+    value_change: int | None
+    value_change_percent: float | None
+    reference_value: int | None
+    average: float
+
+
+class HorizonChanges:
+    """Multi-horizon changes and period averages over the stored history.
+
+    A prefix sum of the values is kept next to the history's sorted timestamps.
+    The reference value of a horizon is found by binary search and the average
+    over the horizon is the difference of two prefix sums, so each horizon
+    costs O(log n) per update. New days extend the prefix sums in place.
+    """
+
+    def __init__(self, horizons: Iterable[int]) -> None:
+        self.horizons = tuple(sorted(set(horizons)))
+        self._prefix = array("q", [0])
+        self._last_timestamp: int | None = None
+        self.snapshots: dict[int, HorizonSnapshot] = {}
+
+    def update(self, history: FearAndGreedHistory) -> None:
+        """Bring the prefix sums up to date and recompute every horizon."""
+        self._extend(history)
+        self.snapshots = {}
+        if not history:
+            return
+        timestamps = history.timestamps
+        values = history.values
+        prefix = self._prefix
+        count = len(timestamps)
+        latest = values[-1]
+        for days in self.horizons:
+            cutoff = timestamps[-1] - days * DAY
+            start = bisect_right(timestamps, cutoff)
+            reference = values[start - 1] if start else None
+            change = latest - reference if reference is not None else None
+            self.snapshots[days] = HorizonSnapshot(
+                days=days,
+                value_change=change,
+                value_change_percent=round(change / reference * 100, 2) if reference else None,
+                reference_value=reference,
+                average=round((prefix[count] - prefix[start]) / (count - start), 2),
+            )
+
+    def _extend(self, history: FearAndGreedHistory) -> None:
+        prefix = self._prefix
+        known = len(prefix) - 1
+        timestamps = history.timestamps
+        if known > len(history) or (known and timestamps[known - 1] != self._last_timestamp):
+            # Older points were inserted by a backfill, so the sums are rebuilt.
+            self._prefix = prefix = array("q", accumulate(history.values, initial=0))
+        else:
+            total = prefix[-1]
+            for position in range(known, len(history)):
+                total += history.values[position]
+                prefix.append(total)
+        self._last_timestamp = timestamps[-1] if timestamps else None
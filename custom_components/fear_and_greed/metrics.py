@@ -0,0 +1,117 @@
+"""Timings and counters describing the integration's own cost."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+# Upper bounds of the histogram buckets, in milliseconds.
+TIMING_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations."""
+
+    __slots__ = ("counts", "count", "total", "maximum", "last")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(TIMING_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.last: float | None = None
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        milliseconds = seconds * 1000
+        self.counts[bisect_left(TIMING_BUCKETS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.maximum = max(self.maximum, milliseconds)
+        self.last = milliseconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"le_{bound}ms" for bound in TIMING_BUCKETS] + ["inf"]
+        return {
+            "count": self.count,
+            "last_ms": round(self.last, 3) if self.last is not None else None,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "max_ms": round(self.maximum, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class ClientMetrics:
+    """Timings and counters of one provider's API client and coordinator.
+
+    Connection and first byte times come from the aiohttp trace hooks of
+    :func:`create_trace_config`; body, parse and entity update times are
+    measured around the code doing that work. Recording is a few clock reads
+    and additions per request, so it is always on.
+    """
+
+    def __init__(self) -> None:
+        self.connect = Histogram()
+        self.first_byte = Histogram()
+        self.body = Histogram()
+        self.parse = Histogram()
+        self.entity_update = Histogram()
+        self.bytes_received = 0
+        self.successes = 0
+        self.failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all timings and counters for diagnostics."""
+        return {
+            "connect": self.connect.as_dict(),
+            "first_byte": self.first_byte.as_dict(),
+            "body": self.body.as_dict(),
+            "parse": self.parse.as_dict(),
+            "entity_update": self.entity_update.as_dict(),
+            "bytes_received": self.bytes_received,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+
+async def _on_request_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+) -> None:
+    context.started = time.perf_counter()
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceConnectionCreateStartParams
+) -> None:
+    context.connecting = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceConnectionCreateEndParams
+) -> None:
+    # Includes the DNS lookup, which happens while the connection is created.
+    if isinstance(context.trace_request_ctx, ClientMetrics):
+        context.trace_request_ctx.connect.observe(time.perf_counter() - context.connecting)
+
+
+async def _on_request_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceRequestEndParams
+) -> None:
+    # Fired once the response headers have been received.
+    if isinstance(context.trace_request_ctx, ClientMetrics):
+        context.trace_request_ctx.first_byte.observe(time.perf_counter() - context.started)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Return trace hooks that record into the metrics passed as ``trace_request_ctx``."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
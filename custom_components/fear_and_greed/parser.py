@@ -0,0 +1,257 @@
+"""Streaming parsers for large Fear and Greed API payloads."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any
+
+from .const import JSON_TIMESTAMP, JSON_VALUE, JSON_VALUE_CLASSIFICATION
+from .history import FearAndGreedHistory
+
+# Fastest available JSON decoder, also used for the small index payloads.
+json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    DECODER = "orjson"
+except ImportError:  # pragma: no cover - depends on the installed packages
+    try:
+        import msgspec
+
+        json_loads = msgspec.json.decode
+        DECODER = "msgspec"
+    except ImportError:
+        json_loads = json.loads
+        DECODER = "json"
+
+_DATA_KEY = b'"data"'
+_SKIPPED = b" \t\r\n,"
+
+_CSV_HEADER = "fng_value"
+_CSV_DATE = "date"
+_CSV_VALUE = "fng_value"
+_CSV_CLASSIFICATION = "fng_classification"
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_DAY = 86400
+
+
+@dataclass
+class ParseStats:
+    """Cost of parsing one payload."""
+
+    decoder: str
+    bytes: int
+    points: int
+    parse_seconds: float
+    peak_buffer_bytes: int
+    array_bytes: int
+
+
+class FearAndGreedStreamParser:
+    """Decode the ``data`` array of an API payload chunk by chunk.
+
+    Each entry of the array is a small flat object. Entries are decoded one at a
+    time as soon as they are complete and their fields are written straight into
+    the typed arrays of a :class:`FearAndGreedHistory`, so only the unparsed tail
+    of the body is ever buffered and no object graph of the payload is built.
+    """
+
+    def __init__(self) -> None:
+        self.history = FearAndGreedHistory()
+        self._buffer = bytearray()
+        self._in_data = False
+        self._done = False
+        self._bytes = 0
+        self._peak_buffer = 0
+        self._elapsed = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse all complete entries available after adding ``chunk``."""
+        start = time.perf_counter()
+        self._bytes += len(chunk)
+        if not self._done:
+            buffer = self._buffer
+            buffer += chunk
+            self._peak_buffer = max(self._peak_buffer, len(buffer))
+            del buffer[: self._consume()]
+        self._elapsed += time.perf_counter() - start
+
+    def _consume(self) -> int:
+        """Parse the buffer and return how many leading bytes were consumed."""
+        buffer = self._buffer
+        position = 0
+
+        if not self._in_data:
+            key = buffer.find(_DATA_KEY)
+            if key == -1:
+                # Keep enough bytes to find a key that is split across chunks.
+                return max(len(buffer) - len(_DATA_KEY), 0)
+            opening = buffer.find(b"[", key + len(_DATA_KEY))
+            if opening == -1:
+                return key
+            self._in_data = True
+            position = opening + 1
+
+        append = self.history.append
+        length = len(buffer)
+        while position < length:
+            byte = buffer[position]
+            if byte in _SKIPPED:
+                position += 1
+            elif byte == 0x5D:  # ]
+                self._done = True
+                return length
+            elif byte == 0x7B:  # {
+                end = buffer.find(b"}", position)
+                if end == -1:
+                    break
+                entry = json_loads(bytes(buffer[position : end + 1]))
+                append(
+                    int(entry[JSON_TIMESTAMP]),
+                    int(entry[JSON_VALUE]),
+                    entry.get(JSON_VALUE_CLASSIFICATION, "unknown"),
+                )
+                position = end + 1
+            else:
+                raise ValueError(f"Unexpected byte {bytes([byte])!r} in Fear and Greed data array")
+        return position
+
+    def close(self) -> FearAndGreedHistory:
+        """Finish parsing and return the history sorted by timestamp."""
+        if not self._done:
+            raise ValueError("Fear and Greed payload ended before the data array was complete")
+        start = time.perf_counter()
+        self.history.normalize()
+        self._elapsed += time.perf_counter() - start
+        return self.history
+
+    @property
+    def stats(self) -> ParseStats:
+        """Return the parse statistics collected so far."""
+        return _parse_stats(DECODER, self.history, self._bytes, self._elapsed, self._peak_buffer)
+
+
+class FearAndGreedCsvParser:
+    """Decode the CSV form of the history line by line.
+
+    With ``format=csv`` the API sends a header line and one
+    ``date,value,classification`` line per day inside a small JSON wrapper, which
+    is about half the size of the JSON form. Complete lines are parsed as the
+    body streams in and written straight into the typed arrays; the wrapper
+    lines around the CSV block are skipped. Dates are days in UTC, which is when
+    the API publishes its values.
+    """
+
+    def __init__(self) -> None:
+        self.history = FearAndGreedHistory()
+        self._buffer = bytearray()
+        self._columns: tuple[int, int, int] | None = None
+        self._done = False
+        self._bytes = 0
+        self._peak_buffer = 0
+        self._elapsed = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse all complete lines available after adding ``chunk``."""
+        start = time.perf_counter()
+        self._bytes += len(chunk)
+        if not self._done:
+            buffer = self._buffer
+            buffer += chunk
+            self._peak_buffer = max(self._peak_buffer, len(buffer))
+            end = buffer.rfind(b"\n")
+            if end != -1:
+                self._consume(buffer[:end].decode().split("\n"))
+                del buffer[: end + 1]
+        self._elapsed += time.perf_counter() - start
+
+    def _consume(self, lines: Iterable[str]) -> None:
+        append = self.history.append
+        for timestamp, value, classification in self._rows(lines):
+            append(timestamp, value, classification)
+
+    def _rows(self, lines: Iterable[str]) -> Iterator[tuple[int, int, str]]:
+        """Yield the points of the CSV lines among ``lines``."""
+        for raw in lines:
+            line = raw.strip()
+            if not line:
+                continue
+            if self._columns is None:
+                if _CSV_HEADER in line:
+                    self._columns = _csv_columns(line.split(","))
+                continue
+            fields = line.split(",")
+            if len(fields) < 3:
+                # The first line after the CSV block closes the wrapper.
+                self._done = True
+                return
+            date_column, value_column, classification_column = self._columns
+            yield (
+                _csv_timestamp(fields[date_column]),
+                int(fields[value_column]),
+                fields[classification_column],
+            )
+
+    def close(self) -> FearAndGreedHistory:
+        """Finish parsing and return the history sorted by timestamp."""
+        start = time.perf_counter()
+        if not self._done and self._buffer:
+            self._consume([self._buffer.decode()])
+            self._buffer.clear()
+        if self._columns is None:
+            raise ValueError("Fear and Greed payload ended before the CSV header")
+        self.history.normalize()
+        self._elapsed += time.perf_counter() - start
+        return self.history
+
+    @property
+    def stats(self) -> ParseStats:
+        """Return the parse statistics collected so far."""
+        return _parse_stats("csv", self.history, self._bytes, self._elapsed, self._peak_buffer)
+
+
+def _parse_stats(
+    decoder: str, history: FearAndGreedHistory, size: int, elapsed: float, peak_buffer: int
+) -> ParseStats:
+    return ParseStats(
+        decoder=decoder,
+        bytes=size,
+        points=len(history),
+        parse_seconds=round(elapsed, 6),
+        peak_buffer_bytes=peak_buffer,
+        array_bytes=sum(
+            values.itemsize * len(values)
+            for values in (history.timestamps, history.values, history.classification_codes)
+        ),
+    )
+
+
+def _csv_columns(header: list[str]) -> tuple[int, int, int]:
+    """Return the positions of the date, value and classification columns."""
+    names = [name.strip() for name in header]
+    try:
+        return names.index(_CSV_DATE), names.index(_CSV_VALUE), names.index(_CSV_CLASSIFICATION)
+    except ValueError as err:
+        raise ValueError(f"Unexpected Fear and Greed CSV header {header!r}") from err
+
+
+def _csv_timestamp(text: str) -> int:
+    """Return the UTC midnight timestamp of a ``dd-mm-yyyy`` or ``yyyy-mm-dd`` date."""
+    first, month, last = text.replace("/", "-").split("-")
+    year, day = (first, last) if len(first) == 4 else (last, first)
+    day_of_month = int(day)
+    if not 1 <= day_of_month <= 31:
+        raise ValueError(f"Invalid date {text!r} in Fear and Greed CSV")
+    return (_month_start(int(year), int(month)) + day_of_month - 1) * _DAY
+
+
+@lru_cache(maxsize=1024)
+def _month_start(year: int, month: int) -> int:
+    """Return the days from the epoch to the first day of a month."""
+    return date(year, month, 1).toordinal() - _EPOCH_ORDINAL
@@ -0,0 +1,75 @@
+"""Index providers supported by the Fear and Greed integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .api import BaseFearAndGreedApiClient, CnnFearAndGreedApiClient, FearAndGreedApiClient
+from .const import (
+    API_ENDPOINT,
+    CNN_API_ENDPOINT,
+    DEFAULT_NAME,
+    DOMAIN,
+    PROVIDER_ALTERNATIVE_ME,
+    PROVIDER_CNN,
+    PROVIDER_REPLAY,
+)
+from .replay import ReplayFearAndGreedApiClient
+
+
+@dataclass(frozen=True, kw_only=True)
+class FearAndGreedProvider:
+    """Describe a source of a Fear and Greed index.
+
+    Each enabled provider gets its own API client, coordinator and device.
+    Only providers with ``has_history`` keep a local history and feed the
+    analytics and long-term statistics.
+    """
+
+    key: str
+    name: str
+    manufacturer: str
+    endpoint: str
+    client_class: type[BaseFearAndGreedApiClient]
+    has_history: bool = False
+
+    @property
+    def attribution(self) -> str:
+        """Return the attribution shown on the provider's sensors."""
+        return f"Data provided by {self.manufacturer}"
+
+    @property
+    def device_identifier(self) -> tuple[str, str]:
+        """Return the identifier of the provider's device; Alternative.me keeps the one it had first."""
+        return (DOMAIN, DOMAIN if self.key == PROVIDER_ALTERNATIVE_ME else self.key)
+
+
+PROVIDERS: dict[str, FearAndGreedProvider] = {
+    PROVIDER_ALTERNATIVE_ME: FearAndGreedProvider(
+        key=PROVIDER_ALTERNATIVE_ME,
+        name=DEFAULT_NAME,
+        manufacturer="Alternative.me",
+        endpoint=API_ENDPOINT,
+        client_class=FearAndGreedApiClient,
+        has_history=True,
+    ),
+    PROVIDER_CNN: FearAndGreedProvider(
+        key=PROVIDER_CNN,
+        name="CNN Fear & Greed Index",
+        manufacturer="CNN",
+        endpoint=CNN_API_ENDPOINT,
+        client_class=CnnFearAndGreedApiClient,
+    ),
+    # The endpoint is the recorded file, set from the options.
+    PROVIDER_REPLAY: FearAndGreedProvider(
+        key=PROVIDER_REPLAY,
+        name=f"{DEFAULT_NAME} (replay)",
+        manufacturer="a recorded history",
+        endpoint="",
+        client_class=ReplayFearAndGreedApiClient,
+        has_history=True,
+    ),
+}
+
+# Providers that can be enabled in addition to Alternative.me.
+OPTIONAL_PROVIDERS = [key for key in PROVIDERS if key not in (PROVIDER_ALTERNATIVE_ME, PROVIDER_REPLAY)]
@@ -0,0 +1,113 @@
+"""Replay a recorded index history on an accelerated clock."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from .api import BaseFearAndGreedApiClient, FearAndGreedApiClientError, FearAndGreedIndex
+from .const import DEFAULT_REPLAY_SPEED
+from .history import FearAndGreedHistory
+from .parser import FearAndGreedCsvParser, FearAndGreedStreamParser, json_loads
+
+
+def load_recording(path: str) -> FearAndGreedHistory:
+    """Read a recorded history; this does blocking I/O.
+
+    Accepted are Alternative.me responses in JSON or CSV, as saved from
+    ``?limit=0`` or ``?limit=0&format=csv``, and the integration's own
+    ``.storage/fear_and_greed.history`` file.
+    """
+    body = Path(path).read_bytes()
+    try:
+        payload = json_loads(body)
+    except ValueError:
+        parser: FearAndGreedStreamParser | FearAndGreedCsvParser = FearAndGreedCsvParser()
+    else:
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if isinstance(data, dict):
+            return FearAndGreedHistory.from_dict(data)
+        parser = FearAndGreedStreamParser()
+    parser.feed(body)
+    history = parser.close()
+    if not history:
+        raise ValueError(f"{path} contains no index values")
+    return history
+
+
+class ReplayFearAndGreedApiClient(BaseFearAndGreedApiClient):
+    """Serve a recorded history as if one day was published every ``seconds_per_day``.
+
+    The recording is loaded on the first request, which starts the clock. The
+    index is the recorded day the clock has reached and the history ends with
+    that day, so the coordinator, sensors, events and statistics run exactly as
+    they do against the API, without any network access. The last day is kept
+    once the recording is exhausted.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        session: aiohttp.ClientSession | None = None,
+        seconds_per_day: float = DEFAULT_REPLAY_SPEED,
+        clock: Callable[[], float] = time.monotonic,
+        **kwargs: Any,
+    ) -> None:
+        # Every request reads the clock, so answers are never cached.
+        super().__init__(endpoint, session, cache_ttl=0)
+        self.seconds_per_day = seconds_per_day
+        self._clock = clock
+        self._recording: FearAndGreedHistory | None = None
+        self._started = 0.0
+
+    async def _async_recording(self) -> FearAndGreedHistory:
+        if self._recording is None:
+            try:
+                self._recording = await asyncio.get_running_loop().run_in_executor(
+                    None, load_recording, self._endpoint
+                )
+            except (OSError, ValueError) as err:
+                raise FearAndGreedApiClientError(f"Unable to load recorded history: {err}") from err
+            self._started = self._clock()
+        return self._recording
+
+    def _position(self, recording: FearAndGreedHistory) -> int:
+        elapsed = self._clock() - self._started
+        return min(int(elapsed / self.seconds_per_day), len(recording) - 1)
+
+    async def _async_fetch_index(self) -> FearAndGreedIndex:
+        return self._parse_index(await self.async_get_history(2), datetime.now(timezone.utc))
+
+    def _parse_index(self, payload: FearAndGreedHistory, fetched_at: datetime) -> FearAndGreedIndex:
+        """Build the index from the last one or two recorded days the clock has reached."""
+        position = len(payload) - 1
+        value = payload.values[position]
+        previous_value = payload.values[position - 1] if position else None
+        value_change = value - previous_value if previous_value is not None else None
+        value_change_percent = (
+            (value_change / previous_value) * 100 if previous_value and value_change is not None else None
+        )
+        return FearAndGreedIndex(
+            value=value,
+            classification=payload.classification(position),
+            previous_value=previous_value,
+            value_change=value_change,
+            value_change_percent=round(value_change_percent, 2) if value_change_percent is not None else None,
+            last_updated=datetime.fromtimestamp(payload.timestamps[position]),
+            fetched_at=fetched_at,
+        )
+
+    async def async_get_history(self, limit: int = 0) -> FearAndGreedHistory:
+        """Return the last ``limit`` recorded days up to the replay clock, or all for ``0``."""
+        recording = await self._async_recording()
+        end = self._position(recording) + 1
+        history = FearAndGreedHistory()
+        history.merge(islice(recording.points(), max(end - limit, 0) if limit else 0, end))
+        return history
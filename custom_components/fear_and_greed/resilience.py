@@ -0,0 +1,127 @@
+"""Retry and circuit breaker helpers for the Fear and Greed API client."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to wait before retrying a failed request."""
+
+    attempts: int = RETRY_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+
+    def delay(self, retry: int, retry_after: float | None = None) -> float:
+        """Return the delay before the given retry, using full jitter.
+
+        A ``Retry-After`` hint from the server replaces the computed delay.
+        """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+def parse_retry_after(header: str | None) -> float | None:
+    """Return the seconds to wait from a ``Retry-After`` header value."""
+    if not header:
+        return None
+    if header.isdigit():
+        return float(header)
+    try:
+        moment = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return None
+    return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitBreaker:
+    """Stop calling the API for a while after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls. Once ``reset_timeout`` seconds have passed a single trial
+    call is let through and other calls are rejected until its outcome closes
+    or reopens the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.times_opened = 0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Return the current breaker state."""
+        if self.opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def allow(self) -> bool:
+        """Return whether a call may be made now; in half-open state only the trial call may."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_OPEN or self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def end_trial(self) -> None:
+        """Let another trial call through after one ended without an outcome."""
+        self._trial_in_flight = False
+
+    def retry_in(self) -> float:
+        """Return the seconds until the breaker lets a trial call through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.reset_timeout - (time.monotonic() - self.opened_at), 0.0)
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the breaker when the threshold is reached."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                self.times_opened += 1
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "retry_in": round(self.retry_in(), 1),
+        }
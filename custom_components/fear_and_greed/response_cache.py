@@ -0,0 +1,134 @@
+"""Disk-backed cache of API responses shared by all clients."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_SAVE_DELAY,
+    RESPONSE_CACHE_STORAGE_KEY,
+    RESPONSE_CACHE_STORAGE_VERSION,
+)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A response body with its fetch time, expiry and validators.
+
+    Times are Unix timestamps, so entries stay meaningful across restarts.
+    """
+
+    body: str
+    fetched_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Return whether the response may be used without asking the API."""
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Return the headers of a conditional request for this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Keep recent API responses on disk so restarts and reloads can reuse them.
+
+    Entries are keyed by endpoint and query parameters. A fresh entry answers
+    without a request; an expired one is revalidated with its ``ETag`` or
+    ``Last-Modified`` header. At most ``max_entries`` responses are kept and the
+    least recently used one is dropped first. Saves are delayed, so several
+    updates are written together, and atomic, so a crash never leaves a
+    truncated file behind.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, RESPONSE_CACHE_STORAGE_VERSION, RESPONSE_CACHE_STORAGE_KEY, atomic_writes=True
+        )
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.max_entries = max_entries
+        self.loaded = False
+        self.hits = 0
+        self.revalidated = 0
+        self.stored = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(endpoint: str, params: dict[str, Any] | None) -> str:
+        """Return the cache key of a request."""
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    async def async_load(self) -> None:
+        """Load the saved responses, oldest use first; later calls do nothing."""
+        if self.loaded:
+            return
+        self.loaded = True
+        data = await self._store.async_load()
+        for key, entry in (data or {}).get("entries", []):
+            try:
+                self._entries[key] = CachedResponse(**entry)
+            except TypeError:
+                continue
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the response saved for ``key``, fresh or not."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get_fresh(self, key: str) -> CachedResponse | None:
+        """Return the response saved for ``key`` if it has not expired yet."""
+        entry = self.get(key)
+        if entry is None or not entry.fresh:
+            return None
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Save a new response, dropping the least recently used ones over the limit."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self.stored += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._store.async_delay_save(self._data_to_save, RESPONSE_CACHE_SAVE_DELAY)
+
+    def revalidate(self, key: str, expires_at: float) -> None:
+        """Extend a saved response the API confirmed as unchanged."""
+        self._entries[key].expires_at = expires_at
+        self.revalidated += 1
+        self._store.async_delay_save(self._data_to_save, RESPONSE_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"entries": [[key, asdict(entry)] for key, entry in self._entries.items()]}
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the cache counters for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "stored": self.stored,
+            "evictions": self.evictions,
+        }
@@ -2,59 +2,253 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTR_CLASSIFICATION, DEFAULT_NAME, DOMAIN
+from .analytics import AnalyticsSnapshot
+from .horizons import HorizonSnapshot
+from .const import (
+    ANALYTICS_EMA_SPAN,
+    ANALYTICS_EXTREME_WINDOW,
+    ANALYTICS_MOVING_AVERAGES,
+    ATTR_AVERAGE,
+    ATTR_CHANGE_PERCENT,
+    ATTR_REFERENCE_VALUE,
+    ATTR_SPARKLINE,
+    DOMAIN,
+    PROVIDER_ALTERNATIVE_ME,
+    SIGNAL_METRICS_UPDATED,
+)
+from .metrics import ClientMetrics, Histogram
+from .providers import PROVIDERS
 
 
-@dataclass
-class FearAndGreedEntityDescription:
+@dataclass(frozen=True, kw_only=True)
+class FearAndGreedEntityDescription(SensorEntityDescription):
     """Describe Fear and Greed sensors."""
 
-    key: str
-    name: str
-    device_class: SensorDeviceClass | None = None
-    native_unit_of_measurement: str | None = None
+
+@dataclass(frozen=True, kw_only=True)
+class FearAndGreedAnalyticsEntityDescription(FearAndGreedEntityDescription):
+    """Describe sensors for rolling analytics metrics."""
+
+    value_fn: Callable[[AnalyticsSnapshot], float | int | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class FearAndGreedHorizonEntityDescription(FearAndGreedEntityDescription):
+    """Describe sensors for the change of the index over a number of days."""
+
+    days: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class FearAndGreedMetricsEntityDescription(FearAndGreedEntityDescription):
+    """Describe diagnostic sensors for the integration's own timings and counters."""
+
+    value_fn: Callable[[ClientMetrics], float | int | None]
+
+
+def _moving_average_description(window: int) -> FearAndGreedAnalyticsEntityDescription:
+    return FearAndGreedAnalyticsEntityDescription(
+        key=f"moving_average_{window}d",
+        name=f"{window}-day moving average",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.moving_averages[window],
+    )
+
+
+ANALYTICS_SENSORS: tuple[FearAndGreedAnalyticsEntityDescription, ...] = (
+    *(_moving_average_description(window) for window in ANALYTICS_MOVING_AVERAGES),
+    FearAndGreedAnalyticsEntityDescription(
+        key="ema",
+        name=f"{ANALYTICS_EMA_SPAN}-day EMA",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.ema,
+    ),
+    FearAndGreedAnalyticsEntityDescription(
+        key="rolling_min",
+        name=f"{ANALYTICS_EXTREME_WINDOW}-day low",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.rolling_min,
+    ),
+    FearAndGreedAnalyticsEntityDescription(
+        key="rolling_max",
+        name=f"{ANALYTICS_EXTREME_WINDOW}-day high",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.rolling_max,
+    ),
+    FearAndGreedAnalyticsEntityDescription(
+        key="percentile_rank",
+        name="1-year percentile rank",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.percentile_rank,
+    ),
+    FearAndGreedAnalyticsEntityDescription(
+        key="z_score",
+        name="1-year z-score",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.z_score,
+    ),
+)
+
+
+def _horizon_description(days: int) -> FearAndGreedHorizonEntityDescription:
+    return FearAndGreedHorizonEntityDescription(
+        key=f"change_{days}d",
+        name=f"{days}-day change",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        days=days,
+    )
+
+
+def _timing_description(
+    key: str, name: str, histogram: Callable[[ClientMetrics], Histogram]
+) -> FearAndGreedMetricsEntityDescription:
+    return FearAndGreedMetricsEntityDescription(
+        key=key,
+        name=name,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: None if histogram(metrics).last is None else round(histogram(metrics).last, 3),
+    )
+
+
+METRICS_SENSORS: tuple[FearAndGreedMetricsEntityDescription, ...] = (
+    _timing_description("connect_time", "API connect time", lambda metrics: metrics.connect),
+    _timing_description("first_byte_time", "API time to first byte", lambda metrics: metrics.first_byte),
+    _timing_description("body_time", "API body download time", lambda metrics: metrics.body),
+    _timing_description("parse_time", "API parse time", lambda metrics: metrics.parse),
+    _timing_description("entity_update_time", "Entity update time", lambda metrics: metrics.entity_update),
+    FearAndGreedMetricsEntityDescription(
+        key="bytes_received",
+        name="API bytes received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.bytes_received,
+    ),
+    FearAndGreedMetricsEntityDescription(
+        key="successful_requests",
+        name="API successful requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.successes,
+    ),
+    FearAndGreedMetricsEntityDescription(
+        key="failed_requests",
+        name="API failed requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.failures,
+    ),
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up Fear and Greed sensors."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
 
-    sensors: list[SensorEntity] = [
-        FearAndGreedIndexSensor(coordinator),
-        FearAndGreedSentimentSensor(coordinator),
-    ]
+    sensors: list[SensorEntity] = []
+    for coordinator in data["engine"].coordinators.values():
+        sensors.append(FearAndGreedIndexSensor(coordinator))
+        sensors.append(FearAndGreedSentimentSensor(coordinator))
+        sensors.append(FearAndGreedSentimentLevelSensor(coordinator))
+        if coordinator.history_store is not None:
+            sensors.extend(
+                FearAndGreedAnalyticsSensor(coordinator, description) for description in ANALYTICS_SENSORS
+            )
+            sensors.extend(
+                FearAndGreedChangeSensor(coordinator, _horizon_description(days))
+                for days in coordinator.horizons.horizons
+            )
+        sensors.extend(FearAndGreedMetricsSensor(coordinator, description) for description in METRICS_SENSORS)
 
     async_add_entities(sensors)
 
 
 class FearAndGreedBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base sensor for Fear and Greed data."""
+    """Base sensor for Fear and Greed data.
+
+    The state is only written when what the entity shows has changed, so
+    repeated polls of an unchanged index do not create state changed events
+    or recorder rows.
+    """
 
     _attr_has_entity_name = True
-    _attr_attribution = "Data provided by Alternative.me"
 
-    def __init__(self, coordinator) -> None:
+    def __init__(self, coordinator, description: FearAndGreedEntityDescription | None = None) -> None:
         super().__init__(coordinator)
-        self._attr_unique_id = f"{DOMAIN}_{self.entity_description.key}"
+        if description is not None:
+            self.entity_description = description
+        self._provider = PROVIDERS[coordinator.provider]
+        self._attr_attribution = self._provider.attribution
+        # Alternative.me keeps the identifiers it had before other providers existed.
+        prefix = DOMAIN if self._provider.key == PROVIDER_ALTERNATIVE_ME else f"{DOMAIN}_{self._provider.key}"
+        self._attr_unique_id = f"{prefix}_{self.entity_description.key}"
+        self.entity_id = f"{SENSOR_DOMAIN}.{self._attr_unique_id}"
+        self._written: tuple[bool, Any] | None = None
+
+    def _state_key(self) -> Any:
+        """Return the data the entity's state and attributes are built from."""
+        return self.coordinator.data
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The platform writes the initial state right after this returns.
+        self._written = (self.available, self._state_key())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        written = (self.available, self._state_key())
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
+        provider = self._provider
         return {
-            "identifiers": {(DOMAIN, DOMAIN)},
-            "name": DEFAULT_NAME,
-            "manufacturer": "Alternative.me",
+            "identifiers": {provider.device_identifier},
+            "name": provider.name,
+            "manufacturer": provider.manufacturer,
             "entry_type": "service",
         }
 
@@ -65,9 +259,20 @@ class FearAndGreedIndexSensor(FearAndGreedBaseSensor):
     entity_description = FearAndGreedEntityDescription(
         key="index",
         name="Index",
-        device_class=SensorDeviceClass.MEASUREMENT,
+        state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
     )
+    # The sparkline is for dashboards; keeping it out of the recorder stops it
+    # from being stored again with every state change.
+    _unrecorded_attributes = frozenset({ATTR_SPARKLINE})
+
+    def __init__(self, coordinator, description: FearAndGreedEntityDescription | None = None) -> None:
+        super().__init__(coordinator, description)
+        self._attributes: dict[str, Any] = {}
+        self._attributes_source: tuple[Any, Any] = (None, None)
+
+    def _state_key(self) -> Any:
+        return (self.coordinator.data, self.coordinator.sparkline)
 
     @property
     def native_value(self) -> int | None:
@@ -79,10 +284,14 @@ class FearAndGreedIndexSensor(FearAndGreedBaseSensor):
         index = self.coordinator.data
         if not index:
             return {}
-        return {
-            **index.as_sensor_attributes,
-            ATTR_CLASSIFICATION: index.classification,
-        }
+        sparkline = self.coordinator.sparkline
+        if not sparkline:
+            return index.as_sensor_attributes
+        source_index, source_sparkline = self._attributes_source
+        if source_index is not index or source_sparkline is not sparkline:
+            self._attributes = {**index.as_sensor_attributes, ATTR_SPARKLINE: sparkline}
+            self._attributes_source = (index, sparkline)
+        return self._attributes
 
 
 class FearAndGreedSentimentSensor(FearAndGreedBaseSensor):
@@ -93,6 +302,11 @@ class FearAndGreedSentimentSensor(FearAndGreedBaseSensor):
         name="Sentiment",
     )
 
+    def _state_key(self) -> Any:
+        index = self.coordinator.data
+        # Unknown names take their icon from the value band, which can change on its own.
+        return (index.classification, index.sentiment) if index else None
+
     @property
     def native_value(self) -> str | None:
         index = self.coordinator.data
@@ -101,15 +315,104 @@ class FearAndGreedSentimentSensor(FearAndGreedBaseSensor):
     @property
     def icon(self) -> str:
         index = self.coordinator.data
-        if not index:
-            return "mdi:help-circle"
-        classification = index.classification.lower()
-        if "extreme" in classification and "fear" in classification:
-            return "mdi:emoticon-dead-outline"
-        if "fear" in classification:
-            return "mdi:emoticon-sad-outline"
-        if "greed" in classification and "extreme" in classification:
-            return "mdi:emoticon-devil-outline"
-        if "greed" in classification:
-            return "mdi:emoticon-excited-outline"
-        return "mdi:emoticon-neutral-outline"
+        return index.sentiment.icon if index else "mdi:help-circle"
+
+
+class FearAndGreedSentimentLevelSensor(FearAndGreedBaseSensor):
+    """Sensor for the sentiment class as a number from 0 (extreme fear) to 4 (extreme greed)."""
+
+    entity_description = FearAndGreedEntityDescription(
+        key="sentiment_level",
+        name="Sentiment level",
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+
+    def _state_key(self) -> Any:
+        index = self.coordinator.data
+        return index.sentiment if index else None
+
+    @property
+    def native_value(self) -> int | None:
+        index = self.coordinator.data
+        return index.sentiment.level if index else None
+
+    @property
+    def icon(self) -> str:
+        index = self.coordinator.data
+        return index.sentiment.icon if index else "mdi:help-circle"
+
+
+class FearAndGreedAnalyticsSensor(FearAndGreedBaseSensor):
+    """Sensor for a rolling metric computed from the local history."""
+
+    entity_description: FearAndGreedAnalyticsEntityDescription
+
+    def _state_key(self) -> Any:
+        return self.native_value
+
+    @property
+    def native_value(self) -> float | int | None:
+        analytics = self.coordinator.analytics
+        snapshot = analytics.snapshot if analytics else None
+        return self.entity_description.value_fn(snapshot) if snapshot else None
+
+
+class FearAndGreedChangeSensor(FearAndGreedBaseSensor):
+    """Sensor for the change of the index over a horizon, with the period's average."""
+
+    entity_description: FearAndGreedHorizonEntityDescription
+
+    def _state_key(self) -> Any:
+        return self._snapshot
+
+    @property
+    def _snapshot(self) -> HorizonSnapshot | None:
+        return self.coordinator.horizons.snapshots.get(self.entity_description.days)
+
+    @property
+    def native_value(self) -> int | None:
+        snapshot = self._snapshot
+        return snapshot.value_change if snapshot else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        snapshot = self._snapshot
+        if not snapshot:
+            return {}
+        return {
+            ATTR_CHANGE_PERCENT: snapshot.value_change_percent,
+            ATTR_REFERENCE_VALUE: snapshot.reference_value,
+            ATTR_AVERAGE: snapshot.average,
+        }
+
+
+class FearAndGreedMetricsSensor(FearAndGreedBaseSensor):
+    """Diagnostic sensor for a timing or counter of the provider's requests.
+
+    Besides coordinator updates it listens for the signal sent after every
+    refresh, since refreshes that return an unchanged index still cost time.
+    Disabled entities are never added, so they add no listeners.
+    """
+
+    entity_description: FearAndGreedMetricsEntityDescription
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_METRICS_UPDATED.format(self.coordinator.provider),
+                self._handle_coordinator_update,
+            )
+        )
+
+    def _state_key(self) -> Any:
+        return self.native_value
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        return self.entity_description.value_fn(self.coordinator.client.metrics)
@@ -0,0 +1,58 @@
+"""Downsample the index history into a compact series for dashboards."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from .history import FearAndGreedHistory
+
+
+def lttb(timestamps: Sequence[int], values: Sequence[int], points: int) -> list[tuple[int, int]]:
+    """Reduce a series to ``points`` points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. Every bucket in between contributes
+    the point forming the largest triangle with the point chosen for the
+    previous bucket and the mean of the next bucket, which preserves peaks and
+    troughs far better than averaging.
+    """
+    count = len(timestamps)
+    if points >= count or points < 3:
+        return list(zip(timestamps, values))
+
+    sampled = [(timestamps[0], values[0])]
+    size = (count - 2) / (points - 2)
+    chosen = 0
+    for bucket in range(points - 2):
+        start = int(bucket * size) + 1
+        end = int((bucket + 1) * size) + 1
+        following_end = min(int((bucket + 2) * size) + 1, count)
+        following = range(end, following_end)
+        mean_x = sum(timestamps[i] for i in following) / len(following)
+        mean_y = sum(values[i] for i in following) / len(following)
+
+        chosen_x = timestamps[chosen]
+        chosen_y = values[chosen]
+        best_area = -1.0
+        best = start
+        for position in range(start, end):
+            area = abs(
+                (chosen_x - mean_x) * (values[position] - chosen_y)
+                - (chosen_x - timestamps[position]) * (mean_y - chosen_y)
+            )
+            if area > best_area:
+                best_area = area
+                best = position
+        sampled.append((timestamps[best], values[best]))
+        chosen = best
+    sampled.append((timestamps[-1], values[-1]))
+    return sampled
+
+
+def sparkline(history: FearAndGreedHistory, days: int, points: int) -> tuple[tuple[int, int], ...]:
+    """Return the last ``days`` of history downsampled to ``points`` ``(timestamp, value)`` pairs."""
+    newest = history.newest_timestamp
+    if newest is None or not points:
+        return ()
+    first = bisect_left(history.timestamps, newest - days * 86400)
+    return tuple(lttb(history.timestamps[first:], history.values[first:], points))
@@ -0,0 +1,130 @@
+"""Import the index history into Home Assistant's long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DEFAULT_NAME,
+    DOMAIN,
+    PROVIDER_ALTERNATIVE_ME,
+    STATISTIC_ID,
+    STATISTICS_IMPORT_BATCH_SIZE,
+    STATISTICS_STORAGE_KEY,
+    STATISTICS_STORAGE_VERSION,
+)
+from .history import FearAndGreedHistory
+
+if TYPE_CHECKING:
+    # The recorder is slow to import and only needed once an import runs.
+    from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _statistic_metadata(provider: str) -> StatisticMetaData:
+    """Return the metadata of a provider's statistic; only Alternative.me uses the plain id."""
+    primary = provider == PROVIDER_ALTERNATIVE_ME
+    return {
+        "has_mean": True,
+        "has_sum": False,
+        "name": DEFAULT_NAME if primary else f"{DEFAULT_NAME} ({provider})",
+        "source": DOMAIN,
+        "statistic_id": STATISTIC_ID if primary else f"{STATISTIC_ID}_{provider}",
+        "unit_of_measurement": PERCENTAGE,
+    }
+
+
+class FearAndGreedStatisticsImporter:
+    """Copy daily index values into the recorder as external statistics.
+
+    Points are inserted in bounded batches and the importer waits for the
+    recorder to drain its queue between batches. The newest imported timestamp
+    is stored after every batch, so an interrupted import resumes where it
+    stopped and daily updates only add the new rows.
+    """
+
+    def __init__(self, hass: HomeAssistant, provider: str = PROVIDER_ALTERNATIVE_ME) -> None:
+        self._hass = hass
+        self.metadata = _statistic_metadata(provider)
+        self._store: Store[dict[str, int]] = Store(
+            hass,
+            STATISTICS_STORAGE_VERSION,
+            STATISTICS_STORAGE_KEY if provider == PROVIDER_ALTERNATIVE_ME else f"{STATISTICS_STORAGE_KEY}.{provider}",
+        )
+        self._task: asyncio.Task[None] | None = None
+        self.last_imported: int | None = None
+        self._loaded = False
+
+    def async_schedule(self, history: FearAndGreedHistory) -> None:
+        """Start importing points newer than the last import in the background."""
+        if "recorder" not in self._hass.config.components:
+            return
+        if self._task is not None and not self._task.done():
+            # A running import picks up the newest points once it reaches them.
+            return
+        self._task = self._hass.async_create_background_task(
+            self.async_import(history), f"{DOMAIN} statistics import"
+        )
+
+    async def async_import(self, history: FearAndGreedHistory) -> int:
+        """Import all points newer than the last import and return how many were added."""
+        from homeassistant.components.recorder import get_instance
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        if not self._loaded:
+            data = await self._store.async_load()
+            self.last_imported = data.get("last_imported") if data else None
+            self._loaded = True
+
+        imported = 0
+        timestamps = history.timestamps
+        start = bisect_right(timestamps, self.last_imported) if self.last_imported is not None else 0
+        recorder = get_instance(self._hass)
+
+        while start < len(timestamps):
+            end = min(start + STATISTICS_IMPORT_BATCH_SIZE, len(timestamps))
+            async_add_external_statistics(
+                self._hass,
+                self.metadata,
+                [self._statistic(timestamps[position], history.values[position]) for position in range(start, end)],
+            )
+            await recorder.async_block_till_done()
+
+            self.last_imported = timestamps[end - 1]
+            await self._store.async_save({"last_imported": self.last_imported})
+            imported += end - start
+            start = end
+
+        if imported:
+            _LOGGER.debug("Imported %s Fear and Greed values into long-term statistics", imported)
+        return imported
+
+    @staticmethod
+    def _statistic(timestamp: int, value: int) -> StatisticData:
+        start = datetime.fromtimestamp(timestamp - timestamp % 3600, tz=timezone.utc)
+        return {"start": start, "mean": value, "min": value, "max": value}
+
+    async def async_reset(self) -> None:
+        """Forget how far the import got, so the next one starts from the beginning."""
+        await self.async_stop()
+        self.last_imported = None
+        self._loaded = True
+        await self._store.async_remove()
+
+    async def async_stop(self) -> None:
+        """Cancel a running import."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
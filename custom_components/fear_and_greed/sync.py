@@ -0,0 +1,58 @@
+"""Plan history requests that fetch only the days missing locally."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import islice, pairwise
+
+from .const import HISTORY_SYNC_MAX_GAP_DAYS
+from .history import FearAndGreedHistory
+
+DAY = 86400
+# Publication times drift a little, so consecutive days may be slightly more than 24 hours apart.
+_GAP_TOLERANCE = DAY + DAY // 2
+
+
+@dataclass(frozen=True, slots=True)
+class SyncPlan:
+    """A history request: the API ``limit`` and the newest point known before it."""
+
+    limit: int
+    since: int | None = None
+
+    @property
+    def full(self) -> bool:
+        """Return whether the plan fetches the complete history."""
+        return self.limit == 0
+
+
+def plan_sync(
+    history: FearAndGreedHistory, latest: int, max_gap_days: int = HISTORY_SYNC_MAX_GAP_DAYS
+) -> SyncPlan | None:
+    """Return the request that fills the history up to ``latest``, or ``None`` if nothing is missing.
+
+    ``latest`` is the timestamp of the newest value the API published. The
+    request overlaps the newest known point by one day, so the merge can
+    confirm where the new points join the history.
+    """
+    newest = history.newest_timestamp
+    if newest is None:
+        return SyncPlan(0)
+    days = round((latest - newest) / DAY)
+    if days <= 1:
+        return None
+    if days > max_gap_days:
+        return SyncPlan(0, newest)
+    return SyncPlan(days + 1, newest)
+
+
+def find_gaps(history: FearAndGreedHistory, since: int = 0) -> list[tuple[int, int]]:
+    """Return the ``(before, after)`` timestamps of missing days from ``since`` on."""
+    timestamps = history.timestamps
+    start = bisect_left(timestamps, since)
+    return [
+        (before, after)
+        for before, after in pairwise(islice(timestamps, start, None))
+        if after - before > _GAP_TOLERANCE
+    ]
@@ -0,0 +1,111 @@
+"""Detect threshold crossings and classification changes of an index."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from .const import (
+    DIRECTION_DOWN,
+    DIRECTION_UP,
+    EVENT_CLASSIFICATION_CHANGED,
+    EVENT_THRESHOLD_CROSSED,
+)
+from .history import FearAndGreedHistory
+
+
+class ThresholdTracker:
+    """Turn a sequence of index values into transition events.
+
+    A threshold counts as crossed upwards once the value rises above
+    ``threshold + hysteresis`` and downwards once it falls below
+    ``threshold - hysteresis``, so values wobbling around a level do not
+    produce a stream of events. The first value only sets the starting side.
+    """
+
+    __slots__ = ("thresholds", "hysteresis", "_above", "_value", "_classification")
+
+    def __init__(self, thresholds: Sequence[int], hysteresis: int) -> None:
+        self.thresholds = tuple(sorted(set(thresholds)))
+        self.hysteresis = hysteresis
+        self._above: list[bool] | None = None
+        self._value: int | None = None
+        self._classification: str | None = None
+
+    def seed(self, value: int, classification: str) -> None:
+        """Set the starting state without producing events."""
+        self._above = [value > threshold for threshold in self.thresholds]
+        self._value = value
+        self._classification = classification
+
+    def update(self, value: int, classification: str, timestamp: datetime) -> list[tuple[str, dict[str, Any]]]:
+        """Return the events caused by a new value, as ``(event_type, data)`` pairs."""
+        if self._above is None:
+            self.seed(value, classification)
+            return []
+
+        events: list[tuple[str, dict[str, Any]]] = []
+        when = timestamp.isoformat()
+        hysteresis = self.hysteresis
+        above = self._above
+        for position, threshold in enumerate(self.thresholds):
+            if above[position]:
+                if value < threshold - hysteresis:
+                    above[position] = False
+                    direction = DIRECTION_DOWN
+                else:
+                    continue
+            elif value > threshold + hysteresis:
+                above[position] = True
+                direction = DIRECTION_UP
+            else:
+                continue
+            events.append(
+                (
+                    EVENT_THRESHOLD_CROSSED,
+                    {
+                        "threshold": threshold,
+                        "direction": direction,
+                        "value": value,
+                        "previous_value": self._value,
+                        "timestamp": when,
+                    },
+                )
+            )
+
+        if classification != self._classification:
+            events.append(
+                (
+                    EVENT_CLASSIFICATION_CHANGED,
+                    {
+                        "classification": classification,
+                        "previous_classification": self._classification,
+                        "value": value,
+                        "timestamp": when,
+                    },
+                )
+            )
+
+        self._value = value
+        self._classification = classification
+        return events
+
+
+def replay(
+    history: FearAndGreedHistory,
+    thresholds: Sequence[int],
+    hysteresis: int,
+    start: int,
+    end: int,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield the events a tracker would have produced between two timestamps."""
+    tracker = ThresholdTracker(thresholds, hysteresis)
+    timestamps = history.timestamps
+    for position in range(bisect_left(timestamps, start), bisect_right(timestamps, end)):
+        yield from tracker.update(
+            history.values[position],
+            history.classification(position),
+            datetime.fromtimestamp(timestamps[position], tz=timezone.utc),
+        )
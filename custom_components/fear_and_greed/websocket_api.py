@@ -0,0 +1,91 @@
+"""Websocket commands for dashboard cards."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_END, ATTR_POINTS, ATTR_START, DOMAIN, WS_TYPE_HISTORY, WS_TYPE_SUBSCRIBE
+from .coordinator import FearAndGreedDataUpdateCoordinator
+from .sparkline import lttb
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands; registering again replaces them."""
+    websocket_api.async_register_command(hass, websocket_history)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _coordinator(hass: HomeAssistant) -> FearAndGreedDataUpdateCoordinator | None:
+    entries = hass.data.get(DOMAIN)
+    if not entries:
+        return None
+    return next(iter(entries.values()))["coordinator"]
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_HISTORY,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_POINTS): vol.All(vol.Coerce(int), vol.Range(min=3, max=10000)),
+    }
+)
+@websocket_api.async_response
+async def websocket_history(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return ``[timestamp, value]`` pairs for a time range, optionally downsampled."""
+    coordinator = _coordinator(hass)
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Fear and Greed is not set up")
+        return
+
+    history = await coordinator.async_load_history()
+    timestamps = history.timestamps
+    first = bisect_left(timestamps, int(dt_util.as_timestamp(msg[ATTR_START]))) if ATTR_START in msg else 0
+    last = bisect_right(timestamps, int(dt_util.as_timestamp(msg[ATTR_END]))) if ATTR_END in msg else len(timestamps)
+
+    points = lttb(timestamps[first:last], history.values[first:last], msg.get(ATTR_POINTS, 0))
+    connection.send_result(msg["id"], {ATTR_POINTS: points})
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_SUBSCRIBE})
+@websocket_api.async_response
+async def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Push ``[timestamp, value, classification]`` for every point added after subscribing."""
+    coordinator = _coordinator(hass)
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Fear and Greed is not set up")
+        return
+
+    # Start from the history on disk, so points stored before the first sync are not pushed again.
+    last_sent = (await coordinator.async_load_history()).newest_timestamp
+
+    @callback
+    def async_forward_new_points() -> None:
+        nonlocal last_sent
+        history = coordinator.history
+        timestamps = history.timestamps
+        start = bisect_right(timestamps, last_sent) if last_sent is not None else 0
+        if start >= len(timestamps):
+            return
+        points = [
+            [timestamps[position], history.values[position], history.classification(position)]
+            for position in range(start, len(timestamps))
+        ]
+        last_sent = timestamps[-1]
+        connection.send_message(websocket_api.event_message(msg["id"], {ATTR_POINTS: points}))
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(async_forward_new_points)
+    connection.send_result(msg["id"])
@@ -0,0 +1 @@
+"""Performance benchmarks for the Fear and Greed integration."""
@@ -0,0 +1,56 @@
+"""Fixtures for the benchmarks and the comparison against the stored baseline."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from .fake_api import FakeFearAndGreedApi
+
+BASELINE = Path(__file__).with_name("baseline.json")
+# Set to store the results of this run as the new baseline.
+UPDATE_BASELINE = "BENCHMARK_UPDATE_BASELINE"
+# Slowdowns beyond this ratio are reported as regressions.
+REGRESSION_THRESHOLD = 1.25
+
+
+@pytest_asyncio.fixture
+async def fake_api(socket_enabled):
+    """Start a local fake Alternative.me API."""
+    server = FakeFearAndGreedApi()
+    await server.start()
+    yield server
+    await server.close()
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Collect measurements and compare them with the baseline after the run.
+
+    Metrics ending in ``_per_s`` are throughputs, where higher is better; all
+    others are costs, where lower is better.
+    """
+    results: dict[str, float] = {}
+    yield results
+    if not results:
+        return
+
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    print("\nbenchmark results (baseline -> current):")
+    for name, value in sorted(results.items()):
+        previous = baseline.get(name)
+        if not previous:
+            print(f"  {name}: {value:.4g} (new)")
+            continue
+        ratio = previous / value if name.endswith("_per_s") else value / previous
+        marker = "  REGRESSION" if ratio > REGRESSION_THRESHOLD else ""
+        print(f"  {name}: {previous:.4g} -> {value:.4g} ({ratio:.2f}x cost){marker}")
+
+    if os.environ.get(UPDATE_BASELINE):
+        rounded = {name: round(value, 3) for name, value in results.items()}
+        BASELINE.write_text(json.dumps({**baseline, **rounded}, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {BASELINE}")
@@ -0,0 +1,120 @@
+"""Local stand-in for the Alternative.me Fear and Greed API."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timezone
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+DAY = 86400
+CLASSIFICATIONS = ((25, "Extreme Fear"), (47, "Fear"), (55, "Neutral"), (75, "Greed"), (101, "Extreme Greed"))
+
+
+def _classify(value: int) -> str:
+    return next(name for upper, name in CLASSIFICATIONS if value < upper)
+
+
+def history_payload(days: int, seed: int = 1) -> dict[str, object]:
+    """Return a payload with ``days`` daily points, newest first, like the real API."""
+    rng = random.Random(seed)
+    newest = int(time.time()) // DAY * DAY
+    value = 50
+    data = []
+    for day in range(days):
+        value = min(max(value + rng.randint(-6, 6), 0), 100)
+        data.append(
+            {
+                "value": str(value),
+                "value_classification": _classify(value),
+                "timestamp": str(newest - day * DAY),
+            }
+        )
+    if data:
+        data[0]["time_until_update"] = "3600"
+    return {"name": "Fear and Greed Index", "data": data, "metadata": {"error": None}}
+
+
+def _csv_body(data: list[dict[str, str]]) -> bytes:
+    """Return CSV lines inside the JSON wrapper the real API puts around them."""
+    lines = "".join(
+        f"{datetime.fromtimestamp(int(point['timestamp']), timezone.utc):%d-%m-%Y},"
+        f"{point['value']},{point['value_classification']}\n"
+        for point in data
+    )
+    return (
+        '{\n\t"name": "Fear and Greed Index",\n\t"data": [\n\t\t\n'
+        f"date,fng_value,fng_classification\n{lines}"
+        '\t],\n\t"metadata": {\n\t\t"error": null\n\t}\n}'
+    ).encode()
+
+
+class FakeFearAndGreedApi:
+    """Serve generated index payloads with optional latency and errors.
+
+    ``limit=2`` returns the latest two points and ``limit=0`` the full history,
+    as the real endpoint does, in JSON or with ``format=csv`` as CSV. Bodies are
+    encoded once per limit and format so the server does not distort the client
+    side measurements.
+    """
+
+    def __init__(self, days: int = 2000) -> None:
+        self.payload = history_payload(days)
+        self.latency = 0.0
+        self.fail_next = 0
+        self.error_status = 503
+        self.requests = 0
+        self.peers: list[int] = []
+        self._bodies: dict[tuple[int, str], bytes] = {}
+        app = web.Application()
+        app.router.add_get("/fng/", self._handle)
+        self._server = TestServer(app)
+
+    @property
+    def url(self) -> str:
+        """Return the endpoint URL to give to the client."""
+        return str(self._server.make_url("/fng/"))
+
+    def set_days(self, days: int) -> None:
+        """Replace the served history with ``days`` generated points."""
+        self.payload = history_payload(days)
+        self._bodies.clear()
+
+    def set_latest(self, value: int) -> None:
+        """Publish ``value`` as the newest point, as if a new day had started."""
+        self.payload["data"][0].update(value=str(value), value_classification=_classify(value))
+        self._bodies.clear()
+
+    def body(self, limit: int, fmt: str = "json") -> bytes:
+        """Return the encoded response body for ``limit`` and ``fmt``."""
+        key = (limit, fmt)
+        if key not in self._bodies:
+            data = self.payload["data"][:limit] if limit else self.payload["data"]
+            if fmt == "csv":
+                self._bodies[key] = _csv_body(data)
+            else:
+                self._bodies[key] = json.dumps({**self.payload, "data": data}).encode()
+        return self._bodies[key]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_next:
+            self.fail_next -= 1
+            return web.Response(status=self.error_status)
+        limit = int(request.query.get("limit", 1))
+        return web.Response(
+            body=self.body(limit, request.query.get("format", "json")), content_type="application/json"
+        )
+
+    async def start(self) -> None:
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        await self._server.close()
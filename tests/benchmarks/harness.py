@@ -0,0 +1,163 @@
+"""Instruments for the scale benchmark: event-loop lag, property CPU time and refresh profiles."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import contextlib
+import importlib
+import os
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Set to "cprofile" or "yappi" to dump a profile of each refresh cycle.
+PROFILE = "BENCHMARK_PROFILE"
+# Number of refresh cycles to profile, from the first one on.
+PROFILE_CYCLES = "BENCHMARK_PROFILE_CYCLES"
+# Directory the profiles are written to.
+PROFILE_DIR = "BENCHMARK_PROFILE_DIR"
+PROFILERS = ("cprofile", "yappi")
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a task that sleeps ``interval`` seconds.
+
+    Every sample is the delay beyond the requested sleep, so a callback that
+    blocks the loop for 30 ms shows up as a lag of about 30 ms.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> LoopLagMonitor:
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._task is not None
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(loop.time() - started - self.interval, 0.0))
+
+
+class PropertyTimer:
+    """Count calls and CPU time of selected properties while active.
+
+    Only properties defined by the given classes themselves are wrapped, so
+    the times belong to the integration's code and not to Home Assistant's
+    defaults. CPU time is the thread's, so time spent waiting is not counted.
+    """
+
+    def __init__(self, classes: Iterable[type], names: Iterable[str]) -> None:
+        self._targets = [
+            (cls, name, cls.__dict__[name])
+            for cls in classes
+            for name in names
+            if isinstance(cls.__dict__.get(name), property)
+        ]
+        self.calls: dict[str, int] = defaultdict(int)
+        self.cpu_ns: dict[str, int] = defaultdict(int)
+
+    def __enter__(self) -> PropertyTimer:
+        for cls, name, prop in self._targets:
+            setattr(cls, name, property(self._timed(f"{cls.__name__}.{name}", prop.fget)))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        for cls, name, prop in self._targets:
+            setattr(cls, name, prop)
+
+    def _timed(self, label: str, fget: Any) -> Any:
+        calls = self.calls
+        cpu_ns = self.cpu_ns
+        clock = time.thread_time_ns
+
+        def timed(entity: Any) -> Any:
+            started = clock()
+            try:
+                return fget(entity)
+            finally:
+                cpu_ns[label] += clock() - started
+                calls[label] += 1
+
+        return timed
+
+    @property
+    def total_cpu_ns(self) -> int:
+        """Return the CPU time of all timed calls."""
+        return sum(self.cpu_ns.values())
+
+    def report(self) -> str:
+        """Return one line per property with its calls and mean CPU time."""
+        return "\n".join(
+            f"  {label}: {self.calls[label]} calls, {self.cpu_ns[label] / self.calls[label] / 1000:.2f} us/call"
+            for label in sorted(self.calls)
+        )
+
+
+class RefreshProfiler:
+    """Dump a cProfile or yappi profile for each of the first ``cycles`` refresh cycles.
+
+    Profiling is opt-in through ``BENCHMARK_PROFILE``. Both profilers write
+    pstats files, one per cycle, that ``python -m pstats`` or snakeviz can
+    open. yappi is not a test requirement and is only imported when chosen;
+    unlike cProfile it measures CPU time, which keeps waiting coroutines out
+    of the profile.
+    """
+
+    def __init__(self, profiler: str | None, cycles: int = 3, directory: Path = Path("benchmark_profiles")) -> None:
+        if profiler is not None and profiler not in PROFILERS:
+            raise ValueError(f"{PROFILE} must be one of {', '.join(PROFILERS)}, not {profiler!r}")
+        self.profiler = profiler
+        self.cycles = cycles
+        self.directory = directory
+        self.dumped: list[Path] = []
+
+    @classmethod
+    def from_env(cls) -> RefreshProfiler:
+        """Return a profiler configured from the environment, disabled if it is not set."""
+        return cls(
+            os.environ.get(PROFILE) or None,
+            int(os.environ.get(PROFILE_CYCLES, 3)),
+            Path(os.environ.get(PROFILE_DIR, "benchmark_profiles")),
+        )
+
+    @contextlib.contextmanager
+    def cycle(self, number: int) -> Iterator[None]:
+        """Profile the code run inside the block as refresh cycle ``number``."""
+        if self.profiler is None or number >= self.cycles:
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"refresh_{number:03d}.{self.profiler}.prof"
+        if self.profiler == "yappi":
+            yappi = importlib.import_module("yappi")
+            yappi.set_clock_type("cpu")
+            yappi.clear_stats()
+            yappi.start()
+            try:
+                yield
+            finally:
+                yappi.stop()
+                yappi.get_func_stats().save(str(path), type="pstat")
+        else:
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                profile.dump_stats(path)
+        self.dumped.append(path)
@@ -0,0 +1,100 @@
+"""Benchmark index latency and history parsing against the fake API."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import aiohttp
+import pytest
+
+from custom_components.fear_and_greed.api import FearAndGreedApiClient
+from custom_components.fear_and_greed.const import HISTORY_FORMAT_CSV, HISTORY_FORMAT_JSON
+from custom_components.fear_and_greed.resilience import RetryPolicy
+
+REQUESTS = 50
+INJECTED_LATENCY = 0.02  # seconds
+HISTORY_DAYS = 20000
+
+
+async def _latencies(client: FearAndGreedApiClient, count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await client.async_get_index()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _p95(values: list[float]) -> float:
+    return statistics.quantiles(values, n=20)[-1]
+
+
+@pytest.mark.asyncio
+async def test_index_latency(fake_api, benchmark_results) -> None:
+    """Measure async_get_index with and without injected server latency."""
+    async with aiohttp.ClientSession() as session:
+        client = FearAndGreedApiClient(fake_api.url, session, cache_ttl=0)
+        fast = await _latencies(client, REQUESTS)
+        fake_api.latency = INJECTED_LATENCY
+        slow = await _latencies(client, REQUESTS)
+
+    benchmark_results["index_latency_median_ms"] = statistics.median(fast) * 1000
+    benchmark_results["index_latency_p95_ms"] = _p95(fast) * 1000
+    benchmark_results["index_latency_overhead_ms"] = (statistics.median(slow) - INJECTED_LATENCY) * 1000
+    assert min(slow) >= INJECTED_LATENCY
+
+
+@pytest.mark.asyncio
+async def test_index_latency_with_retries(fake_api, benchmark_results) -> None:
+    """Injected server errors should be absorbed by the retry policy."""
+    async with aiohttp.ClientSession() as session:
+        client = FearAndGreedApiClient(
+            fake_api.url, session, retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.01), cache_ttl=0
+        )
+        fake_api.fail_next = 2
+        start = time.perf_counter()
+        index = await client.async_get_index()
+        elapsed = time.perf_counter() - start
+
+    benchmark_results["index_latency_two_retries_ms"] = elapsed * 1000
+    assert index.value == int(fake_api.payload["data"][0]["value"])
+    assert client.retries == 2
+    assert fake_api.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_history_parse_throughput(fake_api, benchmark_results) -> None:
+    """Measure streaming a large full-history payload into the typed arrays."""
+    fake_api.set_days(HISTORY_DAYS)
+    async with aiohttp.ClientSession() as session:
+        client = FearAndGreedApiClient(fake_api.url, session)
+        body = fake_api.body(0, client.history_format)
+        start = time.perf_counter()
+        history = await client.async_get_history()
+        elapsed = time.perf_counter() - start
+
+    stats = client.last_parse_stats
+    benchmark_results["history_fetch_ms"] = elapsed * 1000
+    benchmark_results["history_parse_points_per_s"] = stats.points / stats.parse_seconds
+    benchmark_results["history_parse_peak_buffer_bytes"] = stats.peak_buffer_bytes
+    assert len(history) == HISTORY_DAYS
+    assert stats.bytes == len(body)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("history_format", [HISTORY_FORMAT_JSON, HISTORY_FORMAT_CSV])
+async def test_history_transfer_format(fake_api, benchmark_results, history_format: str) -> None:
+    """Compare bytes on the wire and parse time of the JSON and CSV history forms."""
+    fake_api.set_days(HISTORY_DAYS)
+    async with aiohttp.ClientSession() as session:
+        client = FearAndGreedApiClient(fake_api.url, session)
+        client.history_format = history_format
+        history = await client.async_get_history()
+
+    stats = client.last_parse_stats
+    benchmark_results[f"history_{history_format}_bytes"] = stats.bytes
+    benchmark_results[f"history_{history_format}_parse_ms"] = stats.parse_seconds * 1000
+    newest = fake_api.payload["data"][0]
+    assert len(history) == HISTORY_DAYS
+    assert (history.timestamps[-1], history.values[-1]) == (int(newest["timestamp"]), int(newest["value"]))
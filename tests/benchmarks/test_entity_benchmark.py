@@ -0,0 +1,79 @@
+"""Benchmark sensor state writes and entity memory."""
+
+from __future__ import annotations
+
+import statistics
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import DOMAIN
+from custom_components.fear_and_greed.sensor import FearAndGreedIndexSensor, FearAndGreedSentimentSensor
+
+UPDATES = 200
+ENTITIES = 1000
+
+INDEX = FearAndGreedIndex(
+    value=50,
+    classification="Neutral",
+    previous_value=45,
+    value_change=5,
+    value_change_percent=11.11,
+    last_updated=datetime(2024, 1, 1),
+    fetched_at=datetime.now(timezone.utc),
+)
+
+
+async def _setup(hass: HomeAssistant, entry):
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=INDEX),
+    ):
+        assert await async_setup_entry(hass, entry)
+        await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+
+@pytest.mark.asyncio
+async def test_update_to_state_write_latency(hass: HomeAssistant, mock_config_entry, benchmark_results) -> None:
+    """Measure the time from new coordinator data to written sensor states."""
+    coordinator = await _setup(hass, mock_config_entry)
+
+    durations = []
+    for update in range(UPDATES):
+        index = replace(INDEX, value=update % 101)
+        start = time.perf_counter()
+        coordinator.async_set_updated_data(index)
+        durations.append(time.perf_counter() - start)
+
+    benchmark_results["state_write_median_us"] = statistics.median(durations) * 1e6
+    assert hass.states.get("sensor.fear_and_greed_index").state == str((UPDATES - 1) % 101)
+
+
+@pytest.mark.asyncio
+async def test_memory_per_entity(hass: HomeAssistant, mock_config_entry, benchmark_results) -> None:
+    """Measure the memory held by the index and sentiment sensor objects."""
+    coordinator = await _setup(hass, mock_config_entry)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [
+        sensor_class(coordinator)
+        for _ in range(ENTITIES // 2)
+        for sensor_class in (FearAndGreedIndexSensor, FearAndGreedSentimentSensor)
+    ]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    benchmark_results["memory_per_entity_bytes"] = allocated / len(entities)
+    assert allocated / len(entities) < 16384
@@ -0,0 +1,144 @@
+"""Scale benchmark: many coordinators and sensor entities refreshed against the fake API."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from datetime import timedelta
+
+import aiohttp
+import pytest
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.fear_and_greed.api import FearAndGreedApiClient
+from custom_components.fear_and_greed.const import DOMAIN
+from custom_components.fear_and_greed.coordinator import FearAndGreedDataUpdateCoordinator
+from custom_components.fear_and_greed.sensor import (
+    FearAndGreedBaseSensor,
+    FearAndGreedIndexSensor,
+    FearAndGreedSentimentSensor,
+)
+
+from .harness import LoopLagMonitor, PropertyTimer, RefreshProfiler
+
+# Scale of the run; raise these to reproduce a large installation.
+COORDINATORS = int(os.environ.get("BENCHMARK_SCALE_COORDINATORS", 20))
+SENSORS_PER_COORDINATOR = int(os.environ.get("BENCHMARK_SCALE_SENSORS", 20))
+CYCLES = int(os.environ.get("BENCHMARK_SCALE_CYCLES", 10))
+MEMORY_CYCLES = 5
+PROPERTIES = ("native_value", "extra_state_attributes", "icon", "device_info")
+INTEGRATION_FILES = tracemalloc.Filter(True, "*custom_components/fear_and_greed/*")
+
+
+def _sensors(coordinator: FearAndGreedDataUpdateCoordinator, number: int) -> list[FearAndGreedBaseSensor]:
+    """Return index and sentiment sensors with identifiers unique to this coordinator."""
+    sensors = []
+    for copy in range(SENSORS_PER_COORDINATOR // 2):
+        for sensor_class in (FearAndGreedIndexSensor, FearAndGreedSentimentSensor):
+            sensor = sensor_class(coordinator)
+            sensor._attr_unique_id = f"scale_{number}_{copy}_{sensor.entity_description.key}"
+            sensor.entity_id = f"{SENSOR_DOMAIN}.{sensor._attr_unique_id}"
+            sensors.append(sensor)
+    return sensors
+
+
+def _growth(snapshots: list[tracemalloc.Snapshot]) -> float:
+    """Return the mean growth of the traced memory per cycle, ignoring shrinking."""
+    growth = sum(stat.size_diff for stat in snapshots[-1].compare_to(snapshots[0], "filename"))
+    return max(growth, 0) / (len(snapshots) - 1)
+
+
+async def _refresh_all(coordinators: list[FearAndGreedDataUpdateCoordinator]) -> None:
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+
+@pytest.mark.asyncio
+async def test_scale_refresh_cycles(hass: HomeAssistant, fake_api, benchmark_results) -> None:
+    """Refresh N coordinators with many entities and measure the cost on the event loop.
+
+    Each cycle publishes a new value, so every refresh writes the state of
+    every entity. Loop lag and property CPU time are measured over the timed
+    cycles; memory growth is measured separately, since tracemalloc slows
+    down everything it watches. Growth is reported in total and for the
+    integration's own allocations, because Home Assistant keeps old states
+    reachable through the origin events of their contexts.
+    """
+    profiler = RefreshProfiler.from_env()
+    if profiler.profiler == "yappi":
+        pytest.importorskip("yappi")
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain=SENSOR_DOMAIN,
+        platform_name=DOMAIN,
+        platform=None,
+        scan_interval=timedelta(hours=1),
+        entity_namespace=None,
+    )
+    async with aiohttp.ClientSession() as session:
+        coordinators = [
+            FearAndGreedDataUpdateCoordinator(
+                hass, FearAndGreedApiClient(fake_api.url, session, cache_ttl=0), timedelta(hours=1), None
+            )
+            for _ in range(COORDINATORS)
+        ]
+        await _refresh_all(coordinators)
+        sensors = [
+            sensor for number, coordinator in enumerate(coordinators) for sensor in _sensors(coordinator, number)
+        ]
+        await platform.async_add_entities(sensors)
+
+        cycle_times = []
+        timer = PropertyTimer([FearAndGreedBaseSensor, *FearAndGreedBaseSensor.__subclasses__()], PROPERTIES)
+        async with LoopLagMonitor() as monitor:
+            with timer:
+                for cycle in range(CYCLES):
+                    fake_api.set_latest(cycle * 7 % 101)
+                    started = time.perf_counter()
+                    with profiler.cycle(cycle):
+                        await _refresh_all(coordinators)
+                    cycle_times.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        snapshots = []
+        for cycle in range(CYCLES, CYCLES + MEMORY_CYCLES):
+            fake_api.set_latest(cycle * 7 % 101)
+            await _refresh_all(coordinators)
+            snapshots.append(tracemalloc.take_snapshot())
+        tracemalloc.stop()
+        last = (CYCLES + MEMORY_CYCLES - 1) * 7 % 101
+        states = {
+            hass.states.get(sensor.entity_id).state
+            for sensor in sensors
+            if isinstance(sensor, FearAndGreedIndexSensor)
+        }
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await platform.async_reset()
+
+    updates = CYCLES * len(sensors)
+    benchmark_results["scale_refresh_cycle_ms"] = statistics.median(cycle_times) * 1000
+    benchmark_results["scale_loop_lag_max_ms"] = max(monitor.lags) * 1000
+    benchmark_results["scale_loop_lag_p95_ms"] = statistics.quantiles(monitor.lags, n=20)[-1] * 1000
+    benchmark_results["scale_property_cpu_us_per_update"] = timer.total_cpu_ns / updates / 1000
+    benchmark_results["scale_memory_growth_bytes_per_cycle"] = _growth(snapshots)
+    benchmark_results["scale_integration_memory_growth_bytes_per_cycle"] = _growth(
+        [snapshot.filter_traces([INTEGRATION_FILES]) for snapshot in snapshots]
+    )
+    print(f"\n{COORDINATORS} coordinators, {len(sensors)} entities, {CYCLES} cycles; property CPU time:")
+    print(timer.report())
+    for path in profiler.dumped:
+        print(f"  profile written to {path}")
+
+    assert fake_api.requests >= COORDINATORS * (CYCLES + MEMORY_CYCLES + 1)
+    assert states == {str(last)}
+    assert timer.calls["FearAndGreedIndexSensor.native_value"] >= updates // 2
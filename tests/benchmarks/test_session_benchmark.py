@@ -0,0 +1,40 @@
+"""Benchmark cold versus pooled API requests against a local server."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import aiohttp
+import pytest
+
+from custom_components.fear_and_greed.api import FearAndGreedApiClient
+
+REQUESTS = 50
+
+
+async def _timed(client: FearAndGreedApiClient) -> float:
+    start = time.perf_counter()
+    await client.async_get_index()
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_reuses_connections(fake_api, benchmark_results) -> None:
+    """A shared session should keep one connection alive and be no slower than cold requests."""
+    cold: list[float] = []
+    for _ in range(REQUESTS):
+        async with FearAndGreedApiClient(fake_api.url, cache_ttl=0) as client:
+            cold.append(await _timed(client))
+    cold_connections = len(set(fake_api.peers))
+    fake_api.peers.clear()
+
+    async with aiohttp.ClientSession() as session:
+        client = FearAndGreedApiClient(fake_api.url, session, cache_ttl=0)
+        pooled = [await _timed(client) for _ in range(REQUESTS)]
+    pooled_connections = len(set(fake_api.peers))
+
+    benchmark_results["cold_request_median_ms"] = statistics.median(cold) * 1000
+    benchmark_results["pooled_request_median_ms"] = statistics.median(pooled) * 1000
+    assert cold_connections == REQUESTS
+    assert pooled_connections == 1
@@ -0,0 +1,84 @@
+"""Benchmark the integration's import and setup cost against fixed budgets."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import DOMAIN
+
+ROOT = Path(__file__).parents[2]
+# Budgets in milliseconds; they leave room for slow CI machines.
+PACKAGE_IMPORT_BUDGET_MS = 50
+RUNTIME_IMPORT_BUDGET_MS = 250
+SETUP_BUDGET_MS = 500
+SLOW_API = 1.0  # seconds
+
+# Run in a fresh interpreter, after the Home Assistant modules that are loaded
+# before any integration, so only the integration's own imports are timed.
+IMPORT_SCRIPT = """
+import json, sys, time
+import homeassistant.core, homeassistant.helpers.aiohttp_client, homeassistant.helpers.config_validation
+import homeassistant.helpers.storage, homeassistant.helpers.update_coordinator
+
+started = time.perf_counter()
+import custom_components.fear_and_greed as integration
+package_ms = (time.perf_counter() - started) * 1000
+runtime_ms = integration._import_runtime_modules()
+print(json.dumps({
+    "package_ms": package_ms,
+    "runtime_ms": runtime_ms,
+    "deferred": [name for name in ("homeassistant.components.recorder", "numpy") if name in sys.modules],
+}))
+"""
+
+
+def test_import_time(benchmark_results) -> None:
+    """Loading the integration should be cheap and leave the recorder and NumPy unloaded."""
+    result = json.loads(
+        subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT, capture_output=True, check=True, text=True
+        ).stdout
+    )
+
+    benchmark_results["package_import_ms"] = result["package_ms"]
+    benchmark_results["runtime_import_ms"] = result["runtime_ms"]
+    assert result["deferred"] == []
+    assert result["package_ms"] < PACKAGE_IMPORT_BUDGET_MS
+    assert result["runtime_ms"] < RUNTIME_IMPORT_BUDGET_MS
+
+
+@pytest.mark.asyncio
+async def test_setup_does_not_wait_for_the_api(hass: HomeAssistant, mock_config_entry, benchmark_results) -> None:
+    """Setup should finish while the first request is still running."""
+    index = FearAndGreedIndex(56, "Greed", None, None, None, datetime(2024, 1, 1))
+
+    async def slow_index(*args, **kwargs) -> FearAndGreedIndex:
+        await asyncio.sleep(SLOW_API)
+        return index
+
+    mock_config_entry.add_to_hass(hass)
+    with patch("custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index", slow_index):
+        started = time.perf_counter()
+        assert await async_setup_entry(hass, mock_config_entry)
+        elapsed = (time.perf_counter() - started) * 1000
+        assert hass.states.get("sensor.fear_and_greed_index").state == "unknown"
+        await hass.async_block_till_done()
+
+    timings = hass.data[DOMAIN][mock_config_entry.entry_id]["timings"]
+    benchmark_results["setup_entry_ms"] = timings["setup_ms"]
+    assert elapsed < SETUP_BUDGET_MS
+    assert timings["first_refresh_ms"] >= SLOW_API * 1000
+    assert hass.states.get("sensor.fear_and_greed_index").state == "56"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Any, Generator
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -12,6 +13,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from homeassistant.core import HomeAssistant
 
 from custom_components.fear_and_greed.const import DOMAIN
+from custom_components.fear_and_greed.history import FearAndGreedHistory
 
 
 @pytest.fixture
@@ -20,6 +22,28 @@ def mock_config_entry() -> MockConfigEntry:
     return MockConfigEntry(domain=DOMAIN, title="Fear & Greed Index", data={}, version=2)
 
 
+@pytest.fixture
+def mock_history() -> Generator[AsyncMock, None, None]:
+    """Answer history requests with an empty history, so the history sync stays off the network."""
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_history",
+        AsyncMock(return_value=FearAndGreedHistory()),
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def sample_csv_payload() -> str:
+    """Provide the CSV form of the history, wrapped like Alternative.me sends it."""
+    return (
+        '{\n\t"name": "Fear and Greed Index",\n\t"data": [\n\t\t\n'
+        "date,fng_value,fng_classification\n"
+        "01-01-2024,56,Greed\n"
+        "31-12-2023,48,Neutral\n"
+        '\t],\n\t"metadata": {\n\t\t"error": null\n\t}\n}'
+    )
+
+
 @pytest.fixture
 def sample_api_payload() -> dict[str, Any]:
     """Provide a sample API payload resembling Alternative.me output."""
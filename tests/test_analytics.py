@@ -0,0 +1,66 @@
+"""Tests for the rolling analytics engine."""
+
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from custom_components.fear_and_greed.analytics import RollingAnalytics
+from custom_components.fear_and_greed.history import FearAndGreedHistory
+
+DAY = 86400
+
+
+def _history(days: int) -> FearAndGreedHistory:
+    rng = random.Random(42)
+    history = FearAndGreedHistory()
+    history.merge((DAY * day, rng.randint(0, 100), "Neutral") for day in range(days))
+    return history
+
+
+def test_incremental_metrics_match_naive_computation() -> None:
+    """Pushing values one by one should match metrics computed from scratch."""
+    history = _history(500)
+    values = list(history.values)
+    engine = RollingAnalytics()
+    for timestamp, value, _ in history.points():
+        engine.push(timestamp, value)
+
+    snapshot = engine.snapshot
+    year = values[-365:]
+    assert snapshot.moving_averages[7] == pytest.approx(statistics.mean(values[-7:]), abs=0.01)
+    assert snapshot.moving_averages[90] == pytest.approx(statistics.mean(values[-90:]), abs=0.01)
+    assert snapshot.rolling_min == min(values[-30:])
+    assert snapshot.rolling_max == max(values[-30:])
+    assert snapshot.percentile_rank == pytest.approx(
+        sum(value <= values[-1] for value in year) / len(year) * 100, abs=0.01
+    )
+    assert snapshot.z_score == pytest.approx(
+        (values[-1] - statistics.mean(year)) / statistics.pstdev(year), abs=0.01
+    )
+
+
+def test_bulk_build_matches_incremental_updates() -> None:
+    """Building from a backfilled history should equal pushing every value."""
+    history = _history(1500)
+    incremental = RollingAnalytics()
+    for timestamp, value, _ in history.points():
+        incremental.push(timestamp, value)
+
+    bulk = RollingAnalytics.from_history(history)
+
+    assert bulk.snapshot.ema == pytest.approx(incremental.snapshot.ema, abs=0.01)
+    assert bulk.snapshot == incremental.snapshot
+
+
+def test_extend_from_pushes_only_new_points() -> None:
+    """New points appended to the history should be added incrementally."""
+    history = _history(400)
+    engine = RollingAnalytics.from_history(history)
+    history.merge([(DAY * 400, 99, "Extreme Greed")])
+
+    assert engine.extend_from(history)
+    assert engine.count == 401
+    assert engine.snapshot.rolling_max == 99
@@ -2,28 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from custom_components.fear_and_greed.api import FearAndGreedApiClient, FearAndGreedApiClientError
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.fear_and_greed.api import (
+    BaseFearAndGreedApiClient,
+    FearAndGreedApiCircuitOpenError,
+    FearAndGreedApiClient,
+    FearAndGreedApiClientError,
+)
+from custom_components.fear_and_greed.const import HISTORY_FORMAT_JSON
+from custom_components.fear_and_greed.response_cache import ResponseCache
+from custom_components.fear_and_greed.resilience import CircuitBreaker, RetryPolicy, parse_retry_after
 
 
 @pytest.mark.asyncio
-async def test_api_handles_non_200(aioclient_mock) -> None:
+async def test_api_handles_non_200(hass: HomeAssistant, aioclient_mock) -> None:
     """The client should raise when the status code is not 200."""
     aioclient_mock.get("https://api.alternative.me/fng/", status=500)
 
-    client = FearAndGreedApiClient("https://api.alternative.me/fng/")
+    client = FearAndGreedApiClient(
+        "https://api.alternative.me/fng/", async_get_clientsession(hass), retry_policy=RetryPolicy(attempts=1)
+    )
 
     with pytest.raises(FearAndGreedApiClientError):
         await client.async_get_index()
 
 
 @pytest.mark.asyncio
-async def test_api_parses_payload(aioclient_mock, sample_api_payload) -> None:
+async def test_api_parses_payload(hass: HomeAssistant, aioclient_mock, sample_api_payload) -> None:
     """The client should parse the API payload correctly."""
     aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
 
-    client = FearAndGreedApiClient("https://api.alternative.me/fng/")
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", async_get_clientsession(hass))
     index = await client.async_get_index()
 
     assert index.value == 56
@@ -31,3 +46,234 @@ async def test_api_parses_payload(aioclient_mock, sample_api_payload) -> None:
     assert index.value_change == 8
     assert index.value_change_percent == pytest.approx(16.67, rel=1e-2)
     await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_api_fetches_history(hass: HomeAssistant, aioclient_mock, sample_api_payload) -> None:
+    """The client should return the requested history sorted by timestamp."""
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
+
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", async_get_clientsession(hass))
+    client.history_format = HISTORY_FORMAT_JSON
+    history = await client.async_get_history()
+
+    assert list(history.values) == [48, 56]
+    assert history.classification(0) == "Neutral"
+    assert aioclient_mock.mock_calls[0][1].query["limit"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_api_fetches_history_as_csv(hass: HomeAssistant, aioclient_mock, sample_csv_payload) -> None:
+    """History requests should use the compact CSV form by default."""
+    aioclient_mock.get("https://api.alternative.me/fng/", text=sample_csv_payload)
+
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", async_get_clientsession(hass))
+    history = await client.async_get_history(30)
+
+    assert list(history.values) == [48, 56]
+    assert list(history.timestamps) == [1703980800, 1704067200]
+    assert history.classification(1) == "Greed"
+    assert aioclient_mock.mock_calls[0][1].query["format"] == "csv"
+    assert client.last_parse_stats.decoder == "csv"
+
+
+@pytest.mark.asyncio
+async def test_api_retries_after_rate_limit(hass: HomeAssistant, aioclient_mock, sample_api_payload) -> None:
+    """A 429 response should be retried after the announced delay."""
+    aioclient_mock.get("https://api.alternative.me/fng/", status=429, headers={"Retry-After": "0"})
+
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", async_get_clientsession(hass))
+    with pytest.raises(FearAndGreedApiClientError):
+        await client.async_get_index()
+
+    assert aioclient_mock.call_count == 3
+    assert client.rate_limited == 3
+    assert client.retries == 2
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
+    index = await client.async_get_index()
+
+    assert index.value == 56
+    assert client.breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_api_opens_circuit_after_repeated_failures(hass: HomeAssistant, aioclient_mock) -> None:
+    """Once the breaker opens, calls should fail fast without touching the network."""
+    aioclient_mock.get("https://api.alternative.me/fng/", status=503)
+
+    client = FearAndGreedApiClient(
+        "https://api.alternative.me/fng/", async_get_clientsession(hass), retry_policy=RetryPolicy(attempts=1)
+    )
+    client.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=600)
+
+    for _ in range(2):
+        with pytest.raises(FearAndGreedApiClientError):
+            await client.async_get_index()
+
+    with pytest.raises(FearAndGreedApiCircuitOpenError) as err:
+        await client.async_get_index()
+
+    assert aioclient_mock.call_count == 2
+    assert err.value.retry_after > 0
+    assert client.breaker.as_dict()["state"] == "open"
+
+
+def test_half_open_breaker_admits_a_single_trial() -> None:
+    """After the reset timeout only one trial call should pass until its outcome is known."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_api_sends_a_single_trial_when_half_open(hass: HomeAssistant) -> None:
+    """Calls made while the trial runs should fail fast, and a cancelled trial should not block later ones."""
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", async_get_clientsession(hass))
+    client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    client.breaker.record_failure()
+    release = asyncio.Event()
+
+    async def operation() -> int:
+        await release.wait()
+        return 1
+
+    cancelled = asyncio.ensure_future(client._async_call(operation))
+    await asyncio.sleep(0)
+    with pytest.raises(FearAndGreedApiCircuitOpenError):
+        await asyncio.wait_for(client._async_call(operation), 1)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    trial = asyncio.ensure_future(client._async_call(operation))
+    await asyncio.sleep(0)
+    with pytest.raises(FearAndGreedApiCircuitOpenError):
+        await asyncio.wait_for(client._async_call(operation), 1)
+    release.set()
+
+    assert await trial == 1
+    assert client.breaker.state == "closed"
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After accepts seconds and HTTP dates."""
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_api_coalesces_and_caches_index_requests(
+    hass: HomeAssistant, aioclient_mock, sample_api_payload
+) -> None:
+    """Concurrent and repeated calls should share one request until the cache expires."""
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
+
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", async_get_clientsession(hass))
+    results = await asyncio.gather(*(client.async_get_index() for _ in range(5)))
+
+    assert {index.value for index in results} == {56}
+    assert aioclient_mock.call_count == 1
+    assert client.coalesced == 4
+
+    await client.async_get_index()
+    assert aioclient_mock.call_count == 1
+    assert client.cache_hits == 1
+
+    await client.async_get_index(force=True)
+    assert aioclient_mock.call_count == 2
+    assert client.cache_misses == 2
+
+
+@pytest.mark.asyncio
+async def test_api_forced_index_request_does_not_join_a_cached_one(
+    hass: HomeAssistant, aioclient_mock, sample_api_payload
+) -> None:
+    """A forced call should reach the API even while an unforced call is answered from disk."""
+    sample_api_payload["metadata"] = {"time_until_update": "3600"}
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
+    cache = ResponseCache(hass)
+    session = async_get_clientsession(hass)
+    await FearAndGreedApiClient("https://api.alternative.me/fng/", session, response_cache=cache).async_get_index()
+
+    client = FearAndGreedApiClient("https://api.alternative.me/fng/", session, response_cache=cache)
+    await asyncio.gather(client.async_get_index(), client.async_get_index(force=True))
+    assert aioclient_mock.call_count == 2
+    assert cache.hits == 1
+
+    await asyncio.gather(client.async_get_index(force=True), client.async_get_index(force=True))
+    assert aioclient_mock.call_count == 3
+    assert client.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_api_reuses_fresh_response_from_disk(hass: HomeAssistant, aioclient_mock, sample_api_payload) -> None:
+    """A response saved by one client should answer another until the next publication."""
+    sample_api_payload["metadata"] = {"time_until_update": "3600"}
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
+    cache = ResponseCache(hass)
+
+    session = async_get_clientsession(hass)
+    first = FearAndGreedApiClient("https://api.alternative.me/fng/", session, response_cache=cache)
+    fetched = await first.async_get_index()
+
+    # A new client, as after a restart or reload, shares the disk cache but not the memory cache.
+    second = FearAndGreedApiClient("https://api.alternative.me/fng/", session, response_cache=cache)
+    restored = await second.async_get_index()
+
+    assert aioclient_mock.call_count == 1
+    assert cache.hits == 1
+    assert restored == fetched
+    assert restored.fetched_at == fetched.fetched_at
+    assert 3590 <= restored.time_until_update <= 3600
+
+    await second.async_get_index(force=True)
+    assert aioclient_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_api_revalidates_expired_response(hass: HomeAssistant, aioclient_mock, sample_api_payload) -> None:
+    """An expired response should be revalidated and reused on a 304 answer."""
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload, headers={"ETag": '"v1"'})
+    cache = ResponseCache(hass)
+    session = async_get_clientsession(hass)
+
+    await FearAndGreedApiClient("https://api.alternative.me/fng/", session, response_cache=cache).async_get_index()
+    key = cache.key("https://api.alternative.me/fng/", {"limit": 2})
+    cache.get(key).expires_at = 0
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get("https://api.alternative.me/fng/", status=304)
+    index = await FearAndGreedApiClient(
+        "https://api.alternative.me/fng/", session, response_cache=cache
+    ).async_get_index()
+
+    assert index.value == 56
+    assert aioclient_mock.mock_calls[0][3]["If-None-Match"] == '"v1"'
+    assert cache.revalidated == 1
+    assert cache.get(key).fresh
+
+
+def test_provider_client_must_parse_the_index() -> None:
+    """A provider client without ``_parse_index`` should fail when it is created."""
+
+    class IncompleteClient(BaseFearAndGreedApiClient):
+        pass
+
+    with pytest.raises(TypeError, match="_parse_index"):
+        IncompleteClient("https://example.invalid")
@@ -0,0 +1,49 @@
+"""Tests for the sentiment classes."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.classification import Sentiment
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (-3, Sentiment.EXTREME_FEAR),
+        (0, Sentiment.EXTREME_FEAR),
+        (24, Sentiment.EXTREME_FEAR),
+        (25, Sentiment.FEAR),
+        (46, Sentiment.FEAR),
+        (47, Sentiment.NEUTRAL),
+        (54, Sentiment.NEUTRAL),
+        (55, Sentiment.GREED),
+        (75, Sentiment.GREED),
+        (76, Sentiment.EXTREME_GREED),
+        (120, Sentiment.EXTREME_GREED),
+    ],
+)
+def test_from_value_uses_the_bands(value: int, expected: Sentiment) -> None:
+    """Values should map to the band they fall into, clamped to 0-100."""
+    assert Sentiment.from_value(value) is expected
+
+
+def test_resolve_prefers_the_provider_name() -> None:
+    """Known names win over the value band, in either spelling; unknown ones fall back to it."""
+    assert Sentiment.resolve("Extreme Greed", 10) is Sentiment.EXTREME_GREED
+    assert Sentiment.resolve("extreme fear", 90) is Sentiment.EXTREME_FEAR
+    assert Sentiment.resolve("unknown", 50) is Sentiment.NEUTRAL
+    assert Sentiment.resolve("", 80) is Sentiment.EXTREME_GREED
+
+
+def test_index_resolves_its_sentiment_once() -> None:
+    """The index should carry its sentiment without it affecting equality."""
+    index = FearAndGreedIndex(30, "Fear", None, None, None, datetime(2024, 1, 1))
+
+    assert index.sentiment is Sentiment.FEAR
+    assert (index.sentiment.level, index.sentiment.icon) == (1, "mdi:emoticon-sad-outline")
+    assert index == FearAndGreedIndex(30, "Fear", None, None, None, datetime(2024, 1, 1))
+    assert [sentiment.level for sentiment in Sentiment] == list(range(5))
@@ -0,0 +1,167 @@
+"""Tests for the Fear and Greed data update coordinator."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed.api import (
+    FearAndGreedApiClientError,
+    FearAndGreedApiTransientError,
+    FearAndGreedIndex,
+)
+from custom_components.fear_and_greed.const import (
+    LATE_RETRY_DELAY,
+    PUBLICATION_OFFSET,
+    STATE_STORAGE_KEY,
+    STATE_STORAGE_VERSION,
+)
+from custom_components.fear_and_greed.coordinator import FearAndGreedDataUpdateCoordinator
+from custom_components.fear_and_greed.history import FearAndGreedHistory, FearAndGreedHistoryStore
+
+
+def _index(day: int, time_until_update: int | None) -> FearAndGreedIndex:
+    return FearAndGreedIndex(
+        value=50,
+        classification="Neutral",
+        previous_value=None,
+        value_change=None,
+        value_change_percent=None,
+        last_updated=datetime(2024, 1, day),
+        time_until_update=time_until_update,
+    )
+
+
+def _client(**kwargs) -> MagicMock:
+    client = MagicMock()
+    client.async_get_index = AsyncMock(**kwargs)
+    client.async_get_history = AsyncMock(return_value=FearAndGreedHistory())
+    return client
+
+
+@pytest.mark.asyncio
+async def test_schedules_next_poll_after_publication(hass: HomeAssistant) -> None:
+    """The next poll should follow the announced publication time."""
+    client = _client(return_value=_index(1, 3600 * 5))
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass)
+    )
+
+    await coordinator.async_refresh()
+
+    assert coordinator.update_interval == timedelta(seconds=3600 * 5 + PUBLICATION_OFFSET)
+    assert coordinator.next_poll is not None
+    assert coordinator.late_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_backs_off_while_value_is_late(hass: HomeAssistant) -> None:
+    """Late values should be retried with a growing delay capped at the fallback interval."""
+    client = _client(side_effect=[_index(1, 60), _index(1, 0), _index(1, 0), _index(2, 86000)])
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(minutes=3), FearAndGreedHistoryStore(hass)
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=LATE_RETRY_DELAY)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=LATE_RETRY_DELAY * 2)
+    assert coordinator.late_retries == 2
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=86000 + PUBLICATION_OFFSET)
+    assert coordinator.late_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_before_publication_keeps_the_announced_time(hass: HomeAssistant) -> None:
+    """An unchanged value fetched before the announced publication time is not late."""
+    client = _client(side_effect=[_index(1, 3600 * 10), _index(1, 3600 * 9), _index(1, 3600 * 8)])
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass)
+    )
+
+    for hours in (10, 9, 8):
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(seconds=3600 * hours + PUBLICATION_OFFSET)
+    assert coordinator.late_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_unchanged_value_after_publication_time_is_late(hass: HomeAssistant, freezer) -> None:
+    """Once the announced time has passed, an unchanged value is retried soon even with a new countdown."""
+    client = _client(side_effect=[_index(1, 600), _index(1, 86000)])
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass)
+    )
+
+    await coordinator.async_refresh()
+    freezer.tick(timedelta(seconds=600 + PUBLICATION_OFFSET))
+    await coordinator.async_refresh()
+
+    assert coordinator.update_interval == timedelta(seconds=LATE_RETRY_DELAY)
+    assert coordinator.late_retries == 1
+
+
+@pytest.mark.asyncio
+async def test_restores_and_saves_last_index(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """The last saved index should be restored and replaced after a refresh."""
+    fetched_at = datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc)
+    hass_storage[STATE_STORAGE_KEY] = {
+        "version": STATE_STORAGE_VERSION,
+        "key": STATE_STORAGE_KEY,
+        "data": {**_index(1, None).as_dict(), "fetched_at": fetched_at.isoformat()},
+    }
+    client = _client(return_value=_index(2, 3600))
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass)
+    )
+
+    assert await coordinator.async_restore()
+    assert coordinator.data.value == 50
+    assert coordinator.data.restored
+    assert coordinator.data.as_sensor_attributes["fetched_at"] == fetched_at.isoformat()
+    client.async_get_index.assert_not_awaited()
+
+    await coordinator.async_refresh()
+
+    assert not coordinator.data.restored
+    assert hass_storage[STATE_STORAGE_KEY]["data"]["last_updated"] == datetime(2024, 1, 2).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_serves_stale_data_when_refresh_fails(hass: HomeAssistant) -> None:
+    """A failed refresh should keep the last value, flagged as stale, until it is too old."""
+    fresh = replace(_index(1, 3600), fetched_at=datetime.now(timezone.utc))
+    client = _client(
+        side_effect=[
+            fresh,
+            FearAndGreedApiTransientError("rate limited", retry_after=900),
+            FearAndGreedApiClientError("down"),
+        ]
+    )
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass), max_stale_age=timedelta(hours=2)
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.stale
+    assert coordinator.data.value == fresh.value
+    assert coordinator.update_interval == timedelta(seconds=900)
+
+    coordinator.data = replace(coordinator.data, fetched_at=datetime.now(timezone.utc) - timedelta(hours=3))
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval == timedelta(seconds=LATE_RETRY_DELAY * 2)
@@ -15,7 +15,7 @@ from custom_components.fear_and_greed.diagnostics import async_get_config_entry_
 
 
 @pytest.mark.asyncio
-async def test_diagnostics_returns_index(hass: HomeAssistant, mock_config_entry) -> None:
+async def test_diagnostics_returns_index(hass: HomeAssistant, mock_config_entry, mock_history) -> None:
     """Diagnostics should include the current index."""
     index = FearAndGreedIndex(
         value=70,
@@ -32,8 +32,12 @@ async def test_diagnostics_returns_index(hass: HomeAssistant, mock_config_entry)
         AsyncMock(return_value=index),
     ):
         assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
 
     diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
     assert diagnostics["index"]["value"] == 70
     assert diagnostics["index"]["classification"] == "Extreme Greed"
     assert diagnostics["index"]["value_change_percent"] == 16.67
+    assert diagnostics["index_cache"] == {"hits": 0, "misses": 0, "coalesced": 0}
+    assert diagnostics["response_cache"]["entries"] == 0
+    assert diagnostics["startup"]["setup_ms"] <= diagnostics["startup"]["first_refresh_ms"]
@@ -0,0 +1,152 @@
+"""Tests for the local index history."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import (
+    DOMAIN,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    SERVICE_GET_HISTORY,
+)
+from custom_components.fear_and_greed.coordinator import FearAndGreedDataUpdateCoordinator
+from custom_components.fear_and_greed.history import FearAndGreedHistory, FearAndGreedHistoryStore
+
+DAY = 86400
+# Monday, 1 January 2024.
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def _year_history() -> FearAndGreedHistory:
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, day % 100, "Neutral") for day in range(366))
+    return history
+
+
+def test_merge_keeps_points_sorted_and_unique() -> None:
+    """Merging should ignore known timestamps and keep the arrays sorted."""
+    history = FearAndGreedHistory()
+    assert history.merge([(3 * DAY, 30, "Fear"), (DAY, 10, "Extreme Fear")]) == 2
+    assert history.merge([(2 * DAY, 20, "Extreme Fear"), (3 * DAY, 30, "Fear")]) == 1
+    assert history.merge([(4 * DAY, 60, "Greed")]) == 1
+
+    assert list(history.timestamps) == [DAY, 2 * DAY, 3 * DAY, 4 * DAY]
+    assert list(history.values) == [10, 20, 30, 60]
+    assert history.classification(1) == "Extreme Fear"
+    assert history.classifications == ["Extreme Fear", "Fear", "Greed"]
+
+
+def test_history_round_trips_through_storage_format() -> None:
+    """The compact storage format should restore an identical history."""
+    history = FearAndGreedHistory()
+    history.merge([(DAY, 10, "Extreme Fear"), (2 * DAY, 55, "Greed")])
+
+    restored = FearAndGreedHistory.from_dict(history.as_dict())
+
+    assert list(restored.points()) == list(history.points())
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backfills_once(hass: HomeAssistant) -> None:
+    """The first refresh should backfill the full history and later ones should not."""
+    backfill = FearAndGreedHistory()
+    backfill.merge([(DAY, 10, "Extreme Fear"), (2 * DAY, 20, "Extreme Fear")])
+    index = FearAndGreedIndex(
+        value=50,
+        classification="Neutral",
+        previous_value=20,
+        value_change=30,
+        value_change_percent=150.0,
+        last_updated=datetime.fromtimestamp(3 * DAY),
+    )
+    client = MagicMock()
+    client.async_get_index = AsyncMock(return_value=index)
+    client.async_get_history = AsyncMock(return_value=backfill)
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass)
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    client.async_get_history.assert_awaited_once_with(0)
+    assert list(coordinator.history.values) == [10, 20, 50]
+
+
+def test_query_returns_daily_points_in_range() -> None:
+    """Daily queries should return the points between start and end inclusive."""
+    history = _year_history()
+
+    points = history.query(START + DAY * 10, START + DAY * 12)
+
+    assert [point["value"] for point in points] == [10, 11, 12]
+    assert points[0]["timestamp"] == "2024-01-11T00:00:00+00:00"
+
+
+def test_query_aggregates_weeks_and_months() -> None:
+    """Weekly and monthly queries should return per bucket aggregates."""
+    history = _year_history()
+
+    weeks = history.query(START, START + DAY * 13, "weekly")
+    months = history.query(START + DAY * 40, START + DAY * 60, "monthly")
+
+    assert weeks == [
+        {"start": "2024-01-01T00:00:00+00:00", "mean": 3.0, "min": 0, "max": 6, "count": 7},
+        {"start": "2024-01-08T00:00:00+00:00", "mean": 10.0, "min": 7, "max": 13, "count": 7},
+    ]
+    assert [month["start"] for month in months] == ["2024-02-01T00:00:00+00:00", "2024-03-01T00:00:00+00:00"]
+    assert months[0]["count"] == 29
+
+    history.merge([(START + DAY * 366, 99, "Extreme Greed")])
+    assert history.query(START + DAY * 366, START + DAY * 366, "weekly")[0]["max"] == 99
+
+
+@pytest.mark.asyncio
+async def test_get_history_service(hass: HomeAssistant, hass_storage: dict[str, Any], mock_config_entry) -> None:
+    """The service should answer from the local history without calling the API."""
+    hass_storage[HISTORY_STORAGE_KEY] = {
+        "version": HISTORY_STORAGE_VERSION,
+        "key": HISTORY_STORAGE_KEY,
+        "data": _year_history().as_dict(),
+    }
+    index = FearAndGreedIndex(
+        value=50,
+        classification="Neutral",
+        previous_value=None,
+        value_change=None,
+        value_change_percent=None,
+        last_updated=datetime.fromtimestamp(START + DAY * 365),
+    )
+
+    mock_config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=index),
+    ), patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_history",
+        AsyncMock(return_value=FearAndGreedHistory()),
+    ) as get_history:
+        assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
+        get_history.reset_mock()
+
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_HISTORY,
+            {"start": "2024-01-01 00:00:00+00:00", "end": "2024-03-31 00:00:00+00:00", "resolution": "monthly"},
+            blocking=True,
+            return_response=True,
+        )
+
+    get_history.assert_not_awaited()
+    assert response["resolution"] == "monthly"
+    assert [point["count"] for point in response["points"]] == [31, 29, 31]
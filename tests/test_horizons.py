@@ -0,0 +1,85 @@
+"""Tests for the multi-horizon changes."""
+
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from custom_components.fear_and_greed.history import FearAndGreedHistory
+from custom_components.fear_and_greed.horizons import HorizonChanges, HorizonSnapshot
+
+DAY = 86400
+
+
+def _history(days: int) -> FearAndGreedHistory:
+    rng = random.Random(7)
+    history = FearAndGreedHistory()
+    history.merge((DAY * day, rng.randint(1, 100), "Neutral") for day in range(days))
+    return history
+
+
+def test_changes_match_naive_computation() -> None:
+    """Each horizon should compare with the value that many days ago and average the period."""
+    history = _history(400)
+    values = list(history.values)
+    changes = HorizonChanges([7, 30, 365])
+
+    changes.update(history)
+
+    for days in (7, 30, 365):
+        snapshot = changes.snapshots[days]
+        reference = values[-1 - days]
+        assert snapshot.reference_value == reference
+        assert snapshot.value_change == values[-1] - reference
+        assert snapshot.value_change_percent == pytest.approx((values[-1] - reference) / reference * 100, abs=0.01)
+        assert snapshot.average == pytest.approx(statistics.mean(values[-days:]), abs=0.01)
+
+
+def test_horizon_longer_than_history_has_no_reference() -> None:
+    """Without a value old enough only the average over the available days is known."""
+    history = _history(10)
+    changes = HorizonChanges([30])
+
+    changes.update(history)
+
+    assert changes.snapshots[30] == HorizonSnapshot(
+        days=30,
+        value_change=None,
+        value_change_percent=None,
+        reference_value=None,
+        average=round(statistics.mean(history.values), 2),
+    )
+
+
+def test_missing_days_use_the_last_value_before_the_horizon() -> None:
+    """Gaps in the history should fall back to the newest value before the cutoff."""
+    history = FearAndGreedHistory()
+    history.merge([(0, 20, "Fear"), (DAY * 5, 60, "Greed"), (DAY * 10, 80, "Extreme Greed")])
+    changes = HorizonChanges([7])
+
+    changes.update(history)
+
+    assert changes.snapshots[7].reference_value == 20
+    assert changes.snapshots[7].average == 70
+
+
+def test_prefix_sums_follow_appends_and_backfills() -> None:
+    """Appended days extend the sums and inserted older days rebuild them."""
+    history = _history(100)
+    changes = HorizonChanges([7, 30])
+    changes.update(history)
+
+    history.merge([(DAY * 100, 50, "Neutral")])
+    changes.update(history)
+    rebuilt = HorizonChanges([7, 30])
+    rebuilt.update(history)
+    assert changes.snapshots == rebuilt.snapshots
+
+    history.merge([(-DAY, 1, "Extreme Fear")])
+    changes.update(history)
+    rebuilt = HorizonChanges([7, 30])
+    rebuilt.update(history)
+    assert changes.snapshots == rebuilt.snapshots
+    assert len(changes._prefix) == len(history) + 1
@@ -0,0 +1,80 @@
+"""Tests for the request timings and counters."""
+
+from __future__ import annotations
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.fear_and_greed.api import FearAndGreedApiClient, FearAndGreedApiClientError
+from custom_components.fear_and_greed.metrics import TIMING_BUCKETS, Histogram, create_trace_config
+from custom_components.fear_and_greed.resilience import RetryPolicy
+
+
+def test_histogram_buckets() -> None:
+    """Durations should land in the first bucket whose bound they do not exceed."""
+    histogram = Histogram()
+    for seconds in (0.0005, 0.001, 0.003, 20.0):
+        histogram.observe(seconds)
+
+    data = histogram.as_dict()
+    assert data["count"] == 4
+    assert data["buckets"]["le_1ms"] == 2
+    assert data["buckets"]["le_5ms"] == 1
+    assert data["buckets"]["inf"] == 1
+    assert data["last_ms"] == 20000
+    assert data["max_ms"] == 20000
+    assert len(data["buckets"]) == len(TIMING_BUCKETS) + 1
+
+
+@pytest.mark.asyncio
+async def test_client_counts_requests_and_bytes(
+    hass: HomeAssistant, aioclient_mock, sample_api_payload, sample_csv_payload
+) -> None:
+    """Successful and failed calls, body and parse times and bytes should be recorded."""
+    aioclient_mock.get("https://api.alternative.me/fng/", params={"limit": 0, "format": "csv"}, text=sample_csv_payload)
+    aioclient_mock.get("https://api.alternative.me/fng/", json=sample_api_payload)
+    client = FearAndGreedApiClient(
+        "https://api.alternative.me/fng/", async_get_clientsession(hass), retry_policy=RetryPolicy(attempts=1)
+    )
+
+    await client.async_get_index()
+    await client.async_get_history()
+    aioclient_mock.clear_requests()
+    aioclient_mock.get("https://api.alternative.me/fng/", status=500)
+    with pytest.raises(FearAndGreedApiClientError):
+        await client.async_get_index(force=True)
+
+    metrics = client.metrics
+    assert metrics.successes == 2
+    assert metrics.failures == 1
+    assert metrics.body.count == 2
+    assert metrics.parse.count == 2
+    assert metrics.bytes_received > 0
+
+
+@pytest.mark.asyncio
+async def test_trace_config_records_connection_timings(socket_enabled, sample_api_payload) -> None:
+    """The trace hooks should time the connection and the response headers."""
+
+    async def handle(request: web.Request) -> web.Response:
+        return web.json_response(sample_api_payload)
+
+    app = web.Application()
+    app.router.add_get("/fng/", handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with aiohttp.ClientSession(trace_configs=[create_trace_config()]) as session:
+            client = FearAndGreedApiClient(str(server.make_url("/fng/")), session, cache_ttl=0)
+            await client.async_get_index()
+            await client.async_get_index()
+    finally:
+        await server.close()
+
+    assert client.metrics.connect.count == 1
+    assert client.metrics.first_byte.count == 2
@@ -0,0 +1,96 @@
+"""Tests for the streaming payload parser."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.fear_and_greed.parser import FearAndGreedCsvParser, FearAndGreedStreamParser
+
+
+def _payload(days: int) -> bytes:
+    return json.dumps(
+        {
+            "name": "Fear and Greed Index",
+            "data": [
+                {
+                    "value": str(day % 101),
+                    "value_classification": "Fear" if day % 2 else "Greed",
+                    "timestamp": str(86400 * day),
+                    "time_until_update": "3600" if day == days else None,
+                }
+                for day in range(days, 0, -1)
+            ],
+            "metadata": {"error": None},
+        },
+        indent=1,
+    ).encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_parser_handles_any_chunk_boundary(chunk_size: int) -> None:
+    """Entries split across chunks should be decoded into sorted arrays."""
+    payload = _payload(50)
+    parser = FearAndGreedStreamParser()
+    for start in range(0, len(payload), chunk_size):
+        parser.feed(payload[start : start + chunk_size])
+    history = parser.close()
+
+    assert list(history.timestamps) == [86400 * day for day in range(1, 51)]
+    assert list(history.values) == [day % 101 for day in range(1, 51)]
+    assert history.classification(0) == "Fear"
+    assert parser.stats.points == 50
+    assert parser.stats.bytes == len(payload)
+    assert parser.stats.peak_buffer_bytes < len(payload)
+
+
+def test_parser_rejects_truncated_payload() -> None:
+    """A payload that ends inside the data array should raise."""
+    parser = FearAndGreedStreamParser()
+    parser.feed(_payload(3)[:-40])
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def _csv_payload(days: int) -> bytes:
+    lines = "".join(f"{day:02d}-01-2024,{day},{'Fear' if day % 2 else 'Greed'}\n" for day in range(days, 0, -1))
+    header = '{\n\t"name": "Fear and Greed Index",\n\t"data": [\n\t\t\ndate,fng_value,fng_classification\n'
+    return f"{header}{lines}\t],\n}}".encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_csv_parser_handles_any_chunk_boundary(chunk_size: int) -> None:
+    """CSV lines split across chunks should be decoded into sorted arrays."""
+    payload = _csv_payload(31)
+    parser = FearAndGreedCsvParser()
+    for start in range(0, len(payload), chunk_size):
+        parser.feed(payload[start : start + chunk_size])
+    history = parser.close()
+
+    assert list(history.values) == list(range(1, 32))
+    assert history.timestamps[0] == 1704067200
+    assert history.timestamps[1] - history.timestamps[0] == 86400
+    assert history.classification(0) == "Fear"
+    assert parser.stats.points == 31
+    assert parser.stats.bytes == len(payload)
+
+
+def test_csv_parser_reads_plain_csv_with_iso_dates() -> None:
+    """A bare CSV body with year-first dates and another column order should parse."""
+    parser = FearAndGreedCsvParser()
+    parser.feed(b"fng_value,fng_classification,date\n40,Fear,2024/01/02\n60,Greed,2024/01/01")
+
+    history = parser.close()
+
+    assert list(history.points()) == [(1704067200, 60, "Greed"), (1704153600, 40, "Fear")]
+
+
+def test_csv_parser_rejects_payload_without_header() -> None:
+    """A body without the CSV header is not a CSV history."""
+    parser = FearAndGreedCsvParser()
+    parser.feed(b'{"data": []}')
+
+    with pytest.raises(ValueError):
+        parser.close()
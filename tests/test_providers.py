@@ -0,0 +1,218 @@
+"""Tests for the index providers and the engine that refreshes them."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import CnnFearAndGreedApiClient, FearAndGreedIndex
+from custom_components.fear_and_greed.const import (
+    CONF_PROVIDERS,
+    DOMAIN,
+    PROVIDER_ALTERNATIVE_ME,
+    PROVIDER_CNN,
+)
+from custom_components.fear_and_greed.engine import FearAndGreedEngine
+
+# How long a request waits for the other provider's request to arrive.
+RENDEZVOUS_TIMEOUT = 5  # seconds
+
+
+class InFlight:
+    """Count the requests the local providers are answering at the same time."""
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.current = 0
+        self.peak = 0
+        self.all_arrived = asyncio.Event()
+
+    async def __aenter__(self) -> None:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        if self.current >= self.expected:
+            self.all_arrived.set()
+        # Concurrent requests meet here; a request made alone gives up after the timeout.
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.all_arrived.wait(), RENDEZVOUS_TIMEOUT)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.current -= 1
+
+
+@pytest.fixture
+def cnn_payload() -> dict[str, Any]:
+    """Provide a trimmed CNN graph data payload."""
+    return {
+        "fear_and_greed": {
+            "score": 62.8,
+            "rating": "greed",
+            "timestamp": "2024-01-02T21:00:00+00:00",
+            "previous_close": 58.3,
+        }
+    }
+
+
+@pytest_asyncio.fixture
+async def local_providers(socket_enabled, sample_api_payload, cnn_payload):
+    """Serve both providers locally; ``in_flight`` is only armed for the requests under test."""
+    in_flight: InFlight | None = None
+
+    def handler(payload: dict[str, Any]):
+        async def handle(request: web.Request) -> web.Response:
+            if in_flight is not None:
+                async with in_flight:
+                    return web.json_response(payload)
+            return web.json_response(payload)
+
+        return handle
+
+    app = web.Application()
+    app.router.add_get("/fng/", handler(sample_api_payload))
+    app.router.add_get("/cnn/", handler(cnn_payload))
+    server = TestServer(app)
+    await server.start_server()
+
+    def arm(expected: int) -> InFlight:
+        nonlocal in_flight
+        in_flight = InFlight(expected)
+        return in_flight
+
+    yield {
+        PROVIDER_ALTERNATIVE_ME: str(server.make_url("/fng/")),
+        PROVIDER_CNN: str(server.make_url("/cnn/")),
+    }, arm
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_cnn_client_parses_payload(hass: HomeAssistant, aioclient_mock, cnn_payload) -> None:
+    """The CNN client should round the score and title-case the rating."""
+    aioclient_mock.get("https://cnn.test/graphdata", json=cnn_payload)
+
+    client = CnnFearAndGreedApiClient("https://cnn.test/graphdata", async_get_clientsession(hass))
+    index = await client.async_get_index()
+
+    assert index.value == 63
+    assert index.classification == "Greed"
+    assert index.previous_value == 58
+    assert index.value_change == 5
+    assert index.last_updated == datetime.fromtimestamp(1704229200)
+    assert "Mozilla" in aioclient_mock.mock_calls[0][3]["User-Agent"]
+
+
+@pytest.mark.asyncio
+async def test_engine_refreshes_providers_concurrently(hass: HomeAssistant, local_providers) -> None:
+    """A refresh of all providers should have their requests in flight at the same time."""
+    endpoints, arm = local_providers
+    async with aiohttp.ClientSession() as session:
+        engine = FearAndGreedEngine.create(
+            hass,
+            session,
+            [PROVIDER_ALTERNATIVE_ME, PROVIDER_CNN],
+            update_interval=timedelta(hours=1),
+            max_stale_age=timedelta(hours=1),
+            endpoints=endpoints,
+        )
+        entry = MockConfigEntry(domain=DOMAIN, data={}, version=2)
+        entry.add_to_hass(hass)
+        await engine.async_setup(entry)
+
+        in_flight = arm(expected=2)
+        await engine.async_request_refresh(force=True)
+        await engine.async_shutdown()
+
+    assert engine.coordinators[PROVIDER_ALTERNATIVE_ME].data.value == 56
+    assert engine.coordinators[PROVIDER_CNN].data.value == 63
+    assert in_flight.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_each_provider_gets_a_device(hass: HomeAssistant, mock_history) -> None:
+    """Enabled providers should get their own device and sensors."""
+    entry = MockConfigEntry(domain=DOMAIN, data={}, version=2, options={CONF_PROVIDERS: [PROVIDER_CNN]})
+    entry.add_to_hass(hass)
+
+    crypto = FearAndGreedIndex(
+        value=56,
+        classification="Greed",
+        previous_value=None,
+        value_change=None,
+        value_change_percent=None,
+        last_updated=datetime(2024, 1, 1),
+    )
+    stocks = FearAndGreedIndex(
+        value=20,
+        classification="Extreme Fear",
+        previous_value=None,
+        value_change=None,
+        value_change_percent=None,
+        last_updated=datetime(2024, 1, 1),
+    )
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=crypto),
+    ), patch(
+        "custom_components.fear_and_greed.api.CnnFearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=stocks),
+    ):
+        assert await async_setup_entry(hass, entry)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.fear_and_greed_index").state == "56"
+    state = hass.states.get("sensor.fear_and_greed_cnn_index")
+    assert state.state == "20"
+    assert state.attributes["attribution"] == "Data provided by CNN"
+    assert hass.states.get("sensor.fear_and_greed_cnn_sentiment").state == "Extreme Fear"
+    registry = er.async_get(hass)
+    assert registry.async_get_entity_id("sensor", DOMAIN, "fear_and_greed_moving_average_7d") is not None
+    assert registry.async_get_entity_id("sensor", DOMAIN, "fear_and_greed_cnn_moving_average_7d") is None
+
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, PROVIDER_CNN)})
+    assert device is not None
+    assert device.manufacturer == "CNN"
+
+
+@pytest.mark.asyncio
+async def test_options_change_reloads_and_removes_unused_providers(
+    hass: HomeAssistant, enable_custom_integrations, mock_history
+) -> None:
+    """Disabling a provider in the options should reload the entry and drop its device and entities."""
+    entry = MockConfigEntry(domain=DOMAIN, data={}, version=2, options={CONF_PROVIDERS: [PROVIDER_CNN]})
+    entry.add_to_hass(hass)
+    index = FearAndGreedIndex(56, "Greed", None, None, None, datetime(2024, 1, 1))
+
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=index),
+    ), patch(
+        "custom_components.fear_and_greed.api.CnnFearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=index),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.fear_and_greed_cnn_index").state == "56"
+
+        hass.config_entries.async_update_entry(entry, options={**entry.options, CONF_PROVIDERS: []})
+        await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id]["engine"].coordinators.keys() == {PROVIDER_ALTERNATIVE_ME}
+    assert dr.async_get(hass).async_get_device(identifiers={(DOMAIN, PROVIDER_CNN)}) is None
+    assert er.async_get(hass).async_get_entity_id("sensor", DOMAIN, "fear_and_greed_cnn_index") is None
+    assert hass.states.get("sensor.fear_and_greed_cnn_index") is None
+    assert hass.states.get("sensor.fear_and_greed_index").state == "56"
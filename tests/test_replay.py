@@ -0,0 +1,106 @@
+"""Tests for the record/replay simulation mode."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import (
+    CONF_REPLAY_FILE,
+    CONF_REPLAY_SPEED,
+    DOMAIN,
+    EVENT_THRESHOLD_CROSSED,
+    PROVIDER_REPLAY,
+)
+from custom_components.fear_and_greed.replay import ReplayFearAndGreedApiClient, load_recording
+
+DAY = 86400
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+VALUES = [50, 40, 30, 20, 10, 35]
+
+
+def _recording(path: Path) -> Path:
+    data = [
+        {"value": str(value), "value_classification": "Fear", "timestamp": str(START + DAY * day)}
+        for day, value in enumerate(VALUES)
+    ]
+    path.write_text(json.dumps({"name": "Fear and Greed Index", "data": data[::-1]}))
+    return path
+
+
+def test_load_recording_reads_api_and_storage_formats(tmp_path: Path) -> None:
+    """JSON and CSV API responses and the integration's history file should load."""
+    recording = load_recording(str(_recording(tmp_path / "fng.json")))
+    assert list(recording.values) == VALUES
+
+    csv = tmp_path / "fng.csv"
+    csv.write_text("date,fng_value,fng_classification\n02-01-2024,40,Fear\n01-01-2024,50,Neutral\n")
+    assert list(load_recording(str(csv)).points()) == [(START, 50, "Neutral"), (START + DAY, 40, "Fear")]
+
+    stored = tmp_path / "fear_and_greed.history"
+    stored.write_text(json.dumps({"version": 1, "key": "fear_and_greed.history", "data": recording.as_dict()}))
+    assert list(load_recording(str(stored)).points()) == list(recording.points())
+
+
+@pytest.mark.asyncio
+async def test_client_follows_the_accelerated_clock(tmp_path: Path) -> None:
+    """The index and history should end with the day the replay clock has reached."""
+    now = 100.0
+    client = ReplayFearAndGreedApiClient(str(_recording(tmp_path / "fng.json")), seconds_per_day=2, clock=lambda: now)
+
+    first = await client.async_get_index()
+    assert (first.value, first.previous_value) == (50, None)
+
+    now += 7
+    index = await client.async_get_index()
+    assert (index.value, index.previous_value, index.value_change) == (20, 30, -10)
+    assert list((await client.async_get_history(2)).values) == [30, 20]
+    assert list((await client.async_get_history()).values) == [50, 40, 30, 20]
+
+    now += 100
+    assert (await client.async_get_index()).value == 35
+
+
+@pytest.mark.asyncio
+async def test_replay_runs_the_full_pipeline(
+    hass: HomeAssistant, hass_storage: dict[str, Any], mock_config_entry, mock_history, tmp_path: Path
+) -> None:
+    """A replay provider should feed its own sensors, history and events."""
+    live = FearAndGreedIndex(60, "Greed", None, None, None, datetime.fromtimestamp(START))
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={CONF_REPLAY_FILE: str(_recording(tmp_path / "fng.json")), CONF_REPLAY_SPEED: 60},
+    )
+    events = []
+    hass.bus.async_listen(EVENT_THRESHOLD_CROSSED, events.append)
+
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=live),
+    ):
+        assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
+
+    replay = hass.data[DOMAIN][mock_config_entry.entry_id]["engine"].coordinators[PROVIDER_REPLAY]
+    assert hass.states.get("sensor.fear_and_greed_replay_index").state == "50"
+    assert hass.states.get("sensor.fear_and_greed_index").state == "60"
+
+    # Move the replay clock four days ahead; the skipped days are fetched as a gap.
+    replay.client._started -= 4 * replay.client.seconds_per_day
+    await replay.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.fear_and_greed_replay_index").state == "10"
+    assert list(replay.history.values) == VALUES[:5]
+    assert [(event.data["provider"], event.data["threshold"]) for event in events] == [(PROVIDER_REPLAY, 25)]
+    assert "fear_and_greed.history.replay" in hass_storage
@@ -0,0 +1,77 @@
+"""Tests for the disk-backed response cache."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed.const import RESPONSE_CACHE_STORAGE_KEY, RESPONSE_CACHE_STORAGE_VERSION
+from custom_components.fear_and_greed.response_cache import CachedResponse, ResponseCache
+
+
+def _response(body: str, ttl: float = 60) -> CachedResponse:
+    now = time.time()
+    return CachedResponse(body=body, fetched_at=now, expires_at=now + ttl, etag=f'"{body}"')
+
+
+def test_key_ignores_parameter_order() -> None:
+    """Requests with the same parameters share an entry."""
+    assert ResponseCache.key("https://x/", {"limit": 2, "format": "json"}) == ResponseCache.key(
+        "https://x/", {"format": "json", "limit": 2}
+    )
+    assert ResponseCache.key("https://x/", None) == "https://x/"
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(hass: HomeAssistant) -> None:
+    """Over the limit, the entry used longest ago is dropped."""
+    cache = ResponseCache(hass, max_entries=2)
+    cache.set("a", _response("a"))
+    cache.set("b", _response("b"))
+    assert cache.get_fresh("a") is not None
+
+    cache.set("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_only_serves_fresh_entries(hass: HomeAssistant) -> None:
+    """Expired entries are kept for revalidation but not served as fresh."""
+    cache = ResponseCache(hass)
+    cache.set("a", _response("a", ttl=-1))
+
+    assert cache.get_fresh("a") is None
+    assert cache.get("a").validators() == {"If-None-Match": '"a"'}
+
+    cache.revalidate("a", time.time() + 60)
+    assert cache.get_fresh("a").body == "a"
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_saved_entries(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Entries saved before a restart are loaded in their usage order."""
+    hass_storage[RESPONSE_CACHE_STORAGE_KEY] = {
+        "version": RESPONSE_CACHE_STORAGE_VERSION,
+        "key": RESPONSE_CACHE_STORAGE_KEY,
+        "data": {
+            "entries": [
+                ["a", {"body": "a", "fetched_at": 1.0, "expires_at": 2.0, "etag": None, "last_modified": "x"}],
+                ["b", {"unknown": True}],
+            ]
+        },
+    }
+    cache = ResponseCache(hass)
+    await cache.async_load()
+
+    assert cache.get("a").last_modified == "x"
+    assert cache.get("b") is None
+    assert cache._data_to_save() == {
+        "entries": [["a", {"body": "a", "fetched_at": 1.0, "expires_at": 2.0, "etag": None, "last_modified": "x"}]]
+    }
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -22,7 +23,9 @@ from custom_components.fear_and_greed.const import (
 
 
 @pytest.mark.asyncio
-async def test_sensors_create_entities(hass: HomeAssistant, mock_config_entry, sample_api_payload) -> None:
+async def test_sensors_create_entities(
+    hass: HomeAssistant, mock_config_entry, mock_history, sample_api_payload
+) -> None:
     """Ensure that the sensors are created with correct state and attributes."""
     index = FearAndGreedIndex(
         value=int(sample_api_payload["data"][0]["value"]),
@@ -40,8 +43,7 @@ async def test_sensors_create_entities(hass: HomeAssistant, mock_config_entry, s
         AsyncMock(return_value=index),
     ):
         assert await async_setup_entry(hass, mock_config_entry)
-
-    await hass.async_block_till_done()
+        await hass.async_block_till_done()
 
     index_entity_id = "sensor.fear_and_greed_index"
     sentiment_entity_id = "sensor.fear_and_greed_sentiment"
@@ -61,9 +63,13 @@ async def test_sensors_create_entities(hass: HomeAssistant, mock_config_entry, s
     assert sentiment_state.state == "Greed"
     assert sentiment_state.attributes["icon"] == "mdi:emoticon-excited-outline"
 
+    level_state = hass.states.get("sensor.fear_and_greed_sentiment_level")
+    assert level_state.state == "3"
+    assert level_state.attributes["icon"] == "mdi:emoticon-excited-outline"
+
 
 @pytest.mark.asyncio
-async def test_manual_refresh_service(hass: HomeAssistant, mock_config_entry) -> None:
+async def test_manual_refresh_service(hass: HomeAssistant, mock_config_entry, mock_history) -> None:
     """The manual refresh service should request a new update."""
     index_first = FearAndGreedIndex(
         value=50,
@@ -89,15 +95,54 @@ async def test_manual_refresh_service(hass: HomeAssistant, mock_config_entry) ->
     mock_config_entry.add_to_hass(hass)
     with patch(client_patch, mock):
         assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
 
-    await hass.async_block_till_done()
-
-    state = hass.states.get("sensor.fear_and_greed_index")
-    assert state.state == "50"
+        state = hass.states.get("sensor.fear_and_greed_index")
+        assert state.state == "50"
 
-    await hass.services.async_call(DOMAIN, "refresh", blocking=True)
-    await hass.async_block_till_done()
+        await hass.services.async_call(DOMAIN, "refresh", {"force": True}, blocking=True)
+        await hass.async_block_till_done()
 
     state = hass.states.get("sensor.fear_and_greed_index")
     assert state.state == "65"
     assert mock.call_count == 2
+    assert mock.call_args.kwargs == {"force": True}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_index_does_not_write_state(
+    hass: HomeAssistant, mock_config_entry, mock_history
+) -> None:
+    """Sensors should only write their state when what they show has changed."""
+    index = FearAndGreedIndex(
+        value=50,
+        classification="Neutral",
+        previous_value=45,
+        value_change=5,
+        value_change_percent=11.11,
+        last_updated=datetime(2024, 1, 1),
+        fetched_at=datetime.now(timezone.utc),
+    )
+    same_reading = replace(index, fetched_at=datetime.now(timezone.utc), time_until_update=3600)
+    new_value = replace(index, value=52, value_change=7)
+
+    mock = AsyncMock(side_effect=[index, same_reading, new_value])
+    mock_config_entry.add_to_hass(hass)
+    with patch("custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index", mock):
+        assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+
+        index_state = hass.states.get("sensor.fear_and_greed_index")
+        sentiment_state = hass.states.get("sensor.fear_and_greed_sentiment")
+
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert same_reading == index
+        assert hass.states.get("sensor.fear_and_greed_index").last_updated == index_state.last_updated
+
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.fear_and_greed_index").state == "52"
+    assert hass.states.get("sensor.fear_and_greed_sentiment").last_updated == sentiment_state.last_updated
@@ -0,0 +1,82 @@
+"""Tests for the downsampled sparkline attribute."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import (
+    ATTR_SPARKLINE,
+    DEFAULT_SPARKLINE_POINTS,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+)
+from custom_components.fear_and_greed.history import FearAndGreedHistory
+from custom_components.fear_and_greed.sensor import FearAndGreedIndexSensor
+from custom_components.fear_and_greed.sparkline import lttb, sparkline
+
+DAY = 86400
+START = int(datetime(2022, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def test_lttb_keeps_ends_and_extremes() -> None:
+    """Downsampling should keep the first and last points and a lone spike."""
+    timestamps = list(range(1000))
+    values = [50] * 1000
+    values[500] = 100
+
+    sampled = lttb(timestamps, values, 20)
+
+    assert len(sampled) == 20
+    assert sampled[0] == (0, 50)
+    assert sampled[-1] == (999, 50)
+    assert (500, 100) in sampled
+    assert lttb(timestamps[:10], values[:10], 20) == list(zip(timestamps[:10], values[:10]))
+
+
+def test_sparkline_covers_recent_window() -> None:
+    """Only the configured number of recent days should be sampled."""
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, day % 100, "Neutral") for day in range(1000))
+
+    series = sparkline(history, 365, 30)
+
+    assert len(series) == 30
+    assert series[0][0] == START + DAY * (999 - 365)
+    assert series[-1][0] == START + DAY * 999
+    assert sparkline(history, 365, 0) == ()
+
+
+@pytest.mark.asyncio
+async def test_index_sensor_exposes_unrecorded_sparkline(
+    hass: HomeAssistant, hass_storage: dict[str, Any], mock_config_entry, mock_history
+) -> None:
+    """The index sensor should carry the sparkline without recording it."""
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, day % 100, "Neutral") for day in range(500))
+    hass_storage[HISTORY_STORAGE_KEY] = {
+        "version": HISTORY_STORAGE_VERSION,
+        "key": HISTORY_STORAGE_KEY,
+        "data": history.as_dict(),
+    }
+    index = FearAndGreedIndex(99, "Neutral", None, None, None, datetime.fromtimestamp(START + DAY * 499))
+
+    mock_config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=index),
+    ):
+        assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.fear_and_greed_index")
+    assert len(state.attributes[ATTR_SPARKLINE]) == DEFAULT_SPARKLINE_POINTS
+    assert list(state.attributes[ATTR_SPARKLINE][-1]) == [START + DAY * 499, 99]
+    assert ATTR_SPARKLINE in FearAndGreedIndexSensor._unrecorded_attributes
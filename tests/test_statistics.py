@@ -0,0 +1,57 @@
+"""Tests for the long-term statistics import."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed.const import STATISTIC_ID
+from custom_components.fear_and_greed.history import FearAndGreedHistory
+from custom_components.fear_and_greed.statistics import FearAndGreedStatisticsImporter
+
+DAY = 86400
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def _history(days: int) -> FearAndGreedHistory:
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, day % 101, "Neutral") for day in range(days))
+    return history
+
+
+async def _imported_means(hass: HomeAssistant) -> list[float]:
+    stats = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime.fromtimestamp(START, tz=timezone.utc),
+        None,
+        {STATISTIC_ID},
+        "hour",
+        None,
+        {"mean"},
+    )
+    return [row["mean"] for row in stats.get(STATISTIC_ID, [])]
+
+
+@pytest.mark.asyncio
+async def test_import_is_batched_and_resumable(recorder_mock, hass: HomeAssistant) -> None:
+    """The history should be imported in batches and only new points added later."""
+    history = _history(12)
+    importer = FearAndGreedStatisticsImporter(hass)
+
+    with patch("custom_components.fear_and_greed.statistics.STATISTICS_IMPORT_BATCH_SIZE", 5):
+        assert await importer.async_import(history) == 12
+        assert importer.last_imported == START + DAY * 11
+
+        history.merge([(START + DAY * 12, 77, "Greed")])
+        assert await importer.async_import(history) == 1
+
+    means = await _imported_means(hass)
+    assert len(means) == 13
+    assert means[-1] == 77
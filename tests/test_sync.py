@@ -0,0 +1,106 @@
+"""Tests for the gap-aware history sync."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed.api import FearAndGreedApiClientError, FearAndGreedIndex
+from custom_components.fear_and_greed.coordinator import FearAndGreedDataUpdateCoordinator
+from custom_components.fear_and_greed.history import FearAndGreedHistory, FearAndGreedHistoryStore
+from custom_components.fear_and_greed.sync import SyncPlan, find_gaps, plan_sync
+
+DAY = 86400
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def _history(days) -> FearAndGreedHistory:
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, day % 100, "Neutral") for day in days)
+    return history
+
+
+def _index(day: int) -> FearAndGreedIndex:
+    return FearAndGreedIndex(
+        value=day % 100,
+        classification="Neutral",
+        previous_value=None,
+        value_change=None,
+        value_change_percent=None,
+        last_updated=datetime.fromtimestamp(START + DAY * day),
+    )
+
+
+def test_plan_requests_only_missing_days() -> None:
+    """The plan should cover the gap plus one overlapping day."""
+    history = _history(range(10))
+
+    assert plan_sync(FearAndGreedHistory(), START) == SyncPlan(0)
+    assert plan_sync(history, START + DAY * 9) is None
+    assert plan_sync(history, START + DAY * 10) is None
+    assert plan_sync(history, START + DAY * 16) == SyncPlan(8, START + DAY * 9)
+    assert plan_sync(history, START + DAY * 16, max_gap_days=5) == SyncPlan(0, START + DAY * 9)
+
+
+def test_find_gaps_reports_missing_days() -> None:
+    """Consecutive points more than a day apart should be reported from ``since`` on."""
+    history = _history([0, 1, 2, 5, 6, 9])
+
+    assert find_gaps(history) == [(START + DAY * 2, START + DAY * 5), (START + DAY * 6, START + DAY * 9)]
+    assert find_gaps(history, START + DAY * 5) == [(START + DAY * 6, START + DAY * 9)]
+    assert find_gaps(_history(range(5))) == []
+
+
+def _coordinator(hass: HomeAssistant, stored: FearAndGreedHistory, client: MagicMock):
+    coordinator = FearAndGreedDataUpdateCoordinator(hass, client, timedelta(hours=1), FearAndGreedHistoryStore(hass))
+    coordinator.history_store.history = stored
+    coordinator.history_store.loaded = True
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_only_the_gap(hass: HomeAssistant) -> None:
+    """After an outage only the missed days should be requested and merged."""
+    client = MagicMock()
+    client.async_get_index = AsyncMock(return_value=_index(16))
+    client.async_get_history = AsyncMock(return_value=_history(range(9, 17)))
+    coordinator = _coordinator(hass, _history(range(10)), client)
+
+    await coordinator.async_refresh()
+
+    client.async_get_history.assert_awaited_once_with(8)
+    assert list(coordinator.history.timestamps) == [START + DAY * day for day in range(17)]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backfills_when_gap_remains(hass: HomeAssistant) -> None:
+    """A gap left after the incremental request should trigger a full backfill."""
+    client = MagicMock()
+    client.async_get_index = AsyncMock(return_value=_index(16))
+    client.async_get_history = AsyncMock(side_effect=[_history([15, 16]), _history(range(17))])
+    coordinator = _coordinator(hass, _history(range(10)), client)
+
+    await coordinator.async_refresh()
+
+    assert [call.args for call in client.async_get_history.await_args_list] == [(8,), (0,)]
+    assert find_gaps(coordinator.history) == []
+
+
+@pytest.mark.asyncio
+async def test_coordinator_retries_gap_after_failure(hass: HomeAssistant) -> None:
+    """A failed sync should leave the gap in place so the next refresh fills it."""
+    client = MagicMock()
+    client.async_get_index = AsyncMock(return_value=_index(16))
+    client.async_get_history = AsyncMock(side_effect=[FearAndGreedApiClientError("boom"), _history(range(9, 17))])
+    coordinator = _coordinator(hass, _history(range(10)), client)
+
+    await coordinator.async_refresh()
+    assert coordinator.history.newest_timestamp == START + DAY * 9
+
+    await coordinator.async_refresh()
+    assert [call.args for call in client.async_get_history.await_args_list] == [(8,), (8,)]
+    assert len(coordinator.history) == 17
@@ -0,0 +1,144 @@
+"""Tests for threshold crossing and classification change events."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import (
+    DOMAIN,
+    EVENT_CLASSIFICATION_CHANGED,
+    EVENT_THRESHOLD_CROSSED,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    SERVICE_REPLAY_EVENTS,
+)
+from custom_components.fear_and_greed.coordinator import FearAndGreedDataUpdateCoordinator
+from custom_components.fear_and_greed.history import FearAndGreedHistory
+from custom_components.fear_and_greed.thresholds import ThresholdTracker, replay
+
+DAY = 86400
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _crossings(tracker: ThresholdTracker, values: list[int]) -> list[tuple[int, str]]:
+    crossings = []
+    for value in values:
+        for event_type, data in tracker.update(value, "Neutral", NOW):
+            if event_type == EVENT_THRESHOLD_CROSSED:
+                crossings.append((data["threshold"], data["direction"]))
+    return crossings
+
+
+def test_hysteresis_suppresses_wobble() -> None:
+    """Values moving inside the hysteresis band should not produce crossings."""
+    tracker = ThresholdTracker([25], hysteresis=2)
+
+    assert _crossings(tracker, [30, 24, 26, 23, 27, 22]) == [(25, "down")]
+    assert _crossings(tracker, [26, 27, 28]) == [(25, "up")]
+
+
+def test_jump_crosses_several_thresholds() -> None:
+    """A large move should report every threshold it passes, and the first value none."""
+    tracker = ThresholdTracker([75, 25], hysteresis=0)
+
+    assert _crossings(tracker, [10, 80]) == [(25, "up"), (75, "up")]
+
+
+def test_classification_changes() -> None:
+    """Only a different classification should produce a change event."""
+    tracker = ThresholdTracker([], hysteresis=0)
+    tracker.seed(50, "Neutral")
+
+    assert tracker.update(52, "Neutral", NOW) == []
+    [(event_type, data)] = tracker.update(60, "Greed", NOW)
+    assert event_type == EVENT_CLASSIFICATION_CHANGED
+    assert data["previous_classification"] == "Neutral"
+    assert data["classification"] == "Greed"
+
+
+def test_replay_over_history() -> None:
+    """Replaying a time range should only consider the points inside it."""
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, value, "Neutral") for day, value in enumerate([50, 20, 50, 20, 50]))
+
+    events = list(replay(history, [25], 2, START + DAY, START + DAY * 3))
+
+    assert [data["direction"] for _, data in events] == ["up", "down"]
+    assert events[0][1]["timestamp"] == datetime.fromtimestamp(START + DAY * 2, tz=timezone.utc).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fires_events_on_transitions(hass: HomeAssistant) -> None:
+    """The coordinator should fire bus events only when a new value crosses a threshold."""
+    crossed = async_capture_events(hass, EVENT_THRESHOLD_CROSSED)
+    changed = async_capture_events(hass, EVENT_CLASSIFICATION_CHANGED)
+    client = MagicMock()
+    client.async_get_index = AsyncMock()
+    client.async_get_index.side_effect = [
+        FearAndGreedIndex(50, "Neutral", None, None, None, datetime(2024, 1, 1)),
+        FearAndGreedIndex(50, "Neutral", None, None, None, datetime(2024, 1, 1)),
+        FearAndGreedIndex(20, "Extreme Fear", 50, -30, -60.0, datetime(2024, 1, 2)),
+    ]
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, client, timedelta(hours=1), None, thresholds=[25, 75], hysteresis=2
+    )
+
+    for _ in range(3):
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [event.data["direction"] for event in crossed] == ["down"]
+    assert crossed[0].data["threshold"] == 25
+    assert crossed[0].data["provider"] == "alternative_me"
+    assert [event.data["classification"] for event in changed] == ["Extreme Fear"]
+
+
+@pytest.mark.asyncio
+async def test_replay_events_service(
+    hass: HomeAssistant, hass_storage: dict[str, Any], mock_config_entry, mock_history
+) -> None:
+    """The service should return replayed events and fire them on request."""
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, value, "Neutral") for day, value in enumerate([50, 20, 50, 90]))
+    hass_storage[HISTORY_STORAGE_KEY] = {
+        "version": HISTORY_STORAGE_VERSION,
+        "key": HISTORY_STORAGE_KEY,
+        "data": history.as_dict(),
+    }
+    index = FearAndGreedIndex(90, "Neutral", None, None, None, datetime.fromtimestamp(START + DAY * 3))
+    crossed = async_capture_events(hass, EVENT_THRESHOLD_CROSSED)
+
+    mock_config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=index),
+    ):
+        assert await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
+
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_REPLAY_EVENTS,
+            {"start": "2024-01-01 00:00:00+00:00", "fire_events": True},
+            blocking=True,
+            return_response=True,
+        )
+        await hass.async_block_till_done()
+
+    assert [(event["threshold"], event["direction"]) for event in response["events"]] == [
+        (25, "down"),
+        (25, "up"),
+        (75, "up"),
+    ]
+    assert len(crossed) == 3
+    assert all(event.data["replayed"] for event in crossed)
@@ -0,0 +1,126 @@
+"""Tests for the websocket commands."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fear_and_greed import async_setup_entry
+from custom_components.fear_and_greed.api import FearAndGreedIndex
+from custom_components.fear_and_greed.const import DOMAIN, HISTORY_STORAGE_KEY, HISTORY_STORAGE_VERSION
+from custom_components.fear_and_greed.coordinator import FearAndGreedDataUpdateCoordinator
+from custom_components.fear_and_greed.history import FearAndGreedHistory, FearAndGreedHistoryStore
+from custom_components.fear_and_greed.websocket_api import websocket_history, websocket_subscribe
+
+DAY = 86400
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def _store_history(hass_storage: dict[str, Any]) -> None:
+    history = FearAndGreedHistory()
+    history.merge((START + DAY * day, day % 100, "Neutral") for day in range(100))
+    hass_storage[HISTORY_STORAGE_KEY] = {
+        "version": HISTORY_STORAGE_VERSION,
+        "key": HISTORY_STORAGE_KEY,
+        "data": history.as_dict(),
+    }
+
+
+async def _setup(hass: HomeAssistant, hass_storage: dict[str, Any], entry) -> FearAndGreedIndex:
+    _store_history(hass_storage)
+    index = FearAndGreedIndex(99, "Neutral", None, None, None, datetime.fromtimestamp(START + DAY * 99))
+
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=index),
+    ):
+        assert await async_setup_entry(hass, entry)
+        await hass.async_block_till_done()
+    return index
+
+
+@pytest.mark.asyncio
+async def test_history_command(hass: HomeAssistant, hass_storage, mock_config_entry, mock_history) -> None:
+    """The history command should return a downsampled range from memory."""
+    await _setup(hass, hass_storage, mock_config_entry)
+    connection = MagicMock()
+
+    websocket_history(
+        hass,
+        connection,
+        {
+            "id": 1,
+            "type": "fear_and_greed/history",
+            "start": datetime.fromtimestamp(START + DAY * 10, tz=timezone.utc),
+            "end": datetime.fromtimestamp(START + DAY * 59, tz=timezone.utc),
+            "points": 10,
+        },
+    )
+    await hass.async_block_till_done()
+
+    msg_id, result = connection.send_result.call_args.args
+    assert msg_id == 1
+    points = result["points"]
+    assert len(points) == 10
+    assert points[0] == (START + DAY * 10, 10)
+    assert points[-1] == (START + DAY * 59, 59)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_pushes_new_points(
+    hass: HomeAssistant, hass_storage, mock_config_entry, mock_history
+) -> None:
+    """Subscribers should only receive points added after they subscribed."""
+    index = await _setup(hass, hass_storage, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    connection = MagicMock()
+    connection.subscriptions = {}
+
+    websocket_subscribe(hass, connection, {"id": 1, "type": "fear_and_greed/subscribe"})
+    await hass.async_block_till_done()
+    connection.send_result.assert_called_once_with(1)
+
+    new_index = replace(index, value=42, last_updated=datetime.fromtimestamp(START + DAY * 100))
+    with patch(
+        "custom_components.fear_and_greed.api.FearAndGreedApiClient.async_get_index",
+        AsyncMock(return_value=new_index),
+    ):
+        await coordinator.async_refresh()
+
+    [message] = [call.args[0] for call in connection.send_message.call_args_list]
+    assert message["id"] == 1
+    assert message["event"] == {"points": [[START + DAY * 100, 42, "Neutral"]]}
+
+    connection.subscriptions[1]()
+    await coordinator.async_refresh()
+    assert connection.send_message.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_commands_read_the_stored_history_before_the_first_sync(
+    hass: HomeAssistant, hass_storage, mock_config_entry
+) -> None:
+    """The commands should answer from disk before the coordinator has synced its history."""
+    _store_history(hass_storage)
+    coordinator = FearAndGreedDataUpdateCoordinator(
+        hass, MagicMock(), timedelta(hours=1), FearAndGreedHistoryStore(hass)
+    )
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: {"coordinator": coordinator}}
+    connection = MagicMock()
+    connection.subscriptions = {}
+
+    websocket_history(hass, connection, {"id": 1, "type": "fear_and_greed/history"})
+    websocket_subscribe(hass, connection, {"id": 2, "type": "fear_and_greed/subscribe"})
+    await hass.async_block_till_done()
+
+    history_call, subscribe_call = connection.send_result.call_args_list
+    assert len(history_call.args[1]["points"]) == 100
+    assert subscribe_call.args == (2,)
+    connection.subscriptions[2]()